@@ -0,0 +1,5 @@
+"""
+nurexia 성능 벤치마크 모음.
+CLI 시작 시간, 워크플로우 호출 오버헤드, 메시지 변환 비용, 스트리밍 처리량과
+동시 요청 확장성을 측정하여 JSON으로 출력합니다 (python -m benchmarks).
+"""
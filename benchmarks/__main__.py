@@ -0,0 +1,62 @@
+"""
+벤치마크 실행 진입점
+
+    python -m benchmarks                          # 전체 실행, JSON을 표준 출력으로
+    python -m benchmarks --quick -o result.json   # 빠른 실행, 파일로 저장
+    python -m benchmarks --baseline base.json     # 기준 대비 회귀가 있으면 종료 코드 1
+"""
+
+from typing import Any, Dict
+import argparse
+import importlib
+import json
+import sys
+import time
+
+from .harness import compare, environment
+
+# 벤치마크 이름 -> 모듈 (각 모듈은 run(quick) -> 결과 딕셔너리 제공)
+SUITES = {
+    "startup": "bench_startup",
+    "workflow": "bench_workflow",
+    "streaming": "bench_streaming",
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run nurexia benchmarks and emit JSON")
+    parser.add_argument("--only", action="append", choices=sorted(SUITES), help="Run only this suite (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations (for smoke runs)")
+    parser.add_argument("-o", "--output", default="-", help="Result JSON file (default: stdout)")
+    parser.add_argument("--baseline", type=argparse.FileType("r"), help="Compare medians against a previous result JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown ratio before a regression (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Any] = {"environment": environment(), "quick": args.quick, "benchmarks": {}}
+    for name in args.only or SUITES:
+        module = importlib.import_module(f".{SUITES[name]}", __package__)
+        started = time.perf_counter()
+        report["benchmarks"][name] = module.run(quick=args.quick)
+        print(f"{name}: {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    regressions = []
+    if args.baseline:
+        baseline = json.load(args.baseline)
+        regressions = compare(report["benchmarks"], baseline.get("benchmarks", {}), args.tolerance)
+        report["baseline"] = {"commit": baseline.get("environment", {}).get("commit"),
+                              "tolerance": args.tolerance, "regressions": regressions}
+        for item in regressions:
+            print(f"REGRESSION {item['name']}: {item['baseline']} -> {item['current']} {item['unit']} "
+                  f"({item['change']:+.0%})", file=sys.stderr)
+
+    encoded = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output == "-":
+        print(encoded)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(encoded + "\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
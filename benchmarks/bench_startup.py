@@ -0,0 +1,59 @@
+"""
+CLI 시작 시간 벤치마크
+매번 새 인터프리터에서 nurexia.cli를 import하여 콜드 import 시간과
+그 과정에서 로드되는 모듈(특히 Provider SDK)을 측정합니다.
+"""
+
+from typing import Any, Dict
+import json
+import subprocess
+import sys
+import time
+
+from .harness import summarize
+
+# 지연 로딩되어야 하는 Provider SDK 모듈 (시작 시 import되면 회귀)
+PROVIDER_SDKS = (
+    "anthropic", "openai", "google.generativeai", "huggingface_hub",
+    "langchain_anthropic", "langchain_openai", "langchain_google_genai",
+    "langchain_huggingface", "langchain_ollama", "langchain_community",
+)
+
+# 자식 인터프리터에서 실행하는 측정 코드
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import nurexia.cli
+elapsed = (time.perf_counter() - started) * 1000
+sdks = [name for name in {sdks!r} if name in sys.modules]
+print(json.dumps({{"import_ms": elapsed, "modules": len(sys.modules), "sdks": sdks}}))
+"""
+
+
+def _probe() -> Dict[str, Any]:
+    """새 인터프리터에서 nurexia.cli import 측정 (프로세스 전체 시간 포함)"""
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", _PROBE.format(sdks=PROVIDER_SDKS)],
+                            capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def run(quick: bool = False) -> Dict[str, Any]:
+    """
+    콜드 import 벤치마크 실행
+
+    Args:
+        quick: 반복 횟수를 줄여 빠르게 실행
+
+    Returns:
+        {"cold_import": 요약, "process": 요약}
+    """
+    _probe()  # 파일 시스템/바이트코드 캐시 준비
+    probes = [_probe() for _ in range(3 if quick else 10)]
+    return {
+        "cold_import": summarize([p["import_ms"] for p in probes], "ms",
+                                 modules=probes[-1]["modules"], provider_sdks=probes[-1]["sdks"]),
+        "process": summarize([p["process_ms"] for p in probes], "ms"),
+    }
@@ -0,0 +1,101 @@
+"""
+스트리밍/동시성 벤치마크
+Mock Provider로 execute_streaming의 첫 토큰 시간(TTFT)과 청크 처리량,
+동시 요청 수에 따른 워크플로우 처리량 변화를 측정합니다.
+"""
+
+from contextlib import redirect_stdout
+from typing import Any, Dict, List
+import asyncio
+import os
+import time
+
+from nurexia.config import config_manager
+from nurexia.graph.workflow import create_workflow
+from nurexia.utils.streaming import execute_streaming
+
+from .bench_workflow import make_state
+from .harness import summarize
+
+# 동시성 측정에서 요청마다 흉내 내는 Provider 지연 시간(초)
+SCALING_LATENCY = 0.05
+
+
+async def _stream_once(tokens: int) -> Dict[str, float]:
+    """lorem 응답 하나를 스트리밍하고 (TTFT, 전체 시간, 청크 수) 반환"""
+    state = make_state()
+    state.model = "lorem"
+    state.options["response_tokens"] = tokens
+    started = time.perf_counter()
+    await execute_streaming(state)
+    elapsed = (time.perf_counter() - started) * 1000
+    if state.error:
+        raise RuntimeError(state.error)
+    record = state.metadata["metrics"][-1]
+    return {"ttft": record["first_token_ms"], "total": elapsed, "chunks": len(state.result.split())}
+
+
+async def _bench_streaming(tokens: int, repeat: int) -> Dict[str, Any]:
+    """execute_streaming의 TTFT와 청크 처리량 (출력은 /dev/null로 버림)"""
+    runs: List[Dict[str, float]] = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        await _stream_once(tokens)
+        for _ in range(repeat):
+            runs.append(await _stream_once(tokens))
+    return {
+        "ttft": summarize([r["ttft"] for r in runs], "ms"),
+        "total": summarize([r["total"] for r in runs], "ms", tokens=tokens),
+        "throughput": summarize([r["chunks"] / (r["total"] / 1000) for r in runs], "chunks/s"),
+    }
+
+
+async def _bench_scaling(levels, repeat: int) -> Dict[str, Any]:
+    """동시 요청 수별 전체 소요 시간과 처리량 (이상적인 전체 시간은 SCALING_LATENCY)"""
+    workflow = create_workflow()
+
+    async def invoke(state):
+        result = await workflow.ainvoke(state)
+        if result.error:
+            raise RuntimeError(result.error)
+
+    def batch(size):
+        states = []
+        for i in range(size):
+            state = make_state(prompt=f"request {i}")
+            state.options["latency"] = SCALING_LATENCY
+            states.append(state)
+        return states
+
+    await invoke(batch(1)[0])
+    results = {}
+    for level in levels:
+        walls = []
+        for _ in range(repeat):
+            states = batch(level)
+            started = time.perf_counter()
+            await asyncio.gather(*(invoke(state) for state in states))
+            walls.append(time.perf_counter() - started)
+        results[str(level)] = {
+            "wall": summarize([w * 1000 for w in walls], "ms"),
+            "throughput": summarize([level / w for w in walls], "req/s"),
+            "efficiency": summarize([SCALING_LATENCY / w for w in walls], "ratio"),
+        }
+    return results
+
+
+def run(quick: bool = False) -> Dict[str, Any]:
+    """
+    스트리밍/동시성 벤치마크 실행
+
+    Args:
+        quick: 반복 횟수와 동시성 단계를 줄여 빠르게 실행
+
+    Returns:
+        {"streaming": ..., "scaling": {동시 요청 수: ...}, "max_in_flight": 스케줄러 동시 실행 한도}
+    """
+    levels = (1, 8, 32) if quick else (1, 4, 16, 64, 256)
+    return {
+        "streaming": asyncio.run(_bench_streaming(256 if quick else 1024, 5 if quick else 20)),
+        "scaling": asyncio.run(_bench_scaling(levels, 2 if quick else 5)),
+        "max_in_flight": config_manager.get_scheduler_config("mock")["max_in_flight"],
+    }
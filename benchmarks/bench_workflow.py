@@ -0,0 +1,90 @@
+"""
+워크플로우 오버헤드 벤치마크
+Mock Provider(지연 0)로 GraphState 생성과 create_workflow().ainvoke 호출당 비용,
+대화 이력 길이에 따른 메시지 변환/컨텍스트 정리 비용을 측정합니다.
+"""
+
+from typing import Any, Dict
+import asyncio
+
+from nurexia.graph.state import GraphState, MessageRole
+from nurexia.graph.workflow import create_workflow
+from nurexia.providers.base import convert_messages, to_langchain_message
+
+from .harness import summarize, time_async, time_sync
+
+# 지연과 토큰 대기가 없는 Mock Provider 옵션 (측정값이 곧 nurexia 오버헤드)
+MOCK_OPTIONS = {"temperature": 0.7, "verbose": False, "cache": False, "latency": 0, "token_rate": 0}
+
+# 이력 메시지 하나의 내용 (약 50토큰)
+_MESSAGE_TEXT = "The quick brown fox jumps over the lazy dog. " * 4
+
+
+def make_state(history: int = 0, prompt: str = "hello") -> GraphState:
+    """
+    Mock Provider용 GraphState 생성
+
+    Args:
+        history: 미리 채울 이력 메시지 수 (user/assistant 번갈아)
+        prompt: 마지막 사용자 메시지
+
+    Returns:
+        GraphState 인스턴스
+    """
+    state = GraphState(provider="mock", model="echo", mode="chat", options=dict(MOCK_OPTIONS))
+    for i in range(history):
+        role = MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT
+        state.add_message(role, f"{i} {_MESSAGE_TEXT}")
+    state.add_message(MessageRole.USER, prompt)
+    return state
+
+
+async def _bench_ainvoke(repeat: int) -> Dict[str, Any]:
+    """create_workflow().ainvoke 호출당 오버헤드"""
+    workflow = create_workflow()
+
+    async def invoke(state):
+        result = await workflow.ainvoke(state)
+        if result.error:
+            raise RuntimeError(result.error)
+
+    samples = await time_async(invoke, repeat, warmup=5, setup=make_state)
+    return summarize(samples, "ms")
+
+
+def _bench_conversion(lengths, repeat: int) -> Dict[str, Any]:
+    """이력 길이별 메시지 변환(최초/재사용)과 컨텍스트 정리 비용"""
+    results = {}
+    for length in lengths:
+        cold = time_sync(lambda state: convert_messages(state.messages, "langchain", to_langchain_message),
+                         repeat, setup=lambda: make_state(length))
+        warm_state = make_state(length)
+        convert_messages(warm_state.messages, "langchain", to_langchain_message)
+        warm = time_sync(lambda _: convert_messages(warm_state.messages, "langchain", to_langchain_message), repeat)
+        context = time_sync(lambda _: warm_state.get_context_messages(), repeat)
+        results[str(length)] = {
+            "convert_cold": summarize(cold, "ms"),
+            "convert_warm": summarize(warm, "ms"),
+            "context": summarize(context, "ms"),
+        }
+    return results
+
+
+def run(quick: bool = False) -> Dict[str, Any]:
+    """
+    워크플로우 벤치마크 실행
+
+    Args:
+        quick: 반복 횟수와 이력 길이를 줄여 빠르게 실행
+
+    Returns:
+        {"state_construction", "create_workflow", "ainvoke", "conversion": {이력 길이: ...}}
+    """
+    repeat = 50 if quick else 300
+    return {
+        "state_construction": summarize(time_sync(lambda _: make_state(), repeat * 4), "ms"),
+        "create_workflow": summarize(time_sync(lambda _: create_workflow(), repeat), "ms"),
+        "ainvoke": asyncio.run(_bench_ainvoke(repeat)),
+        "conversion": _bench_conversion((10, 100, 1000) if quick else (10, 100, 1000, 5000),
+                                        10 if quick else 30),
+    }
@@ -0,0 +1,168 @@
+"""
+벤치마크 측정 도구
+반복 측정, 통계 요약, 실행 환경 기록, 기준 결과와의 비교 기능을 제공합니다.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# 측정값 단위별 방향 (기본: 작을수록 좋음)
+HIGHER_IS_BETTER_UNITS = {"chunks/s", "req/s", "ratio"}
+
+
+def summarize(samples: List[float], unit: str = "ms", **extra) -> Dict[str, Any]:
+    """
+    측정값 목록을 통계로 요약
+
+    Args:
+        samples: 측정값 목록
+        unit: 측정 단위
+        **extra: 결과에 함께 기록할 값
+
+    Returns:
+        {"unit", "samples", "median", "mean", "min", "max", "p95", "stdev", ...}
+    """
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "unit": unit,
+        "samples": len(ordered),
+        "median": round(statistics.median(ordered), 4),
+        "mean": round(statistics.fmean(ordered), 4),
+        "min": round(ordered[0], 4),
+        "max": round(ordered[-1], 4),
+        "p95": round(p95, 4),
+        "stdev": round(statistics.stdev(ordered), 4) if len(ordered) > 1 else 0.0,
+        **extra,
+    }
+
+
+def time_sync(fn: Callable[[Any], Any], repeat: int, warmup: int = 1,
+              setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """
+    동기 함수 반복 측정 (밀리초)
+
+    Args:
+        fn: 측정할 함수 (setup 결과를 인자로 받음)
+        repeat: 측정 횟수
+        warmup: 측정 전에 버리는 실행 횟수
+        setup: 매 실행 전에 호출하여 fn의 인자를 만드는 함수 (측정에서 제외)
+
+    Returns:
+        실행별 소요 시간 목록
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        arg = setup() if setup else None
+        started = time.perf_counter()
+        fn(arg)
+        elapsed = (time.perf_counter() - started) * 1000
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+async def time_async(fn: Callable[[Any], Awaitable[Any]], repeat: int, warmup: int = 1,
+                     setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """
+    코루틴 함수 반복 측정 (밀리초)
+
+    Args:
+        fn: 측정할 코루틴 함수 (setup 결과를 인자로 받음)
+        repeat: 측정 횟수
+        warmup: 측정 전에 버리는 실행 횟수
+        setup: 매 실행 전에 호출하여 fn의 인자를 만드는 함수 (측정에서 제외)
+
+    Returns:
+        실행별 소요 시간 목록
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        arg = setup() if setup else None
+        started = time.perf_counter()
+        await fn(arg)
+        elapsed = (time.perf_counter() - started) * 1000
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def _git_commit() -> Optional[str]:
+    """현재 저장소 커밋 (git이 없거나 저장소가 아니면 None)"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    """결과 해석에 필요한 실행 환경 정보"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "executable": sys.executable,
+    }
+
+
+def iter_measurements(results: Dict[str, Any], prefix: str = ""):
+    """
+    결과 트리에서 통계 요약(median을 가진 항목)을 (경로, 요약)으로 순회
+
+    Args:
+        results: 벤치마크 결과 (중첩 딕셔너리)
+        prefix: 상위 경로
+
+    Yields:
+        ("suite.name", 요약 딕셔너리)
+    """
+    for name, value in results.items():
+        if not isinstance(value, dict):
+            continue
+        path = f"{prefix}.{name}" if prefix else name
+        if "median" in value and "unit" in value:
+            yield path, value
+        else:
+            yield from iter_measurements(value, path)
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    기준 결과 대비 중앙값이 허용 범위보다 나빠진 측정 항목 찾기
+
+    Args:
+        results: 이번 실행의 benchmarks 결과
+        baseline: 기준 실행의 benchmarks 결과
+        tolerance: 허용 비율 (0.25면 25%까지 허용)
+
+    Returns:
+        [{"name", "unit", "baseline", "current", "change"}] 회귀 목록
+    """
+    previous = dict(iter_measurements(baseline))
+    regressions = []
+    for name, current in iter_measurements(results):
+        base = previous.get(name)
+        if not base or base.get("unit") != current["unit"] or not base["median"]:
+            continue
+        change = current["median"] / base["median"] - 1
+        if current["unit"] in HIGHER_IS_BETTER_UNITS:
+            change = -change
+        if change > tolerance:
+            regressions.append({
+                "name": name,
+                "unit": current["unit"],
+                "baseline": base["median"],
+                "current": current["median"],
+                "change": round(change, 4),
+            })
+    return regressions
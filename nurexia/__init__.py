@@ -0,0 +1,5 @@
+"""
+Nurexia - 터미널 기반 AI 도구 명령행 인터페이스
+"""
+
+__version__ = "0.2.0"
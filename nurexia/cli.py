@@ -11,27 +11,60 @@ from dotenv import load_dotenv
 from .providers import list_providers, test_provider_connection, get_provider
 from .graph.state import GraphState, MessageRole
 from .graph.workflow import create_workflow
-from .utils.formatter import format_output, format_error
+from .graph.checkpoint import get_default_store
+from .utils.formatter import format_output, format_error, format_metrics, format_cascade, create_stream_formatter
 from .utils.streaming import execute_streaming
+from .utils.repl import run_repl
+from .utils.batch import execute_batch
+from .config import config_manager
+from .client import ServerClient
 
 # .env 파일 로드
 load_dotenv()
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option('-m', '--mode', type=click.Choice(['agent', 'chat', 'edit']), default='chat', help='Operation mode: agent, chat, or edit')
-@click.option('-pv', '--provider', type=str, default='anthropic', help='AI provider to use (anthropic, openai, huggingface, ollama, google)')
+@click.option('-pv', '--provider', type=str, default='anthropic', help='AI provider to use (anthropic, openai, huggingface, ollama, google, mock, replay)')
 @click.option('-md', '--model', type=str, default=None, help='Model to use (provider-specific)')
-@click.option('-o', '--output', type=click.Choice(['text', 'json', 'markdown']), default='text', help='Output format')
+@click.option('-o', '--output', type=click.Choice(['text', 'json', 'markdown', 'sse']), default='text', help='Output format (in --stream-mode, json emits NDJSON events and sse emits Server-Sent Events)')
 @click.option('-v', '--verbose', is_flag=True, help='Enable verbose logging')
 @click.option('-p', '--prompt', type=str, help='Prompt text (supports markdown)')
 @click.option('-t', '--temperature', type=float, default=0.7, help='Temperature for generation (0.0-2.0)')
 @click.option('--stream-mode', is_flag=True, help='Enable streaming output (supported by anthropic, openai, ollama, google)')
 @click.option('-ws', '--workspace', type=click.Path(exists=True, file_okay=False, dir_okay=True, resolve_path=True), help='Set the workspace directory')
+@click.option('--cache/--no-cache', default=lambda: config_manager.cache_enabled, help='Reuse cached responses for identical requests (default: NUREXIA_CACHE)')
+@click.option('--batch', 'batch_file', type=click.File('r'), default=None, help='Run prompts from a JSONL file ("-" for stdin) and write JSONL results')
+@click.option('--batch-output', type=click.File('w'), default='-', help='Batch result JSONL file (default: stdout)')
+@click.option('--concurrency', type=click.IntRange(min=1), default=8, help='Maximum concurrent requests in batch mode')
+@click.option('--batch-order', type=click.Choice(['input', 'completion']), default='input', help='Write batch results in input or completion order')
+@click.option('--session', type=str, default=None, help='Resume and persist the conversation under this session ID (stored in NUREXIA_SESSION_PATH)')
+@click.option('--race', 'race', multiple=True, help='Also send the request to PROVIDER[/MODEL] and use the fastest answer (repeatable or comma-separated)')
+@click.option('--hedge-delay', type=click.FloatRange(min=0), default=0.0, help='Seconds to wait before starting each additional --race candidate (0: start all at once)')
+@click.option('--cascade', 'cascade', multiple=True, help='Answer with the current provider first and escalate to PROVIDER[/MODEL] only when the draft fails the cascade checks (repeatable or comma-separated, tried in order)')
+@click.option('--record', 'record', type=click.Path(dir_okay=False, writable=True), default=lambda: config_manager.record_path, help='Append every provider response with its chunk timing to this JSONL cassette (default: NUREXIA_RECORD)')
+@click.option('--replay', 'replay', type=click.Path(exists=True, dir_okay=False), default=None, help='Answer from a recorded JSONL cassette with the original timing instead of calling the provider')
+@click.option('--server', 'server_url', type=str, default=lambda: config_manager.server_url, help='Forward prompts to a running "nurexia serve" instance when available (default: NUREXIA_SERVER)')
 @click.option('--show-env', is_flag=True, help='Show environment variables from .env file')
 @click.option('--test-connection', is_flag=True, help='Test the connection to the AI provider')
-def cli(mode, provider, model, output, verbose, prompt, temperature, stream_mode, workspace, show_env, test_connection):
+@click.pass_context
+def cli(ctx, mode, provider, model, output, verbose, prompt, temperature, stream_mode, workspace, cache, batch_file, batch_output, concurrency, batch_order, session, race, hedge_delay, cascade, record, replay, server_url, show_env, test_connection):
     """Terminal command line tool for nurexia."""
 
+    # 경주 대상 목록 정리 (쉼표 구분 허용)
+    race = parse_race_option(race)
+    ctx.params["race"] = race
+    cascade = parse_race_option(cascade)
+    ctx.params["cascade"] = cascade
+
+    # 기록된 응답을 재생하면 replay Provider 사용
+    if replay:
+        provider = ctx.params["provider"] = "replay"
+
+    # 하위 명령(serve 등)이 있으면 공통 옵션만 전달
+    if ctx.invoked_subcommand is not None:
+        ctx.obj = ctx.params
+        return
+
     # Workspace directory handling
     if workspace:
         working_dir = workspace
@@ -55,84 +88,147 @@ def cli(mode, provider, model, output, verbose, prompt, temperature, stream_mode
     # 연결 테스트
     if test_connection:
         click.echo(f"\n{provider} Provider 연결 테스트 중...")
-        success, message = test_provider_connection(provider, model)
+        success, message = test_provider_connection(provider, model, **capture_options({}, None, replay))
         if success:
             click.secho(f"✅ {message}", fg="green")
         else:
             click.secho(f"❌ {message}", fg="red")
         return
 
+    # 배치 처리
+    if batch_file:
+        model = resolve_model(provider, model, temperature, verbose)
+        if model is None:
+            ctx.exit(1)
+
+        defaults = {
+            "provider": provider,
+            "model": model,
+            "mode": mode,
+            "working_directory": working_dir,
+            "options": capture_options(race_options({
+                "temperature": temperature,
+                "verbose": verbose,
+                "cache": cache
+            }, race, hedge_delay, cascade), record, replay)
+        }
+
+        if verbose:
+            click.echo(f"Running batch with {provider}/{model} (concurrency: {concurrency}, order: {batch_order})", err=True)
+
+        total, failed = asyncio.run(execute_batch(
+            create_workflow(),
+            batch_file,
+            batch_output,
+            defaults,
+            concurrency=concurrency,
+            ordered=(batch_order == 'input')
+        ))
+
+        if verbose:
+            click.echo(f"Batch finished: {total} requests, {failed} failed", err=True)
+        # 그룹 명령의 반환값은 종료 코드로 쓰이지 않으므로 직접 종료
+        ctx.exit(1 if failed else 0)
+
     # 프롬프트 처리
     if prompt:
-        # Provider 유효성 검증
-        available_providers = list_providers()
-        if provider not in available_providers:
-            click.echo(format_error(f"Unknown provider '{provider}'. Available providers: {', '.join(available_providers.keys())}"))
-            return 1
-
-        # 모델 설정
+        model = resolve_model(provider, model, temperature, verbose)
         if model is None:
-            model = available_providers[provider]["default_model"]
-            if verbose:
-                click.echo(f"Using default model for {provider}: {model}")
+            ctx.exit(1)
 
-        # 온도 검증
-        if temperature < 0 or temperature > 2:
-            click.echo(format_error("Temperature must be between 0 and 2"))
-            return 1
+        # 실행 중인 서버가 있으면 요청을 전달 (세션과 응답 기록/재생은 로컬에서 처리하므로 제외)
+        if server_url and not (session or record or replay):
+            client = ServerClient(server_url)
+            if client.is_available():
+                if verbose:
+                    click.echo(f"Forwarding to server at {server_url}", err=True)
+                ctx.exit(execute_remote(client, race_options({
+                    "prompt": prompt,
+                    "provider": provider,
+                    "model": model,
+                    "mode": mode,
+                    "temperature": temperature
+                }, race, hedge_delay, cascade), output, stream_mode, verbose))
+            elif verbose:
+                click.echo(f"Server at {server_url} is not available, running locally", err=True)
 
         # 옵션 설정
-        options = {
+        options = capture_options(race_options({
             "temperature": temperature,
-            "verbose": verbose
-        }
+            "verbose": verbose,
+            "cache": cache
+        }, race, hedge_delay, cascade), record, replay)
 
-        # 상태 초기화
-        state = GraphState(
-            provider=provider,
-            model=model,
-            working_directory=working_dir,
-            mode=mode,
-            options=options
-        )
+        # 세션이 지정되면 저장된 상태에서 이어서 진행
+        store = get_default_store() if session else None
+        state = load_state(store, session, provider, model, working_dir, mode, options, verbose)
 
-        # 사용자 입력 추가
+        # 사용자 입력 추가 (실패하면 이 지점으로 되돌림)
+        turn_start = len(state.messages)
         state.add_message(MessageRole.USER, prompt)
 
         # 워크플로우 생성
         workflow = create_workflow()
 
+        # 실패하면 종료 코드 1 (ctx.exit의 Exit 예외도 Exception이므로 try 블록 밖에서 종료)
+        exit_code = 0
+
         # 스트리밍 모드인 경우
         if stream_mode:
+            # 안내는 표준 오류로 (-o json/sse 출력에 섞이지 않도록)
             if verbose:
-                click.echo(f"Running in streaming mode with {provider}/{model}")
+                click.echo(f"Running in streaming mode with {provider}/{model}", err=True)
+                if race:
+                    click.echo(f"Racing against: {', '.join(race)}", err=True)
+                if cascade:
+                    click.echo(f"Escalating to: {', '.join(cascade)}", err=True)
 
-            asyncio.run(execute_streaming(state))
+            asyncio.run(execute_streaming(state, output_format=output))
+            if state.error:
+                discard_turn(store, session, state, turn_start)
+                exit_code = 1
+            elif store:
+                store.save(session, state)
         else:
             # 일반 실행
             if verbose:
                 click.echo(f"Running with {provider}/{model}")
+                if race:
+                    click.echo(f"Racing against: {', '.join(race)}")
+                if cascade:
+                    click.echo(f"Escalating to: {', '.join(cascade)}")
 
             try:
-                result_state = asyncio.run(execute_workflow(workflow, state))
+                on_step = store.checkpointer(session) if store else None
+                result_state = asyncio.run(execute_workflow(workflow, state, on_step))
 
                 # 결과 출력
                 if result_state.error:
+                    discard_turn(store, session, result_state, turn_start)
                     click.echo(format_error(result_state.error, verbose))
-                    return 1
+                    exit_code = 1
                 elif result_state.result:
                     click.echo(format_output(result_state.result, output))
+                    # 상세 모드에서는 단계별 소요 시간 출력
+                    if verbose:
+                        for record in result_state.metadata.get("metrics", []):
+                            click.echo(format_metrics(record), err=True)
+                        if "race" in result_state.metadata:
+                            click.echo(f"Race winner: {result_state.metadata['race']['winner']}", err=True)
+                        if "cascade" in result_state.metadata:
+                            click.echo(format_cascade(result_state.metadata["cascade"]), err=True)
                 else:
                     click.echo(format_error("No response generated"))
-                    return 1
+                    exit_code = 1
             except Exception as e:
+                discard_turn(store, session, state, turn_start)
                 click.echo(format_error(str(e), verbose, {"type": type(e).__name__}))
                 if verbose:
                     import traceback
                     click.echo(traceback.format_exc())
-                return 1
+                exit_code = 1
 
-        return 0
+        ctx.exit(exit_code)
 
     # 일반 모드 실행 (프롬프트 없음)
     click.echo(f"Running nurexia in {mode} mode")
@@ -143,18 +239,233 @@ def cli(mode, provider, model, output, verbose, prompt, temperature, stream_mode
         # Agent mode functionality
         click.echo("Agent mode activated")
     elif mode == 'chat':
-        # Chat mode functionality
-        click.echo("Chat mode activated")
+        # 대화형 채팅: Provider와 대화 상태를 유지하며 여러 턴 처리
+        model = resolve_model(provider, model, temperature, verbose)
+        if model is None:
+            ctx.exit(1)
+
+        options = capture_options(race_options({
+            "temperature": temperature,
+            "verbose": verbose,
+            "cache": cache
+        }, race, hedge_delay, cascade), record, replay)
+        store = get_default_store() if session else None
+        state = load_state(store, session, provider, model, working_dir, mode, options, verbose)
+
+        try:
+            asyncio.run(run_repl(state, store, session))
+        except KeyboardInterrupt:
+            click.echo()
     elif mode == 'edit':
         # Edit mode functionality
         click.echo("Edit mode activated")
 
 
-async def execute_workflow(workflow, state: GraphState) -> GraphState:
-    """워크플로우 실행"""
-    result = await workflow.ainvoke(state)
+def resolve_model(provider, model, temperature, verbose):
+    """Provider와 온도를 검증하고 사용할 모델명을 반환 (오류 시 None)"""
+    # Provider 유효성 검증
+    available_providers = list_providers()
+    if provider not in available_providers:
+        click.echo(format_error(f"Unknown provider '{provider}'. Available providers: {', '.join(available_providers.keys())}"))
+        return None
+
+    # 모델 설정
+    if model is None:
+        model = available_providers[provider]["default_model"]
+        if verbose:
+            click.echo(f"Using default model for {provider}: {model}", err=True)
+
+    # 온도 검증
+    if temperature < 0 or temperature > 2:
+        click.echo(format_error("Temperature must be between 0 and 2"))
+        return None
+
+    return model
+
+
+def load_state(store, session, provider, model, working_dir, mode, options, verbose):
+    """세션 상태를 복원하거나 새 상태 생성 (복원 시 이번 실행의 옵션 적용)"""
+    state = store.load(session) if store else None
+
+    if state is None:
+        # 상태 초기화
+        return GraphState(
+            provider=provider,
+            model=model,
+            working_directory=working_dir,
+            mode=mode,
+            options=options
+        )
+
+    if verbose:
+        click.echo(f"Resuming session '{session}' ({len(state.messages)} messages)", err=True)
+    # 이번 실행의 옵션 적용, 이전 실행 결과 초기화
+    state.provider, state.model, state.mode = provider, model, mode
+    state.working_directory, state.options = working_dir, options
+    state.error = state.result = None
+    return state
+
+
+def discard_turn(store, session, state, turn_start):
+    """실패한 턴의 메시지를 되돌리고 세션 저장 (다음 재개 시 사용자 메시지가 연속되지 않도록)"""
+    state.messages.truncate(turn_start)
+    if store:
+        store.save(session, state)
+
+
+def parse_race_option(values):
+    """--race 값(반복 또는 쉼표 구분)을 대상 목록으로 변환"""
+    return [target.strip() for value in values for target in value.split(",") if target.strip()]
+
+
+def race_options(options, race, hedge_delay, cascade=()):
+    """경주 대상이 있으면 race/hedge_delay, 단계적 대상이 있으면 cascade 옵션 추가"""
+    if race:
+        options["race"] = list(race)
+        options["hedge_delay"] = hedge_delay
+    if cascade:
+        options["cascade"] = list(cascade)
+    return options
+
+
+def capture_options(options, record, replay):
+    """응답 기록/재생 경로가 있으면 record/cassette 옵션 추가"""
+    if record:
+        options["record"] = record
+    if replay:
+        options["cassette"] = replay
+    return options
+
+
+async def execute_workflow(workflow, state: GraphState, on_step=None) -> GraphState:
+    """워크플로우 실행 (on_step: 노드마다 호출되는 체크포인트 콜백)"""
+    result = await workflow.ainvoke(state, on_step=on_step)
     return result
 
 
+def execute_remote(client, payload, output, stream_mode, verbose):
+    """서버로 요청을 전달하고 결과 출력"""
+    try:
+        if stream_mode:
+            formatter = create_stream_formatter(output)
+            click.echo(formatter.start(payload["provider"], payload["model"]), nl=False)
+            chunks = []
+
+            def on_escalate(text, info):
+                # 상위 Provider로 넘어가면 이미 출력한 초안은 요약에서 제외
+                chunks.clear()
+                click.echo(formatter.escalate(text, info), nl=False)
+
+            for chunk in client.stream_chat(payload, on_escalate):
+                chunks.append(chunk)
+                click.echo(formatter.chunk(chunk), nl=False)
+            # 서버 스트림에는 계측 정보가 없으므로 청크 수만 요약
+            click.echo(formatter.finish({
+                "provider": payload["provider"],
+                "model": payload["model"],
+                "chunks": len(chunks),
+                "chars": sum(len(chunk) for chunk in chunks),
+            }), nl=False)
+            return 0
+
+        response = client.chat(payload)
+        if response.get("error"):
+            click.echo(format_error(response["error"], verbose))
+            return 1
+        elif response.get("result"):
+            click.echo(format_output(response["result"], output))
+            return 0
+        else:
+            click.echo(format_error("No response generated"))
+            return 1
+    except Exception as e:
+        click.echo(format_error(str(e), verbose, {"type": type(e).__name__}))
+        return 1
+
+
+@cli.command()
+@click.option('--host', type=str, default=lambda: config_manager.server_host, help='Host to bind (default: NUREXIA_SERVER_HOST)')
+@click.option('--port', type=int, default=lambda: config_manager.server_port, help='Port to bind (default: NUREXIA_SERVER_PORT)')
+@click.option('--preload', type=str, default=None, help='Comma-separated providers to import at startup (default: all)')
+@click.pass_obj
+def serve(params, host, port, preload):
+    """Run a long-lived local server exposing the workflow over HTTP."""
+    from .server import run_server
+
+    provider = params["provider"]
+    model = resolve_model(provider, params["model"], params["temperature"], params["verbose"])
+    if model is None:
+        click.get_current_context().exit(1)
+
+    defaults = {
+        "provider": provider,
+        "model": model,
+        "mode": params["mode"],
+        "working_directory": params["workspace"] or os.getcwd(),
+        "options": capture_options(race_options({
+            "temperature": params["temperature"],
+            "verbose": params["verbose"],
+            "cache": params["cache"]
+        }, params["race"], params["hedge_delay"], params["cascade"]), params["record"], params["replay"])
+    }
+    preload_names = [name.strip() for name in preload.split(",")] if preload else None
+
+    def on_ready():
+        click.echo(f"nurexia server listening on http://{host}:{port} ({provider}/{model})", err=True)
+
+    try:
+        asyncio.run(run_server(host, port, defaults, concurrency=params["concurrency"],
+                               preload=preload_names, on_ready=on_ready))
+    except KeyboardInterrupt:
+        click.echo("Server stopped", err=True)
+    return 0
+
+
+@cli.command(name="index")
+@click.option('-q', '--query', type=str, default=None, help='Search the index and print the matching snippets')
+@click.option('-n', '--limit', type=click.IntRange(min=1), default=5, help='Maximum number of snippets to print')
+@click.option('--rebuild', is_flag=True, help='Discard the existing index and re-read every file')
+@click.option('--semantic', is_flag=True, help='Build or search the local embedding index instead (requires numpy and NUREXIA_EMBEDDINGS)')
+@click.pass_obj
+def index_command(params, query, limit, rebuild, semantic):
+    """Build or update the search index of the workspace directory."""
+    import time
+    from .workspace import get_workspace_index
+
+    root = params["workspace"] or os.getcwd()
+    try:
+        if semantic:
+            from .workspace.semantic import get_semantic_index
+            workspace_index = get_semantic_index(root)
+        else:
+            workspace_index = get_workspace_index(root)
+        if rebuild:
+            workspace_index.clear()
+
+        started = time.perf_counter()
+        result = workspace_index.update()
+        elapsed = time.perf_counter() - started
+    except Exception as e:
+        click.echo(format_error(str(e), params["verbose"], {"type": type(e).__name__}))
+        click.get_current_context().exit(1)
+
+    click.echo(f"Indexed {result['files']} files in {workspace_index.root} "
+               f"({result['indexed']} updated, {result['removed']} removed, {elapsed:.2f}s)", err=True)
+    if params["verbose"]:
+        click.echo(f"Index path: {workspace_index.path}", err=True)
+
+    if query:
+        started = time.perf_counter()
+        snippets = workspace_index.search(query, limit)
+        if params["verbose"]:
+            click.echo(f"Search took {(time.perf_counter() - started) * 1000:.1f}ms", err=True)
+        for snippet in snippets:
+            click.secho(f"{snippet['path']}:{snippet['start_line']}-{snippet['end_line']} "
+                        f"(score {snippet['score']:.2f})", fg="cyan")
+            click.echo(snippet["text"])
+            click.echo()
+    return 0
+
+
 if __name__ == '__main__':
     cli()
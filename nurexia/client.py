@@ -0,0 +1,108 @@
+"""
+서버 모드 클라이언트.
+실행 중인 `nurexia serve`로 요청을 전달하여 프로세스 시작 비용 없이 응답을 받습니다.
+표준 라이브러리만 사용하므로 import 비용이 거의 없습니다.
+"""
+from typing import Dict, Any, Callable, Iterator, Optional
+import json
+import urllib.error
+import urllib.request
+
+
+class ServerClient:
+    """nurexia 서버 HTTP 클라이언트"""
+
+    def __init__(self, base_url: str, timeout: float = 600.0):
+        """
+        클라이언트 초기화
+
+        Args:
+            base_url: 서버 주소 (예: http://127.0.0.1:8765)
+            timeout: 요청 제한 시간(초)
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def is_available(self, timeout: float = 0.3) -> bool:
+        """
+        서버가 응답하는지 확인
+
+        Args:
+            timeout: 확인 요청 제한 시간(초)
+
+        Returns:
+            서버 사용 가능 여부
+        """
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/health", timeout=timeout) as response:
+                return response.status == 200
+        except (urllib.error.URLError, OSError, ValueError):
+            return False
+
+    def _post(self, path: str, payload: Dict[str, Any]):
+        """JSON 본문으로 POST 요청"""
+        request = urllib.request.Request(
+            f"{self.base_url}{path}",
+            data=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        return urllib.request.urlopen(request, timeout=self.timeout)
+
+    def chat(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        워크플로우 실행 요청
+
+        Args:
+            payload: 요청 본문 (prompt 또는 messages, provider, model, temperature 등)
+
+        Returns:
+            서버 응답 (result, error, metadata 등)
+        """
+        try:
+            with self._post("/v1/chat", payload) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            try:
+                return json.loads(e.read().decode("utf-8"))
+            except ValueError:
+                return {"error": str(e)}
+
+    def stream_chat(self, payload: Dict[str, Any],
+                    on_escalate: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Iterator[str]:
+        """
+        스트리밍 응답 요청 (SSE)
+
+        Args:
+            payload: 요청 본문
+            on_escalate: 단계적 모드에서 상위 Provider로 넘어갈 때 (안내 문구, 넘김 정보)로 호출
+                (없으면 안내 문구를 청크로 반환)
+
+        Yields:
+            응답 청크
+
+        Raises:
+            RuntimeError: 서버가 오류 이벤트를 보낸 경우
+        """
+        with self._post("/v1/chat/stream", payload) as response:
+            event: Optional[str] = None
+            for raw_line in response:
+                line = raw_line.decode("utf-8").rstrip("\r\n")
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    data = json.loads(line[len("data:"):].strip() or "{}")
+                    if event == "done":
+                        return
+                    if event == "error":
+                        raise RuntimeError(data.get("error", "Unknown server error"))
+                    if event == "escalate":
+                        text = data.pop("text", "")
+                        if on_escalate is not None:
+                            on_escalate(text, data)
+                        else:
+                            yield text
+                    elif "chunk" in data:
+                        yield data["chunk"]
+                elif not line:
+                    event = None
@@ -16,6 +16,45 @@ class ConfigManager:
         self.app_name = "nurexia"
         self.debug = self._get_bool_env("NUREXIA_DEBUG", False)
         self.log_level = os.getenv("NUREXIA_LOG_LEVEL", "INFO")
+        self.sync_workers = self._get_int_env("NUREXIA_SYNC_WORKERS", 32)
+        self.stream_buffer_size = self._get_int_env("NUREXIA_STREAM_BUFFER_SIZE", 64)
+        self.stream_frame_ms = self._get_float_env("NUREXIA_STREAM_FRAME_MS", 33)
+        self.stream_frame_bytes = self._get_int_env("NUREXIA_STREAM_FRAME_BYTES", 8192)
+        self.stream_bulk_bytes = self._get_int_env("NUREXIA_STREAM_BULK_BYTES", 65536)
+        self.client_pool_size = self._get_int_env("NUREXIA_CLIENT_POOL_SIZE", 32)
+        self.cache_enabled = self._get_bool_env("NUREXIA_CACHE", False)
+        self.cache_path = os.path.expanduser(
+            os.getenv("NUREXIA_CACHE_PATH", os.path.join("~", ".cache", "nurexia", "responses.sqlite3"))
+        )
+        self.cache_ttl = self._get_int_env("NUREXIA_CACHE_TTL", 7 * 24 * 60 * 60)
+        self.cache_max_entries = self._get_int_env("NUREXIA_CACHE_MAX_ENTRIES", 10000)
+        self.server_host = os.getenv("NUREXIA_SERVER_HOST", "127.0.0.1")
+        self.server_port = self._get_int_env("NUREXIA_SERVER_PORT", 8765)
+        self.server_url = os.getenv("NUREXIA_SERVER")
+        self.metrics_sink = os.getenv("NUREXIA_METRICS")
+        self.prompt_cache_enabled = self._get_bool_env("NUREXIA_PROMPT_CACHE", True)
+        self.prompt_cache_min_tokens = self._get_int_env("NUREXIA_PROMPT_CACHE_MIN_TOKENS", 1024)
+        self.session_path = os.path.expanduser(
+            os.getenv("NUREXIA_SESSION_PATH", os.path.join("~", ".local", "share", "nurexia", "sessions.sqlite3"))
+        )
+        self.index_dir = os.path.expanduser(
+            os.getenv("NUREXIA_INDEX_DIR", os.path.join("~", ".cache", "nurexia", "index"))
+        )
+        self.index_max_file_size = self._get_int_env("NUREXIA_INDEX_MAX_FILE_SIZE", 1024 * 1024)
+        self.index_refresh = self._get_float_env("NUREXIA_INDEX_REFRESH", 30)
+        self.workspace_snippets = self._get_int_env("NUREXIA_WORKSPACE_SNIPPETS", 5)
+        self.workspace_context_tokens = self._get_int_env("NUREXIA_WORKSPACE_CONTEXT_TOKENS", 2000)
+        self.ingest_workers = self._get_int_env("NUREXIA_INGEST_WORKERS", 0)
+        self.ingest_processes = self._get_bool_env("NUREXIA_INGEST_PROCESSES", False)
+        self.semantic_index = self._get_bool_env("NUREXIA_SEMANTIC_INDEX", False)
+        self.embeddings = os.getenv("NUREXIA_EMBEDDINGS", "ollama:nomic-embed-text")
+        self.embed_batch_size = self._get_int_env("NUREXIA_EMBED_BATCH_SIZE", 64)
+        self.record_path = os.getenv("NUREXIA_RECORD")
+        self.cascade_min_chars = self._get_int_env("NUREXIA_CASCADE_MIN_CHARS", 1)
+        self.cascade_max_prompt_tokens = self._get_int_env("NUREXIA_CASCADE_MAX_PROMPT_TOKENS", 0)
+        self.cascade_uncertainty = os.getenv("NUREXIA_CASCADE_UNCERTAINTY")
+        self.cascade_require = os.getenv("NUREXIA_CASCADE_REQUIRE", "")
+        self.cascade_reject = os.getenv("NUREXIA_CASCADE_REJECT", "")
         self._providers_config = {}
 
     def _get_bool_env(self, key: str, default: bool) -> bool:
@@ -23,6 +62,42 @@ class ConfigManager:
         value = os.getenv(key, str(default)).lower()
         return value in ('true', '1', 't', 'y', 'yes')
 
+    def _get_int_env(self, key: str, default: int) -> int:
+        """환경 변수에서 정수 값을 가져옴"""
+        try:
+            return int(os.getenv(key, str(default)))
+        except ValueError:
+            return default
+
+    def _get_float_env(self, key: str, default: float) -> float:
+        """환경 변수에서 실수 값을 가져옴"""
+        try:
+            return float(os.getenv(key, str(default)))
+        except ValueError:
+            return default
+
+    def get_scheduler_config(self, provider_name: str) -> Dict[str, Any]:
+        """
+        Provider 요청 스케줄러 설정 가져오기
+
+        NUREXIA_<PROVIDER>_* 값이 있으면 공통 NUREXIA_* 값보다 우선합니다.
+        """
+        prefix = f"NUREXIA_{provider_name.upper()}_"
+
+        def get_float(name: str, default: float) -> float:
+            return self._get_float_env(prefix + name, self._get_float_env("NUREXIA_" + name, default))
+
+        return {
+            "requests_per_minute": get_float("RPM", 0),
+            "tokens_per_minute": get_float("TPM", 0),
+            "max_in_flight": int(get_float("MAX_IN_FLIGHT", 16)),
+            "timeout": get_float("TIMEOUT", 120),
+            "max_retries": int(get_float("MAX_RETRIES", 3)),
+            "backoff_base": get_float("RETRY_BASE_DELAY", 0.5),
+            "backoff_max": get_float("RETRY_MAX_DELAY", 30),
+            "idle_timeout": get_float("STREAM_IDLE_TIMEOUT", 60),
+        }
+
     def get_provider_config(self, provider_name: str) -> Dict[str, Any]:
         """특정 Provider의 설정 가져오기"""
         if provider_name not in self._providers_config:
@@ -52,6 +127,25 @@ class ConfigManager:
                     "host": os.getenv("OLLAMA_HOST", "http://localhost:11434"),
                     "default_model": os.getenv("OLLAMA_DEFAULT_MODEL", "gemma3:12b")
                 }
+            elif provider_name == "mock":
+                seed = os.getenv("NUREXIA_MOCK_SEED")
+                self._providers_config[provider_name] = {
+                    "latency": os.getenv("NUREXIA_MOCK_LATENCY", "0"),
+                    "token_rate": self._get_float_env("NUREXIA_MOCK_TOKEN_RATE", 0),
+                    "error_rate": self._get_float_env("NUREXIA_MOCK_ERROR_RATE", 0),
+                    "error": os.getenv("NUREXIA_MOCK_ERROR", "server"),
+                    "stream_error_rate": self._get_float_env("NUREXIA_MOCK_STREAM_ERROR_RATE", 0),
+                    "response_tokens": self._get_int_env("NUREXIA_MOCK_RESPONSE_TOKENS", 64),
+                    "seed": int(seed) if seed and seed.lstrip("-").isdigit() else None
+                }
+            elif provider_name == "replay":
+                self._providers_config[provider_name] = {
+                    "cassette": os.path.expanduser(
+                        os.getenv("NUREXIA_REPLAY_PATH", os.path.join("~", ".cache", "nurexia", "cassette.jsonl"))
+                    ),
+                    "speed": self._get_float_env("NUREXIA_REPLAY_SPEED", 1.0),
+                    "strict": self._get_bool_env("NUREXIA_REPLAY_STRICT", False)
+                }
             else:
                 # 알 수 없는 provider는 빈 설정 반환
                 self._providers_config[provider_name] = {}
@@ -67,6 +161,9 @@ class ConfigManager:
                 return bool(config.get("api_key"))
             elif provider_name == "ollama":
                 return bool(config.get("host"))
+            elif provider_name in ["mock", "replay"]:
+                # 네트워크를 사용하지 않는 테스트용 Provider
+                return True
             return False
         except Exception:
             return False
@@ -0,0 +1,202 @@
+"""
+GraphState 체크포인트 저장소
+대화 세션을 SQLite 파일에 보관합니다. 메시지는 추가된 것만 이어 쓰고,
+그 밖의 작은 상태 필드만 매번 갱신하므로 긴 세션도 저장 비용이 일정합니다.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from ..config import config_manager
+from .state import GraphState
+
+# 호출마다 새로 생성되어 세션에 보관할 필요가 없는 metadata 키
+_TRANSIENT_METADATA = {"metrics", "context", "workspace_context"}
+
+# 메시지 외에 세션 행에 저장하는 상태 필드
+_STATE_FIELDS = ("current_node", "mode", "action", "working_directory", "provider", "model",
+                 "options", "error", "result")
+
+
+class CheckpointStore:
+    """세션별 GraphState를 보관하는 SQLite 체크포인트 저장소"""
+
+    def __init__(self, path: str):
+        """
+        체크포인트 저장소 초기화
+
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # 세션별로 이미 저장된 메시지 수 (저장할 때마다 다시 조회하지 않기 위함)
+        self._persisted: Dict[str, int] = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " id TEXT PRIMARY KEY,"
+            " state TEXT NOT NULL,"
+            " message_count INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            " session_id TEXT NOT NULL,"
+            " seq INTEGER NOT NULL,"
+            " role TEXT NOT NULL,"
+            " content TEXT NOT NULL,"
+            " metadata TEXT NOT NULL,"
+            " PRIMARY KEY (session_id, seq))"
+        )
+        self._conn.commit()
+
+    def _message_count(self, session_id: str) -> int:
+        """저장된 메시지 수 (처음 한 번만 조회)"""
+        count = self._persisted.get(session_id)
+        if count is None:
+            row = self._conn.execute("SELECT message_count FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            count = self._persisted[session_id] = row[0] if row else 0
+        return count
+
+    def save(self, session_id: str, state: GraphState) -> int:
+        """
+        상태 저장 (새 메시지만 추가)
+
+        이미 저장된 메시지 수보다 상태의 메시지가 적으면 이력이 바뀐 것으로 보고
+        그 이후 메시지를 다시 씁니다.
+
+        Args:
+            session_id: 세션 ID
+            state: 저장할 상태
+
+        Returns:
+            새로 추가된 메시지 수
+        """
+        now = time.time()
+        fields = {name: getattr(state, name) for name in _STATE_FIELDS}
+        fields["action"] = state.action.model_dump() if state.action else None
+        fields["metadata"] = {k: v for k, v in state.metadata.items() if k not in _TRANSIENT_METADATA}
+        encoded = json.dumps(fields, ensure_ascii=False, default=str)
+
+        with self._lock:
+            persisted = self._message_count(session_id)
+            if len(state.messages) < persisted:
+                self._conn.execute(
+                    "DELETE FROM messages WHERE session_id = ? AND seq >= ?",
+                    (session_id, len(state.messages))
+                )
+                persisted = len(state.messages)
+
+            messages = state.messages
+            new_count = len(messages) - persisted
+            if new_count:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO messages (session_id, seq, role, content, metadata) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (session_id, seq, messages.role_at(seq).value, messages.content_at(seq),
+                         json.dumps(messages.metadata_at(seq), ensure_ascii=False, default=str))
+                        for seq in range(persisted, len(messages))
+                    ]
+                )
+            self._conn.execute(
+                "INSERT INTO sessions (id, state, message_count, created_at, updated_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET state = excluded.state,"
+                " message_count = excluded.message_count, updated_at = excluded.updated_at",
+                (session_id, encoded, len(state.messages), now, now)
+            )
+            self._conn.commit()
+            self._persisted[session_id] = len(state.messages)
+        return new_count
+
+    def load(self, session_id: str) -> Optional[GraphState]:
+        """
+        세션 상태 복원
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            복원된 GraphState (세션이 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state, message_count FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT role, content, metadata FROM messages WHERE session_id = ? AND seq < ? ORDER BY seq",
+                (session_id, row[1])
+            ).fetchall()
+            self._persisted[session_id] = row[1]
+
+        fields = json.loads(row[0])
+        state = GraphState(**fields)
+        # 메시지 객체를 만들지 않고 저장소에 바로 추가
+        for role, content, metadata in rows:
+            state.messages.add(role, content, json.loads(metadata))
+        return state
+
+    def delete(self, session_id: str):
+        """세션 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            self._conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            self._conn.commit()
+            self._persisted.pop(session_id, None)
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """
+        저장된 세션 목록 반환
+
+        Returns:
+            [{"id": ..., "messages": ..., "updated_at": ...}, ...] (최근 갱신 순)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, message_count, updated_at FROM sessions ORDER BY updated_at DESC"
+            ).fetchall()
+        return [{"id": sid, "messages": count, "updated_at": updated} for sid, count, updated in rows]
+
+    def checkpointer(self, session_id: str) -> Callable[[str, GraphState], Awaitable[None]]:
+        """
+        그래프 실행 중 노드마다 상태를 저장하는 on_step 콜백 생성
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            CompiledGraph.ainvoke의 on_step으로 사용할 비동기 함수
+        """
+        async def on_step(node: str, state: GraphState):
+            self.save(session_id, state)
+        return on_step
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 기본 체크포인트 저장소 (최초 사용 시 생성)
+_default_store: Optional[CheckpointStore] = None
+
+
+def get_default_store() -> CheckpointStore:
+    """설정 기반 기본 체크포인트 저장소 반환"""
+    global _default_store
+    if _default_store is None:
+        _default_store = CheckpointStore(config_manager.session_path)
+    return _default_store
@@ -0,0 +1,139 @@
+"""
+컨텍스트 윈도우 관리
+대화 이력을 모델의 컨텍스트 한도 안에 맞도록 오래된 턴부터 정리합니다.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from .tokens import count_message_tokens, count_tokens, MESSAGE_OVERHEAD_TOKENS
+from .messages import stable_prefix_length
+from ..providers.registry import get_context_window
+
+# 응답 생성을 위해 남겨 두는 기본 토큰 수
+DEFAULT_OUTPUT_RESERVE = 1024
+
+# 요약 메시지 최대 길이 (문자)
+SUMMARY_MAX_CHARS = 1200
+
+
+def summarize_dropped_messages(messages: List[Any]) -> str:
+    """생략된 메시지의 간단한 추출 요약 생성 (LLM 호출 없음)
+
+    각 메시지의 첫 줄을 역할과 함께 나열하고 최대 길이에서 자릅니다.
+
+    Args:
+        messages: 컨텍스트에서 제외된 메시지 목록
+
+    Returns:
+        요약 텍스트
+    """
+    lines = [f"[이전 대화 {len(messages)}개 메시지 요약]"]
+    for msg in messages:
+        role = msg.role.value if hasattr(msg.role, "value") else str(msg.role)
+        first_line = (msg.content or "").strip().splitlines()[0:1]
+        if first_line:
+            lines.append(f"- {role}: {first_line[0][:160]}")
+    summary = "\n".join(lines)
+    return summary[:SUMMARY_MAX_CHARS]
+
+
+class ContextWindowManager:
+    """토큰 예산에 맞춰 대화 이력을 정리하는 관리자"""
+
+    def __init__(self, max_tokens: int, reserve_output_tokens: int = DEFAULT_OUTPUT_RESERVE,
+                 summarizer: Optional[Callable[[List[Any]], str]] = None):
+        """컨텍스트 관리자 초기화
+
+        Args:
+            max_tokens: 모델 컨텍스트 한도 (토큰)
+            reserve_output_tokens: 응답 생성을 위해 남겨 둘 토큰 수
+            summarizer: 생략된 메시지를 요약하는 함수 (None이면 단순히 제외)
+        """
+        self.max_tokens = max_tokens
+        self.reserve_output_tokens = reserve_output_tokens
+        self.summarizer = summarizer
+        self.last_stats: Dict[str, int] = {}
+
+    @classmethod
+    def for_model(cls, provider: str, model: Optional[str], options: Optional[Dict[str, Any]] = None) -> "ContextWindowManager":
+        """Provider 메타데이터와 옵션으로 관리자 생성
+
+        Args:
+            provider: Provider 이름
+            model: 모델명
+            options: 옵션 (max_context_tokens, max_output_tokens, context_strategy)
+
+        Returns:
+            ContextWindowManager 인스턴스
+        """
+        options = options or {}
+        max_tokens = options.get("max_context_tokens") or get_context_window(provider, model)
+        summarizer = summarize_dropped_messages if options.get("context_strategy") == "summarize" else None
+        return cls(
+            max_tokens,
+            reserve_output_tokens=options.get("max_output_tokens", DEFAULT_OUTPUT_RESERVE),
+            summarizer=summarizer
+        )
+
+    @property
+    def budget(self) -> int:
+        """입력 메시지에 사용할 수 있는 토큰 수"""
+        return max(0, self.max_tokens - self.reserve_output_tokens)
+
+    def fit(self, messages: List[Any], make_summary_message: Optional[Callable[[str], Any]] = None) -> List[Any]:
+        """토큰 예산에 맞도록 메시지 목록 정리
+
+        선두의 시스템/고정(pinned) 메시지와 가장 최근 메시지는 항상 유지하고, 나머지는
+        최신 턴부터 예산이 허용하는 만큼 포함합니다. 요약 함수가 있으면 제외된
+        턴의 요약을 시스템 메시지 바로 뒤에 넣습니다.
+
+        Args:
+            messages: 전체 대화 이력
+            make_summary_message: 요약 텍스트로 메시지 객체를 만드는 함수
+
+        Returns:
+            예산 안에 들어가는 메시지 목록 (정리할 필요가 없으면 원본, 앞에 붙일
+            메시지가 없으면 원본의 슬라이스)
+        """
+        # 메시지 저장소는 캐시된 토큰 수를 메시지 객체 생성 없이 제공
+        if hasattr(messages, "token_counts"):
+            counts = messages.token_counts()
+        else:
+            counts = [count_message_tokens(msg) for msg in messages]
+        total = sum(counts)
+        self.last_stats = {"tokens": total, "dropped": 0, "budget": self.budget}
+        if total <= self.budget or len(messages) <= 1:
+            return messages
+
+        # 선두 시스템 메시지와 고정(pinned) 메시지는 유지
+        head = min(stable_prefix_length(messages), len(messages) - 1)
+
+        used = sum(counts[:head]) + counts[-1]
+        start = len(messages) - 1
+        while start > head and used + counts[start - 1] <= self.budget:
+            start -= 1
+            used += counts[start]
+
+        dropped = messages[head:start]
+        result = list(messages[:head])
+
+        if dropped and self.summarizer and make_summary_message:
+            while True:
+                summary = self.summarizer(messages[head:start])
+                summary_tokens = count_tokens(summary) + MESSAGE_OVERHEAD_TOKENS
+                if used + summary_tokens <= self.budget or start >= len(messages) - 1:
+                    break
+                # 요약이 들어갈 자리가 없으면 가장 오래된 유지 턴을 추가로 제외
+                used -= counts[start]
+                start += 1
+            if used + summary_tokens <= self.budget:
+                result.append(make_summary_message(summary))
+                used += summary_tokens
+            dropped = messages[head:start]
+
+        self.last_stats = {"tokens": used, "dropped": len(dropped), "budget": self.budget}
+        if not result:
+            # 앞에 붙일 메시지가 없으면 유지 구간을 그대로 반환 (저장소는 복사 없는 뷰)
+            return messages[start:]
+        result.extend(messages[start:])
+        return result
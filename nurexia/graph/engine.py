@@ -0,0 +1,255 @@
+"""
+그래프 실행 엔진
+노드와 (조건부) 엣지를 등록하고, 서로 독립적인 분기는 asyncio.gather로 동시에 실행합니다.
+하나의 노드에서 여러 노드로 갈라지는 fan-out과, 여러 분기가 하나의 노드로 모이는
+fan-in(join)을 지원합니다.
+"""
+
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import asyncio
+
+from .state import GraphState
+
+# 종료 노드 이름
+END = "__end__"
+
+# 노드 함수: 상태를 받아 상태 또는 (상태, 다음 노드)를 반환
+NodeFunction = Callable[[GraphState], Awaitable[Union[GraphState, Tuple[GraphState, Union[str, Sequence[str]]]]]]
+# 라우터: 상태를 보고 다음 노드 이름(또는 목록)을 반환
+Router = Callable[[GraphState], Union[str, Sequence[str]]]
+# 병합 함수: 여러 분기의 상태를 하나로 합침
+MergeFunction = Callable[[List[GraphState]], GraphState]
+
+
+def merge_states(states: List[GraphState]) -> GraphState:
+    """여러 분기의 상태를 하나로 병합
+
+    첫 번째 상태를 기준으로, 다른 분기에서 새로 추가된 메시지를 이어 붙이고
+    metadata는 목록은 이어 붙이고 딕셔너리는 합치며 그 밖의 값은 덮어씁니다.
+
+    Args:
+        states: 병합할 상태 목록 (분기 순서)
+
+    Returns:
+        병합된 상태
+    """
+    base = states[0]
+    for other in states[1:]:
+        # 공통 이력 이후에 추가된 메시지만 병합
+        common = 0
+        limit = min(len(base.messages), len(other.messages))
+        while common < limit and base.messages.role_at(common) == other.messages.role_at(common) and \
+                base.messages.content_at(common) == other.messages.content_at(common):
+            common += 1
+        base.messages.extend(other.messages[common:])
+
+        for key, value in other.metadata.items():
+            current = base.metadata.get(key)
+            if isinstance(current, list) and isinstance(value, list):
+                base.metadata[key] = current + [v for v in value if v not in current]
+            elif isinstance(current, dict) and isinstance(value, dict):
+                base.metadata[key] = {**current, **value}
+            else:
+                base.metadata[key] = value
+
+        if base.error is None:
+            base.error = other.error
+        if base.result is None:
+            base.result = other.result
+    return base
+
+
+class CompiledGraph:
+    """실행 가능한 그래프"""
+
+    def __init__(self, graph: "StateGraph", max_steps: int = 100):
+        """컴파일된 그래프 초기화
+
+        Args:
+            graph: 노드와 엣지가 등록된 StateGraph
+            max_steps: 무한 루프 방지를 위한 최대 단계 수
+        """
+        self.nodes = dict(graph.nodes)
+        self.edges = {source: list(targets) for source, targets in graph.edges.items()}
+        self.routers = dict(graph.routers)
+        self.merges = dict(graph.merges)
+        self.entry_point = graph.entry_point
+        self.max_steps = max_steps
+
+        # 정적 엣지가 둘 이상 들어오는 노드는 모든 선행 노드를 기다림 (fan-in)
+        predecessors: Dict[str, set] = defaultdict(set)
+        for source, targets in self.edges.items():
+            for target in targets:
+                predecessors[target].add(source)
+        self.joins = {node: sources for node, sources in predecessors.items() if len(sources) > 1 and node != END}
+
+    def _next_nodes(self, name: str, state: GraphState, explicit: Optional[Union[str, Sequence[str]]]) -> List[str]:
+        """노드 실행 후 이동할 노드 목록 결정"""
+        if explicit is None and name in self.routers:
+            explicit = self.routers[name](state)
+        if explicit is None:
+            return self.edges.get(name, [END])
+        if isinstance(explicit, str):
+            return [explicit]
+        return list(explicit)
+
+    async def _run_node(self, name: str, state: GraphState) -> Tuple[GraphState, List[str]]:
+        """노드 하나 실행"""
+        state.current_node = name
+        output = await self.nodes[name](state)
+        explicit = None
+        if isinstance(output, tuple):
+            output, explicit = output
+        return output, self._next_nodes(name, output, explicit)
+
+    def _merge(self, name: str, states: List[GraphState]) -> GraphState:
+        """join 노드로 모인 분기 상태 병합"""
+        if len(states) == 1:
+            return states[0]
+        return self.merges.get(name, merge_states)(states)
+
+    async def ainvoke(self, state: GraphState,
+                      on_step: Optional[Callable[[str, GraphState], Awaitable[None]]] = None) -> GraphState:
+        """그래프 실행
+
+        한 단계에서 실행 가능한 노드들은 asyncio.gather로 동시에 실행되며,
+        fan-out된 분기는 각자 상태 사본을 가집니다.
+
+        Args:
+            state: 초기 상태
+            on_step: 노드 실행이 끝날 때마다 (노드 이름, 상태)로 호출되는 콜백
+
+        Returns:
+            최종 상태 (여러 분기가 END에 도달하면 병합된 상태)
+
+        Raises:
+            RuntimeError: 최대 단계 수를 넘은 경우
+        """
+        if self.entry_point is None:
+            raise RuntimeError("Graph has no entry point")
+
+        frontier: List[Tuple[str, GraphState]] = [(self.entry_point, state)]
+        pending: Dict[str, Dict[str, GraphState]] = defaultdict(dict)
+        finished: List[GraphState] = []
+        steps = 0
+
+        while frontier:
+            steps += 1
+            if steps > self.max_steps:
+                raise RuntimeError(f"Graph exceeded {self.max_steps} steps")
+
+            results = await asyncio.gather(*(self._run_node(name, node_state) for name, node_state in frontier))
+
+            next_frontier: List[Tuple[str, GraphState]] = []
+            for (name, _), (node_state, targets) in zip(frontier, results):
+                if on_step is not None:
+                    await on_step(name, node_state)
+
+                for index, target in enumerate(targets):
+                    # fan-out 시 첫 분기 외에는 상태 사본 사용
+                    branch_state = node_state if index == 0 else node_state.model_copy(deep=True)
+                    if target == END:
+                        finished.append(branch_state)
+                    elif target in self.joins:
+                        pending[target][name] = branch_state
+                        if set(pending[target]) >= self.joins[target]:
+                            arrived = pending.pop(target)
+                            next_frontier.append((target, self._merge(target, [arrived[s] for s in sorted(arrived)])))
+                    else:
+                        next_frontier.append((target, branch_state))
+
+            # 더 진행할 노드가 없으면 일부 분기만 도착한 join도 실행 (조건부 경로로 분기가 빠진 경우)
+            if not next_frontier and pending:
+                for target in list(pending):
+                    arrived = pending.pop(target)
+                    next_frontier.append((target, self._merge(target, [arrived[s] for s in sorted(arrived)])))
+
+            frontier = next_frontier
+
+        if not finished:
+            return state
+        return finished[0] if len(finished) == 1 else merge_states(finished)
+
+
+class StateGraph:
+    """노드와 엣지를 등록하여 워크플로우 그래프를 구성"""
+
+    def __init__(self):
+        """그래프 초기화"""
+        self.nodes: Dict[str, NodeFunction] = {}
+        self.edges: Dict[str, List[str]] = defaultdict(list)
+        self.routers: Dict[str, Router] = {}
+        self.merges: Dict[str, MergeFunction] = {}
+        self.entry_point: Optional[str] = None
+
+    def add_node(self, name: str, fn: NodeFunction, merge: Optional[MergeFunction] = None) -> "StateGraph":
+        """노드 등록
+
+        Args:
+            name: 노드 이름
+            fn: 비동기 노드 함수
+            merge: 여러 분기가 이 노드로 모일 때 사용할 병합 함수 (기본값: merge_states)
+
+        Returns:
+            메서드 체이닝을 위한 그래프 자신
+        """
+        if name == END:
+            raise ValueError(f"'{END}' is reserved")
+        self.nodes[name] = fn
+        if merge is not None:
+            self.merges[name] = merge
+        if self.entry_point is None:
+            self.entry_point = name
+        return self
+
+    def add_edge(self, source: str, target: str) -> "StateGraph":
+        """정적 엣지 등록 (같은 노드에서 여러 번 등록하면 fan-out)
+
+        Args:
+            source: 출발 노드
+            target: 도착 노드 (END 가능)
+
+        Returns:
+            메서드 체이닝을 위한 그래프 자신
+        """
+        self.edges[source].append(target)
+        return self
+
+    def add_conditional_edges(self, source: str, router: Router) -> "StateGraph":
+        """조건부 엣지 등록 (정적 엣지보다 우선)
+
+        Args:
+            source: 출발 노드
+            router: 상태를 받아 다음 노드 이름 또는 이름 목록을 반환하는 함수
+
+        Returns:
+            메서드 체이닝을 위한 그래프 자신
+        """
+        self.routers[source] = router
+        return self
+
+    def set_entry_point(self, name: str) -> "StateGraph":
+        """시작 노드 지정"""
+        self.entry_point = name
+        return self
+
+    def compile(self, max_steps: int = 100) -> CompiledGraph:
+        """그래프 검증 후 실행 가능한 형태로 변환
+
+        Args:
+            max_steps: 최대 실행 단계 수
+
+        Returns:
+            CompiledGraph 인스턴스
+
+        Raises:
+            ValueError: 등록되지 않은 노드를 참조하는 경우
+        """
+        if self.entry_point not in self.nodes:
+            raise ValueError(f"Unknown entry point: {self.entry_point}")
+        for source, targets in self.edges.items():
+            for name in [source] + targets:
+                if name != END and name not in self.nodes:
+                    raise ValueError(f"Edge references unknown node: {name}")
+        return CompiledGraph(self, max_steps=max_steps)
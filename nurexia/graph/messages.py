@@ -0,0 +1,378 @@
+"""
+대화 메시지 모델과 저장소
+긴 대화 이력을 적은 메모리로 보관하기 위해 메시지를 열(column) 단위로 저장합니다.
+역할은 1바이트 코드로, 내용은 하나의 공유 UTF-8 버퍼에 이어 붙여 보관하며
+슬라이스는 내용을 복사하지 않는 뷰로 반환합니다.
+"""
+
+from array import array
+from collections.abc import Sequence
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .tokens import count_tokens, MESSAGE_OVERHEAD_TOKENS
+
+
+class MessageRole(str, Enum):
+    """메시지 역할 정의"""
+    SYSTEM = "system"
+    USER = "user"
+    ASSISTANT = "assistant"
+    TOOL = "tool"
+
+
+# 역할 코드 <-> 역할 (저장소에는 코드만 보관)
+_ROLES = tuple(MessageRole)
+_ROLE_CODES = {role: code for code, role in enumerate(_ROLES)}
+
+
+# 메시지 metadata에서 고정 컨텍스트(매 호출 동일하게 앞에 오는 메시지)를 나타내는 키
+PINNED_KEY = "pinned"
+
+
+def stable_prefix_length(messages: Any) -> int:
+    """
+    대화 앞부분의 고정 구간 길이 반환
+
+    선두에 연속한 시스템 메시지와 metadata["pinned"]가 참인 메시지는 호출마다
+    바뀌지 않는 구간으로 보고, 컨텍스트 정리와 Provider 프롬프트 캐시에 사용합니다.
+
+    Args:
+        messages: 메시지 저장소, Message 객체 목록 또는 딕셔너리 목록
+
+    Returns:
+        고정 구간의 메시지 수
+    """
+    count = 0
+    for index in range(len(messages)):
+        if hasattr(messages, "role_at"):
+            role, metadata = messages.role_at(index), messages.metadata_at(index)
+        else:
+            message = messages[index]
+            if isinstance(message, dict):
+                role, metadata = message.get("role"), message.get("metadata") or {}
+            else:
+                role, metadata = getattr(message, "role", None), getattr(message, "metadata", None) or {}
+        if getattr(role, "value", role) != "system" and not metadata.get(PINNED_KEY):
+            break
+        count += 1
+    return count
+
+
+class Message(BaseModel):
+    """대화 메시지 모델"""
+    role: MessageRole
+    content: str
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+    # 토큰 수 캐시 (계산에 사용한 content와 함께 보관하여 내용 변경 시 재계산)
+    _token_count: Optional[int] = PrivateAttr(default=None)
+    _token_source: Optional[str] = PrivateAttr(default=None)
+
+    def token_count(self) -> int:
+        """메시지 토큰 수 추정 (메시지 오버헤드 포함, 결과 캐시)"""
+        if self._token_count is None or self._token_source is not self.content:
+            self._token_count = count_tokens(self.content) + MESSAGE_OVERHEAD_TOKENS
+            self._token_source = self.content
+        return self._token_count
+
+
+class MessageStore(Sequence):
+    """추가 전용 압축 메시지 저장소
+
+    메시지마다 객체를 두지 않고 역할 코드, 내용 오프셋, 토큰 수를 배열로,
+    내용은 공유 버퍼로 보관합니다. 메타데이터는 있는 메시지만 별도로 저장합니다.
+    인덱스로 접근하면 그 시점의 Message 스냅샷을 만들어 반환하므로,
+    반환된 객체를 수정해도 저장소에는 반영되지 않습니다.
+    """
+
+    __slots__ = ("_roles", "_offsets", "_buffer", "_tokens", "_metadata", "_converted")
+
+    def __init__(self, messages: Optional[Iterable[Any]] = None):
+        """
+        메시지 저장소 초기화
+
+        Args:
+            messages: 초기 메시지 (Message 객체 또는 {"role", "content", "metadata"} 딕셔너리)
+        """
+        self._roles = bytearray()
+        self._offsets = array("Q", [0])
+        self._buffer = bytearray()
+        # 메시지별 토큰 수 (추가 시 계산)
+        self._tokens = array("l")
+        self._metadata: Dict[int, Dict[str, Any]] = {}
+        # 형식별 변환 결과 캐시 (메시지 순서와 같은 목록, 필요한 만큼만 채움)
+        self._converted: Dict[str, List[Any]] = {}
+        if messages is not None:
+            self.extend(messages)
+
+    # --- 추가 ---
+
+    def add(self, role: Union[MessageRole, str], content: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        메시지 추가
+
+        Args:
+            role: 메시지 역할
+            content: 메시지 내용
+            metadata: 메시지 메타데이터 (비어 있으면 저장하지 않음)
+        """
+        self._roles.append(_ROLE_CODES[MessageRole(role)])
+        self._buffer += content.encode("utf-8")
+        self._offsets.append(len(self._buffer))
+        self._tokens.append(count_tokens(content) + MESSAGE_OVERHEAD_TOKENS)
+        if metadata:
+            self._metadata[len(self._roles) - 1] = metadata
+
+    def append(self, message: Any):
+        """
+        Message 객체 또는 딕셔너리 추가
+
+        Args:
+            message: 추가할 메시지
+        """
+        if isinstance(message, dict):
+            self.add(message["role"], message["content"], message.get("metadata"))
+        else:
+            self.add(message.role, message.content, message.metadata)
+
+    def extend(self, messages: Iterable[Any]):
+        """여러 메시지 추가"""
+        if isinstance(messages, (MessageStore, MessageView)):
+            for i in range(len(messages)):
+                self.add(messages.role_at(i), messages.content_at(i), messages.metadata_at(i))
+            return
+        for message in messages:
+            self.append(message)
+
+    def truncate(self, length: int):
+        """
+        length 이후의 메시지 제거 (이력 되돌리기/초기화용)
+
+        Args:
+            length: 남길 메시지 수
+        """
+        if length >= len(self._roles):
+            return
+        length = max(0, length)
+        del self._roles[length:]
+        del self._buffer[self._offsets[length]:]
+        del self._offsets[length + 1:]
+        del self._tokens[length:]
+        self._metadata = {i: m for i, m in self._metadata.items() if i < length}
+        for converted in self._converted.values():
+            del converted[length:]
+
+    def clear(self):
+        """모든 메시지 제거"""
+        self.truncate(0)
+
+    # --- 조회 ---
+
+    def __len__(self) -> int:
+        return len(self._roles)
+
+    def _index(self, index: int) -> int:
+        """음수 인덱스를 포함한 인덱스 정규화"""
+        size = len(self._roles)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("message index out of range")
+        return index
+
+    def role_at(self, index: int) -> MessageRole:
+        """index 번째 메시지의 역할"""
+        return _ROLES[self._roles[self._index(index)]]
+
+    def content_at(self, index: int) -> str:
+        """index 번째 메시지의 내용"""
+        index = self._index(index)
+        with memoryview(self._buffer) as view:
+            return str(view[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def metadata_at(self, index: int) -> Dict[str, Any]:
+        """index 번째 메시지의 메타데이터 (없으면 빈 딕셔너리)"""
+        return self._metadata.get(self._index(index), {})
+
+    def token_count_at(self, index: int) -> int:
+        """index 번째 메시지의 토큰 수 (메시지 오버헤드 포함)"""
+        return self._tokens[self._index(index)]
+
+    def token_counts(self, start: int = 0, stop: Optional[int] = None) -> List[int]:
+        """start부터 stop 전까지 메시지의 토큰 수 목록"""
+        stop = len(self._roles) if stop is None else stop
+        return self._tokens[start:stop].tolist()
+
+    def converted(self, key: str, convert: Callable[[MessageRole, str], Any],
+                  start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        """
+        메시지 변환 결과 반환 (형식별로 메시지마다 한 번만 변환)
+
+        이전 호출 이후 추가된 메시지만 변환하므로, 매 턴 전체 이력을 넘겨도
+        변환 비용은 새 메시지 수에 비례합니다.
+
+        Args:
+            key: 변환 형식 이름 (같은 key에는 같은 convert를 사용해야 함)
+            convert: (역할, 내용)을 받아 변환 결과를 반환하는 함수
+            start: 시작 인덱스
+            stop: 끝 인덱스 (포함하지 않음, 기본값: 끝까지)
+
+        Returns:
+            start부터 stop 전까지의 변환 결과 목록
+        """
+        stop = len(self._roles) if stop is None else stop
+        cache = self._converted.setdefault(key, [])
+        for index in range(len(cache), stop):
+            cache.append(convert(_ROLES[self._roles[index]], self.content_at(index)))
+        return cache[start:stop]
+
+    def _message(self, index: int) -> Message:
+        """index 번째 메시지의 Message 스냅샷 생성 (검증 생략)"""
+        message = Message.model_construct(
+            role=_ROLES[self._roles[index]],
+            content=self.content_at(index),
+            metadata=dict(self._metadata.get(index, {}))
+        )
+        message._token_count, message._token_source = self._tokens[index], message.content
+        return message
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._roles))
+            if step != 1:
+                return [self._message(i) for i in range(start, stop, step)]
+            return MessageView(self, start, max(start, stop))
+        return self._message(self._index(index))
+
+    def __iter__(self) -> Iterator[Message]:
+        for index in range(len(self._roles)):
+            yield self._message(index)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MessageStore):
+            return (self._roles == other._roles and self._offsets == other._offsets
+                    and self._buffer == other._buffer and self._metadata == other._metadata)
+        if isinstance(other, (list, tuple, MessageView)):
+            return len(self) == len(other) and all(
+                (a.role, a.content) == (b.role, b.content) for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessageStore({len(self)} messages, {len(self._buffer)} bytes)"
+
+    @property
+    def nbytes(self) -> int:
+        """내용 버퍼와 인덱스 배열이 차지하는 바이트 수 (메타데이터 제외)"""
+        return (len(self._buffer) + len(self._roles)
+                + self._offsets.itemsize * len(self._offsets) + self._tokens.itemsize * len(self._tokens))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """직렬화용 딕셔너리 목록으로 변환"""
+        return [
+            {"role": self.role_at(i).value, "content": self.content_at(i), "metadata": self.metadata_at(i)}
+            for i in range(len(self))
+        ]
+
+    # --- 복사 ---
+
+    def copy(self) -> "MessageStore":
+        """저장소 복사 (버퍼 단위 복사이므로 메시지 수와 무관하게 빠름)"""
+        clone = MessageStore.__new__(MessageStore)
+        clone._roles = bytearray(self._roles)
+        clone._offsets = array("Q", self._offsets)
+        clone._buffer = bytearray(self._buffer)
+        clone._tokens = array("l", self._tokens)
+        clone._metadata = {i: dict(m) for i, m in self._metadata.items()}
+        clone._converted = {key: list(items) for key, items in self._converted.items()}
+        return clone
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "MessageStore":
+        return self.copy()
+
+    # --- pydantic 연동 ---
+
+    @classmethod
+    def _validate(cls, value: Any) -> "MessageStore":
+        """pydantic 필드 값 검증 (목록이면 저장소로 변환)"""
+        if isinstance(value, MessageStore):
+            return value
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            raise ValueError("messages must be a MessageStore or a list of messages")
+        return cls(value)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any):
+        from pydantic_core import core_schema
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda store: store.to_list())
+        )
+
+
+class MessageView(Sequence):
+    """MessageStore의 연속 구간을 복사 없이 가리키는 뷰
+
+    저장소는 추가 전용이므로 뷰를 만든 뒤 메시지가 추가되어도 뷰의 내용은 바뀌지 않습니다.
+    (truncate/clear로 뷰 범위가 제거된 경우는 제외)
+    """
+
+    __slots__ = ("_store", "_start", "_stop")
+
+    def __init__(self, store: MessageStore, start: int, stop: int):
+        self._store = store
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def _index(self, index: int) -> int:
+        """뷰 인덱스를 저장소 인덱스로 변환"""
+        size = self._stop - self._start
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("message index out of range")
+        return self._start + index
+
+    def role_at(self, index: int) -> MessageRole:
+        return self._store.role_at(self._index(index))
+
+    def content_at(self, index: int) -> str:
+        return self._store.content_at(self._index(index))
+
+    def metadata_at(self, index: int) -> Dict[str, Any]:
+        return self._store.metadata_at(self._index(index))
+
+    def token_count_at(self, index: int) -> int:
+        return self._store.token_count_at(self._index(index))
+
+    def token_counts(self, start: int = 0, stop: Optional[int] = None) -> List[int]:
+        stop = len(self) if stop is None else stop
+        return self._store.token_counts(self._start + start, self._start + stop)
+
+    def converted(self, key: str, convert: Callable[[MessageRole, str], Any],
+                  start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        stop = len(self) if stop is None else stop
+        return self._store.converted(key, convert, self._start + start, self._start + stop)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self._store._message(self._start + i) for i in range(start, stop, step)]
+            return MessageView(self._store, self._start + start, self._start + max(start, stop))
+        return self._store._message(self._index(index))
+
+    def __iter__(self) -> Iterator[Message]:
+        for index in range(self._start, self._stop):
+            yield self._store._message(index)
+
+    def __repr__(self) -> str:
+        return f"MessageView({self._start}:{self._stop} of {self._store!r})"
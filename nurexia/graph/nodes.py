@@ -0,0 +1,156 @@
+"""
+그래프 노드 정의
+워크플로우를 구성하는 비동기 노드 함수들을 제공합니다.
+"""
+
+from typing import Any, Dict, List, Optional
+import asyncio
+
+from .. import metrics
+from ..providers import get_provider
+from .engine import END
+from .state import GraphState, MessageRole
+
+
+async def start_node(state: GraphState) -> GraphState:
+    """시작 노드 - 입력 검증"""
+    if not state.messages:
+        state.error = "No input provided"
+    elif not any(msg.role == MessageRole.USER for msg in state.messages):
+        state.error = "No user messages found"
+    return state
+
+
+def route_after_start(next_node):
+    """시작 노드 이후 경로 - 오류가 있으면 종료, 없으면 next_node(들)로 이동"""
+    def router(state: GraphState):
+        return END if state.error else next_node
+    return router
+
+
+# 작업 디렉터리 코드 조각을 프롬프트에 추가하는 모드
+RETRIEVAL_MODES = {"agent", "edit"}
+
+
+async def retrieve_node(state: GraphState) -> GraphState:
+    """검색 노드 - agent/edit 모드에서 마지막 사용자 메시지와 관련된 작업 디렉터리 코드 조각 검색
+
+    결과는 metadata["workspace_context"](프롬프트용 텍스트)와 metadata["retrieval"](조각 위치와 점수)에
+    기록되며, 검색에 실패해도 응답 생성은 계속합니다.
+    """
+    from ..workspace import search_workspace, format_snippets
+
+    state.metadata.pop("workspace_context", None)
+    if state.mode not in RETRIEVAL_MODES or not state.messages:
+        return state
+    query = next(
+        (state.messages.content_at(i) for i in range(len(state.messages) - 1, -1, -1)
+         if state.messages.role_at(i) == MessageRole.USER),
+        None
+    )
+    if not query:
+        return state
+
+    loop = asyncio.get_running_loop()
+    errors: List[str] = []
+    try:
+        with metrics.span("retrieve"):
+            snippets = await loop.run_in_executor(None, search_workspace, state.working_directory, query, None, errors)
+    except Exception as e:
+        state.metadata["retrieval"] = {"error": f"{type(e).__name__}: {e}"}
+        return state
+
+    state.metadata["retrieval"] = {
+        "snippets": [{key: snippet[key] for key in ("path", "start_line", "end_line", "score")} for snippet in snippets]
+    }
+    if errors:
+        state.metadata["retrieval"]["errors"] = errors
+    workspace_context = format_snippets(snippets)
+    if workspace_context:
+        state.metadata["workspace_context"] = workspace_context
+    return state
+
+
+async def _generate(state: GraphState, provider: str, model: Optional[str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Provider를 호출하여 상태의 대화 이력에 대한 응답 생성 (계측 포함)"""
+    with metrics.measure_call(state) as call:
+        call.provider, call.model = provider, model
+        with metrics.span("get_provider"):
+            provider_instance = get_provider(provider, model, **options)
+        with metrics.span("context"):
+            messages = state.get_context_messages()
+        response = await provider_instance.chat(messages)
+        metrics.mark_first_token()
+    return response
+
+
+async def chat_node(state: GraphState) -> GraphState:
+    """대화 노드 - 선택된 Provider로 응답을 생성하여 상태에 추가"""
+    try:
+        response = await _generate(state, state.provider, state.model, state.options)
+    except Exception as e:
+        state.error = f"{type(e).__name__}: {e}"
+        return state
+
+    state.result = response["content"]
+    state.metadata["response"] = response.get("metadata", {})
+    if "race" in state.metadata["response"]:
+        state.metadata["race"] = state.metadata["response"]["race"]
+    if "cascade" in state.metadata["response"]:
+        state.metadata["cascade"] = state.metadata["response"]["cascade"]
+    state.add_message(MessageRole.ASSISTANT, state.result)
+    return state
+
+
+def make_provider_node(provider: str, model: Optional[str] = None, options: Optional[Dict[str, Any]] = None):
+    """특정 Provider/모델로 응답을 생성하는 분기 노드 생성
+
+    fan-out 분기에서 사용하며, 응답은 대화 이력이 아닌
+    metadata["branch_results"]에 기록되어 병합 노드에서 합쳐집니다.
+
+    Args:
+        provider: Provider 이름
+        model: 모델명 (None이면 Provider 기본 모델)
+        options: 생성 옵션 (None이면 상태의 옵션 사용)
+
+    Returns:
+        비동기 노드 함수
+    """
+    label = f"{provider}/{model}" if model else provider
+
+    async def provider_node(state: GraphState) -> GraphState:
+        try:
+            response = await _generate(state, provider, model, options if options is not None else state.options)
+            entry = {"content": response["content"], "metadata": response.get("metadata", {})}
+        except Exception as e:
+            entry = {"content": None, "error": f"{type(e).__name__}: {e}"}
+        state.metadata.setdefault("branch_results", {})[label] = entry
+        return state
+
+    provider_node.__name__ = f"provider_node[{label}]"
+    return provider_node
+
+
+async def merge_results_node(state: GraphState) -> GraphState:
+    """병합 노드 - 분기별 응답을 하나의 결과로 합침"""
+    branch_results = state.metadata.get("branch_results", {})
+    succeeded = {label: entry for label, entry in branch_results.items() if entry.get("content") is not None}
+
+    if not succeeded:
+        errors = "; ".join(f"{label}: {entry.get('error')}" for label, entry in branch_results.items())
+        state.error = f"All branches failed ({errors})" if errors else "No branch results"
+        return state
+
+    if len(succeeded) == 1:
+        state.result = next(iter(succeeded.values()))["content"]
+    else:
+        sections: List[str] = [f"### {label}\n\n{entry['content']}" for label, entry in succeeded.items()]
+        state.result = "\n\n".join(sections)
+
+    state.add_message(MessageRole.ASSISTANT, state.result)
+    return state
+
+
+async def end_node(state: GraphState) -> GraphState:
+    """종료 노드 - 결과 반환"""
+    return state
@@ -7,20 +7,7 @@ from typing import Dict, List, Any, Optional
 from enum import Enum
 from pydantic import BaseModel, Field
 
-
-class MessageRole(str, Enum):
-    """메시지 역할 정의"""
-    SYSTEM = "system"
-    USER = "user"
-    ASSISTANT = "assistant"
-    TOOL = "tool"
-
-
-class Message(BaseModel):
-    """대화 메시지 모델"""
-    role: MessageRole
-    content: str
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+from .messages import MessageRole, Message, MessageStore, MessageView
 
 
 class Action(BaseModel):
@@ -38,7 +25,7 @@ class ExecutionMode(str, Enum):
 
 class GraphState(BaseModel):
     """LangGraph 워크플로우 상태 모델"""
-    messages: List[Message] = Field(default_factory=list)
+    messages: MessageStore = Field(default_factory=MessageStore)
     current_node: str = "input"
     mode: str = "chat"
     action: Optional[Action] = None
@@ -52,18 +39,42 @@ class GraphState(BaseModel):
 
     def add_message(self, role: MessageRole, content: str, **kwargs):
         """메시지 추가"""
-        self.messages.append(
-            Message(
-                role=role,
-                content=content,
-                metadata=kwargs
-            )
-        )
+        self.messages.add(role, content, kwargs)
 
-    def get_conversation_history(self) -> List[Message]:
-        """대화 이력 반환"""
+    def get_conversation_history(self) -> MessageStore:
+        """대화 이력 반환 (인덱스 접근 시 Message, 슬라이스 시 복사 없는 뷰)"""
         return self.messages
 
+    def get_context_messages(self) -> List[Message]:
+        """모델 컨텍스트 한도에 맞게 정리된 대화 이력 반환
+
+        컨텍스트 한도는 Provider 메타데이터에서 가져오며, options의
+        max_context_tokens, max_output_tokens, context_strategy(trim/summarize)로
+        조정할 수 있습니다. 정리 결과는 metadata["context"]에 기록됩니다.
+
+        metadata["workspace_context"]에 작업 디렉터리 검색 결과가 있으면 그만큼의
+        토큰을 남겨 두고 마지막 사용자 메시지 앞에 붙입니다 (대화 이력에는 저장하지 않음).
+        """
+        from .context import ContextWindowManager
+        from .tokens import count_tokens
+
+        manager = ContextWindowManager.for_model(self.provider, self.model, self.options)
+        workspace_context = self.metadata.get("workspace_context")
+        if workspace_context:
+            manager.reserve_output_tokens += count_tokens(workspace_context)
+        messages = manager.fit(
+            self.messages,
+            make_summary_message=lambda summary: Message(role=MessageRole.SYSTEM, content=summary)
+        )
+        self.metadata["context"] = manager.last_stats
+
+        if workspace_context and messages and messages[-1].role == MessageRole.USER:
+            last = messages[-1]
+            messages = list(messages[:-1])
+            messages.append(Message(role=MessageRole.USER, content=f"{workspace_context}\n\n{last.content}",
+                                    metadata=last.metadata))
+        return messages
+
     def set_action(self, name: str, **kwargs):
         """액션 설정"""
         self.action = Action(name=name, args=kwargs)
@@ -0,0 +1,46 @@
+"""
+토큰 수 추정 유틸리티
+모델별 토크나이저 없이 컨텍스트 예산 계산에 쓸 보수적인 추정치를 제공합니다.
+"""
+
+from typing import Any
+
+# 메시지마다 역할/구분자 등에 소비되는 토큰 수
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def count_tokens(text: str) -> int:
+    """텍스트의 토큰 수 추정
+
+    ASCII 문자는 4자당 1토큰, 한글/한자 등 비ASCII 문자는 1자당 1토큰으로 계산합니다.
+    실제 토크나이저보다 약간 크게 잡히도록 설계된 근사치입니다.
+
+    Args:
+        text: 토큰 수를 셀 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    if text.isascii():
+        return (len(text) + 3) // 4
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    ascii_count = len(text) - non_ascii
+    return (ascii_count + 3) // 4 + non_ascii
+
+
+def count_message_tokens(message: Any) -> int:
+    """메시지 하나의 토큰 수 추정 (Message 객체는 캐시된 값 사용)
+
+    Args:
+        message: Message 객체 또는 {"role", "content"} 딕셔너리
+
+    Returns:
+        추정 토큰 수 (메시지 오버헤드 포함)
+    """
+    token_count = getattr(message, "token_count", None)
+    if callable(token_count):
+        return token_count()
+    content = message.get("content", "") if isinstance(message, dict) else getattr(message, "content", "")
+    return count_tokens(content or "") + MESSAGE_OVERHEAD_TOKENS
@@ -1,67 +1,71 @@
 """
 LangGraph 워크플로우 정의
-간단한 3단계 워크플로우(start → tmp_helloworld → end)를 구현합니다.
+그래프 엔진(StateGraph) 위에 기본 워크플로우(start → retrieve → chat → end)와
+여러 Provider에 동시에 질의하는 fan-out/fan-in 워크플로우를 구성합니다.
 """
 
-from typing import Dict, Any, Tuple
-import asyncio
-
-from .state import GraphState, MessageRole
-
-
-async def start_node(state: GraphState) -> Tuple[GraphState, str]:
-    """시작 노드 - 워크플로우의 시작점"""
-    # 입력을 받거나 초기 상태를 설정
-    if state.messages:
-        return state, "tmp_helloworld"
-    else:
-        state.error = "No input provided"
-        return state, "end"
-
-
-async def tmp_helloworld_node(state: GraphState) -> Tuple[GraphState, str]:
-    """중간 처리 노드 - 'Hello World' 메시지 처리"""
-    # 사용자 메시지 처리
-    user_messages = [msg for msg in state.messages if msg.role == MessageRole.USER]
-
-    if not user_messages:
-        state.error = "No user messages found"
-        return state, "end"
-
-    # Provider를 사용하여 응답 생성 (예시)
-    user_input = user_messages[-1].content
-
-    # 간단한 처리 로직
-    state.result = f"Hello, World! 입력받은 메시지: {user_input}"
-
-    # 응답을 상태에 추가
-    state.add_message(MessageRole.ASSISTANT, state.result)
-
-    return state, "end"
-
-
-async def end_node(state: GraphState) -> GraphState:
-    """종료 노드 - 결과 반환"""
-    # 최종 결과 처리
-    return state
-
-
-def create_workflow():
-    """LangGraph 워크플로우 생성 - 간단한 3단계 구조"""
-    # 간단한 비동기 함수로 구현된 워크플로우
-    class SimpleWorkflow:
-        async def ainvoke(self, state: GraphState) -> GraphState:
-            # 시작 노드
-            state, next_node = await start_node(state)
-
-            # 다음 노드 실행
-            if next_node == "tmp_helloworld":
-                state, next_node = await tmp_helloworld_node(state)
-
-            # 종료 노드
-            if next_node == "end":
-                state = await end_node(state)
-
-            return state
-
-    return SimpleWorkflow()
\ No newline at end of file
+from typing import List, Optional, Tuple
+
+from .engine import END, StateGraph, CompiledGraph
+from .nodes import (
+    start_node,
+    route_after_start,
+    retrieve_node,
+    chat_node,
+    make_provider_node,
+    merge_results_node,
+    end_node,
+)
+
+
+def create_workflow() -> CompiledGraph:
+    """기본 워크플로우 생성 - start → retrieve → chat → end
+
+    retrieve 노드는 agent/edit 모드에서만 작업 디렉터리 코드 조각을 검색합니다.
+    """
+    graph = StateGraph()
+    graph.add_node("start", start_node)
+    graph.add_node("retrieve", retrieve_node)
+    graph.add_node("chat", chat_node)
+    graph.add_node("end", end_node)
+
+    graph.set_entry_point("start")
+    graph.add_conditional_edges("start", route_after_start("retrieve"))
+    graph.add_edge("retrieve", "chat")
+    graph.add_edge("chat", "end")
+    graph.add_edge("end", END)
+
+    return graph.compile()
+
+
+def create_multi_provider_workflow(targets: List[Tuple[str, Optional[str]]]) -> CompiledGraph:
+    """여러 Provider/모델에 동시에 질의하고 결과를 합치는 워크플로우 생성
+
+    start → retrieve → (provider 분기들을 동시에 실행) → merge → end
+
+    Args:
+        targets: (Provider 이름, 모델명) 목록
+
+    Returns:
+        CompiledGraph 인스턴스
+    """
+    graph = StateGraph()
+    graph.add_node("start", start_node)
+    graph.add_node("retrieve", retrieve_node)
+    branch_names = []
+    for index, (provider, model) in enumerate(targets):
+        name = f"branch_{index}"
+        graph.add_node(name, make_provider_node(provider, model))
+        graph.add_edge(name, "merge")
+        branch_names.append(name)
+    graph.add_node("merge", merge_results_node)
+    graph.add_node("end", end_node)
+
+    graph.set_entry_point("start")
+    graph.add_conditional_edges("start", route_after_start("retrieve"))
+    for name in branch_names:
+        graph.add_edge("retrieve", name)
+    graph.add_edge("merge", "end")
+    graph.add_edge("end", END)
+
+    return graph.compile()
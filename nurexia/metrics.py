@@ -0,0 +1,337 @@
+"""
+요청 단위 지연 시간 및 토큰 사용량 계측 모듈.
+Provider 생성, 클라이언트 생성, 메시지 변환, 첫 토큰까지의 시간(TTFT),
+전체 생성 시간과 토큰 사용량을 호출마다 기록하고 설정된 싱크로 내보냅니다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional
+import json
+import os
+import threading
+import time
+import warnings
+
+from .config import config_manager
+
+# 현재 실행 중인 호출의 계측 정보 (asyncio 태스크별로 분리됨)
+_current_metrics: ContextVar[Optional["CallMetrics"]] = ContextVar("nurexia_call_metrics", default=None)
+
+# 히스토그램 버킷 경계 (밀리초)
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class CallMetrics:
+    """호출 하나의 단계별 소요 시간과 토큰 사용량"""
+
+    def __init__(self, provider: str, model: Optional[str]):
+        """
+        계측 정보 초기화
+
+        Args:
+            provider: Provider 이름
+            model: 모델명
+        """
+        self.provider = provider
+        self.model = model
+        self.started = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.usage: Dict[str, int] = {}
+        self.first_token_ms: Optional[float] = None
+        self.total_ms: Optional[float] = None
+
+    def add_timing(self, name: str, elapsed_ms: float):
+        """단계 소요 시간 누적 (밀리초)"""
+        self.timings[name] = self.timings.get(name, 0.0) + elapsed_ms
+
+    def increment(self, name: str, amount: int = 1):
+        """카운터 증가"""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def mark_first_token(self):
+        """첫 토큰 수신 시각 기록 (최초 1회)"""
+        if self.first_token_ms is None:
+            self.first_token_ms = (time.perf_counter() - self.started) * 1000
+
+    def record_usage(self, usage: Optional[Dict[str, Any]]):
+        """
+        토큰 사용량 누적
+
+        Args:
+            usage: input_tokens, output_tokens, total_tokens 등을 포함한 딕셔너리.
+                input_token_details의 프롬프트 캐시 항목은 cache_read_tokens,
+                cache_creation_tokens로 기록
+        """
+        usage = dict(usage or {})
+        details = usage.pop("input_token_details", None) or {}
+        for name in ("cache_read", "cache_creation"):
+            if isinstance(details.get(name), int):
+                usage[f"{name}_tokens"] = details[name]
+        for key, value in usage.items():
+            if isinstance(value, int):
+                self.usage[key] = self.usage.get(key, 0) + value
+
+    def finish(self):
+        """전체 소요 시간 확정"""
+        if self.total_ms is None:
+            self.total_ms = (time.perf_counter() - self.started) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화 가능한 딕셔너리로 변환"""
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "timings_ms": {name: round(value, 3) for name, value in self.timings.items()},
+            "first_token_ms": None if self.first_token_ms is None else round(self.first_token_ms, 3),
+            "total_ms": None if self.total_ms is None else round(self.total_ms, 3),
+            "counters": dict(self.counters),
+            "usage": dict(self.usage),
+        }
+
+
+def current_metrics() -> Optional[CallMetrics]:
+    """현재 호출의 계측 정보 반환 (계측 중이 아니면 None)"""
+    return _current_metrics.get()
+
+
+@contextmanager
+def span(name: str):
+    """
+    현재 호출의 단계 소요 시간 측정 (계측 중이 아니면 아무것도 하지 않음)
+
+    Args:
+        name: 단계 이름
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add_timing(name, (time.perf_counter() - started) * 1000)
+
+
+def increment(name: str, amount: int = 1):
+    """현재 호출의 카운터 증가"""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.increment(name, amount)
+
+
+def mark_first_token():
+    """현재 호출의 첫 토큰 수신 기록"""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.mark_first_token()
+
+
+def record_usage_from(response: Any):
+    """
+    LangChain 응답(또는 청크)의 usage_metadata를 현재 호출에 기록
+
+    Args:
+        response: usage_metadata 속성을 가질 수 있는 응답 객체
+    """
+    metrics = _current_metrics.get()
+    usage = getattr(response, "usage_metadata", None)
+    if metrics is not None and usage:
+        metrics.record_usage(dict(usage))
+
+
+@contextmanager
+def measure_call(state: Any):
+    """
+    워크플로우 상태에 대한 호출 하나를 계측
+
+    블록 안에서 수행되는 Provider 호출의 단계별 시간이 수집되며, 블록을 벗어나면
+    결과를 state.metadata["metrics"]에 추가하고 설정된 싱크로 내보냅니다.
+
+    Args:
+        state: provider, model, metadata 속성을 가진 GraphState
+
+    Yields:
+        CallMetrics 인스턴스
+    """
+    metrics = CallMetrics(state.provider, state.model)
+    token = _current_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        try:
+            _current_metrics.reset(token)
+        except ValueError:
+            # 비동기 제너레이터가 다른 컨텍스트에서 정리되는 경우
+            pass
+        metrics.finish()
+        record = metrics.to_dict()
+        state.metadata.setdefault("metrics", []).append(record)
+        emit_metrics(record)
+
+
+class JsonLinesSink:
+    """호출마다 JSON 한 줄을 파일에 추가하는 싱크"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]):
+        line = json.dumps({"ts": time.time(), **record}, ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class InMemoryHistogramSink:
+    """단계별 소요 시간을 메모리 히스토그램으로 집계하는 싱크"""
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        # (metric, provider, model) -> {"buckets": [...], "count": n, "sum": ms}
+        self.histograms: Dict[tuple, Dict[str, Any]] = {}
+        self.token_totals: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def _observe(self, metric: str, labels: tuple, value_ms: float):
+        key = (metric,) + labels
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = {"buckets": [0] * len(self.buckets_ms), "count": 0, "sum": 0.0}
+        for i, bound in enumerate(self.buckets_ms):
+            if value_ms <= bound:
+                histogram["buckets"][i] += 1
+        histogram["count"] += 1
+        histogram["sum"] += value_ms
+
+    def emit(self, record: Dict[str, Any]):
+        labels = (record["provider"], record["model"] or "")
+        with self._lock:
+            for name, value in record["timings_ms"].items():
+                self._observe(name, labels, value)
+            if record["first_token_ms"] is not None:
+                self._observe("first_token", labels, record["first_token_ms"])
+            if record["total_ms"] is not None:
+                self._observe("total", labels, record["total_ms"])
+            for name, value in record["usage"].items():
+                key = (name,) + labels
+                self.token_totals[key] = self.token_totals.get(key, 0) + value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 집계 결과 반환 (단계별 건수, 평균, 버킷)"""
+        with self._lock:
+            return {
+                "/".join(key): {
+                    "count": h["count"],
+                    "mean_ms": h["sum"] / h["count"] if h["count"] else 0.0,
+                    "buckets": dict(zip(self.buckets_ms, h["buckets"])),
+                }
+                for key, h in self.histograms.items()
+            }
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 변환"""
+        lines: List[str] = [
+            "# HELP nurexia_phase_seconds Per-call phase latency",
+            "# TYPE nurexia_phase_seconds histogram",
+        ]
+        with self._lock:
+            for (metric, provider, model), h in sorted(self.histograms.items()):
+                labels = f'phase="{metric}",provider="{provider}",model="{model}"'
+                for bound, count in zip(self.buckets_ms, h["buckets"]):
+                    lines.append(f'nurexia_phase_seconds_bucket{{{labels},le="{bound / 1000:g}"}} {count}')
+                lines.append(f'nurexia_phase_seconds_bucket{{{labels},le="+Inf"}} {h["count"]}')
+                lines.append(f"nurexia_phase_seconds_sum{{{labels}}} {h['sum'] / 1000:.6f}")
+                lines.append(f"nurexia_phase_seconds_count{{{labels}}} {h['count']}")
+            lines.append("# HELP nurexia_tokens_total Token usage reported by providers")
+            lines.append("# TYPE nurexia_tokens_total counter")
+            for (kind, provider, model), value in sorted(self.token_totals.items()):
+                lines.append(f'nurexia_tokens_total{{kind="{kind}",provider="{provider}",model="{model}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+class PrometheusTextSink(InMemoryHistogramSink):
+    """집계 결과를 Prometheus 텍스트 파일(node_exporter textfile 등)로 기록하는 싱크"""
+
+    def __init__(self, path: str, buckets_ms=DEFAULT_BUCKETS_MS):
+        super().__init__(buckets_ms)
+        self.path = path
+
+    def emit(self, record: Dict[str, Any]):
+        super().emit(record)
+        # 읽는 쪽이 중간 상태를 보지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(temp_path, self.path)
+
+
+# 설정된 싱크 (최초 사용 시 생성)
+_sink = None
+_sink_configured = False
+
+
+def create_sink(spec: Optional[str]):
+    """
+    싱크 설정 문자열로 싱크 생성
+
+    Args:
+        spec: "jsonl:<경로>", "prometheus:<경로>", "memory" 또는 None
+
+    Returns:
+        싱크 인스턴스 (spec이 비어 있으면 None)
+
+    Raises:
+        ValueError: 알 수 없는 싱크 형식
+    """
+    if not spec:
+        return None
+    kind, _, target = spec.partition(":")
+    if kind == "jsonl" and target:
+        return JsonLinesSink(os.path.expanduser(target))
+    if kind == "prometheus" and target:
+        return PrometheusTextSink(os.path.expanduser(target))
+    if kind == "memory":
+        return InMemoryHistogramSink()
+    raise ValueError(f"알 수 없는 메트릭 싱크: {spec}")
+
+
+def get_metrics_sink():
+    """설정(NUREXIA_METRICS)에 따른 싱크 반환"""
+    global _sink, _sink_configured
+    if not _sink_configured:
+        _sink = create_sink(config_manager.metrics_sink)
+        _sink_configured = True
+    return _sink
+
+
+def emit_metrics(record: Dict[str, Any]):
+    """
+    설정된 싱크로 호출 기록 내보내기
+
+    계측 실패가 요청을 실패시키지 않도록, 싱크를 만들거나 기록하다 오류가 나면
+    한 번만 경고하고 이후에는 싱크를 비활성화합니다.
+
+    Args:
+        record: CallMetrics.to_dict() 결과
+    """
+    try:
+        sink = get_metrics_sink()
+        if sink is not None:
+            sink.emit(record)
+    except Exception as e:
+        warnings.warn(f"메트릭 싱크를 비활성화합니다 ({type(e).__name__}: {e})", RuntimeWarning, stacklevel=2)
+        set_metrics_sink(None)
+
+
+def set_metrics_sink(sink):
+    """
+    싱크 교체 (프로그램에서 직접 지정할 때 사용)
+
+    Args:
+        sink: emit(record) 메서드를 가진 객체 또는 None
+    """
+    global _sink, _sink_configured
+    _sink = sink
+    _sink_configured = True
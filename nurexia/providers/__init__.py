@@ -2,22 +2,19 @@
 AI Provider 모듈.
 Provider 팩토리 및 관리 기능 제공.
 """
-from typing import Dict, Type, Optional, List, Any
+from typing import Dict, Optional, Any
 
 from .base import BaseProvider
-from .anthropic import AnthropicProvider
-from .openai import OpenAIProvider
-from .google import GoogleProvider
-from .huggingface import HuggingFaceProvider
-from .ollama import OllamaProvider
+from .registry import PROVIDER_CATALOG, LazyProvider
+from .cache import CachedProvider
+from .scheduler import ScheduledProvider
+from .hedge import HedgedProvider, parse_race_target
+from .cascade import CascadeProvider
 
-# Provider 등록
+# Provider 등록 (구현 모듈과 SDK는 최초 사용 시 import)
 PROVIDERS = {
-    "anthropic": AnthropicProvider,
-    "openai": OpenAIProvider,
-    "google": GoogleProvider,
-    "huggingface": HuggingFaceProvider,
-    "ollama": OllamaProvider,
+    name: LazyProvider(name, **spec)
+    for name, spec in PROVIDER_CATALOG.items()
 }
 
 def get_provider(provider_name: str, model: Optional[str] = None, **kwargs) -> BaseProvider:
@@ -27,7 +24,15 @@ def get_provider(provider_name: str, model: Optional[str] = None, **kwargs) -> B
     Args:
         provider_name: Provider 이름
         model: 사용할 모델명 (기본값: None, Provider 기본 모델 사용)
-        **kwargs: 추가 옵션
+        **kwargs: 추가 옵션 (cache=True이면 응답 캐시 적용,
+            race=["provider/model", ...]이면 해당 Provider들과 경주,
+            hedge_delay=초이면 후보를 시차를 두고 시작,
+            record="경로"이면 응답을 카세트 파일에 기록,
+            cascade=["provider/model", ...]이면 이 Provider의 응답이 판단 규칙에 걸릴 때
+            해당 Provider들로 차례로 넘김)
+
+    Note:
+        반환되는 인스턴스는 요청 스케줄러(속도 제한, 제한 시간, 재시도)가 적용된 래퍼입니다.
 
     Returns:
         BaseProvider: Provider 인스턴스
@@ -38,8 +43,42 @@ def get_provider(provider_name: str, model: Optional[str] = None, **kwargs) -> B
     if provider_name not in PROVIDERS:
         raise ValueError(f"알 수 없는 Provider: {provider_name}. 사용 가능한 Provider: {', '.join(PROVIDERS.keys())}")
 
-    provider_class = PROVIDERS[provider_name]
-    return provider_class(model=model, **kwargs)
+    use_cache = kwargs.pop("cache", False)
+    race_targets = kwargs.pop("race", None) or []
+    hedge_delay = kwargs.pop("hedge_delay", 0.0)
+    record_path = kwargs.pop("record", None)
+    cascade_targets = kwargs.pop("cascade", None) or []
+
+    # 선택된 Provider의 구현 모듈만 이 시점에 import
+    provider_class = PROVIDERS[provider_name].load()
+    provider = provider_class(model=model, **kwargs)
+
+    # 응답 기록은 스케줄러 안쪽에서 수행하여 대기/재시도를 제외한 실제 응답 시각만 기록
+    if record_path:
+        from .replay import RecordingProvider
+        provider = RecordingProvider(provider, record_path)
+
+    # 속도 제한/재시도 스케줄러 적용 (캐시 적중은 스케줄러를 거치지 않음)
+    provider = ScheduledProvider(provider)
+
+    # 경주 대상이 있으면 각 후보를 (각자의 스케줄러와 함께) 생성하여 경주
+    if race_targets:
+        candidates = [provider]
+        for target_name, target_model in map(parse_race_target, race_targets):
+            candidates.append(get_provider(target_name, target_model, record=record_path, **kwargs))
+        provider = HedgedProvider(candidates, hedge_delay=hedge_delay)
+
+    # 단계 대상이 있으면 이 Provider(초안)의 응답을 판단하여 필요할 때만 다음 단계로 넘김
+    if cascade_targets:
+        tiers = [provider]
+        for target_name, target_model in map(parse_race_target, cascade_targets):
+            tiers.append(get_provider(target_name, target_model, record=record_path, **kwargs))
+        provider = CascadeProvider(tiers)
+
+    if use_cache:
+        provider = CachedProvider(provider)
+
+    return provider
 
 def list_providers() -> Dict[str, Dict[str, Any]]:
     """
@@ -56,6 +95,7 @@ def list_providers() -> Dict[str, Dict[str, Any]]:
                 ...
             }
     """
+    # 지연 로딩 참조의 메타데이터만 읽으므로 SDK를 import하지 않음
     result = {}
     for name, provider_class in PROVIDERS.items():
         result[name] = {
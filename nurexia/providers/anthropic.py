@@ -6,22 +6,31 @@ import os
 import json
 
 from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 
 from .base import BaseProvider
+from .. import metrics
+from .registry import PROVIDER_CATALOG
+
+# 프롬프트 캐시 구간의 끝을 표시하는 Anthropic 캐시 제어 블록
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _with_cache_breakpoint(message: Any) -> Any:
+    """메시지의 마지막 내용 블록에 cache_control을 지정한 사본 반환"""
+    content = message.content
+    blocks = [{"type": "text", "text": content}] if isinstance(content, str) else list(content)
+    blocks[-1] = {**blocks[-1], "cache_control": CACHE_CONTROL}
+    return message.model_copy(update={"content": blocks})
+
 
 class AnthropicProvider(BaseProvider):
     """Anthropic Claude API Provider"""
     name = "anthropic"
-    default_model = "claude-3-7-sonnet-20250219"
-    available_models = [
-        "claude-3-haiku-20240307",
-        "claude-3-sonnet-20240229",
-        "claude-3-opus-20240229",
-        "claude-3-5-sonnet-20240620",
-        "claude-3-7-sonnet-20250219"
-    ]
+    default_model = PROVIDER_CATALOG["anthropic"]["default_model"]
+    available_models = PROVIDER_CATALOG["anthropic"]["available_models"]
     supports_streaming = True  # 스트리밍 지원 활성화
+    supports_async = True  # 네이티브 비동기 호출 지원
 
     def __init__(self, model: Optional[str] = None, **kwargs):
         """
@@ -79,36 +88,35 @@ class AnthropicProvider(BaseProvider):
             error_msg = str(e)
             return False, f"Anthropic API 연결 실패: {error_msg}"
 
-    def _convert_to_langchain_messages(self, messages):
+    def _create_client(self, options: Dict[str, Any], streaming: bool = False) -> Any:
+        """풀에서 ChatAnthropic 클라이언트 가져오기 (생성 옵션별로 재사용)"""
+        client_kwargs = {"streaming": True} if streaming else {}
+        return self._get_client(
+            ChatAnthropic,
+            model=self.model,
+            anthropic_api_key=self.api_key,
+            temperature=options.get("temperature", 0.7),
+            **client_kwargs
+        )
+
+    def _convert_with_cache(self, messages: Any) -> Tuple[List[Any], int]:
         """
-        메시지를 LangChain 형식으로 변환
+        메시지를 변환하고 고정 구간의 끝에 프롬프트 캐시 지점 지정
 
         Args:
-            messages: 변환할 메시지 목록
+            messages: 대화 메시지 목록
 
         Returns:
-            LangChain 메시지 목록
+            (LangChain 메시지 목록, 캐시 대상 메시지 수)
         """
-        result = []
-        for msg in messages:
-            # Message 클래스 객체인 경우
-            if hasattr(msg, 'role') and hasattr(msg, 'content'):
-                role = msg.role.value if hasattr(msg.role, 'value') else str(msg.role)
-                if role == "user":
-                    result.append(HumanMessage(content=msg.content))
-                elif role == "assistant":
-                    result.append(AIMessage(content=msg.content))
-                elif role == "system":
-                    result.append(SystemMessage(content=msg.content))
-            # 딕셔너리인 경우
-            elif isinstance(msg, dict) and 'role' in msg and 'content' in msg:
-                if msg["role"] == "user":
-                    result.append(HumanMessage(content=msg["content"]))
-                elif msg["role"] == "assistant":
-                    result.append(AIMessage(content=msg["content"]))
-                elif msg["role"] == "system":
-                    result.append(SystemMessage(content=msg["content"]))
-        return result
+        lc_messages = self._convert_messages(messages)
+        prefix = self._cache_prefix_length(messages)
+        if prefix:
+            # 변환되지 않는 메시지(tool 등)를 제외한 고정 구간의 마지막 위치
+            boundary = len(self._convert_messages(messages[:prefix]))
+            if boundary:
+                lc_messages[boundary - 1] = _with_cache_breakpoint(lc_messages[boundary - 1])
+        return lc_messages, prefix
 
     async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -124,27 +132,27 @@ class AnthropicProvider(BaseProvider):
         # 옵션 병합
         merged_options = {**self.options, **(options or {})}
 
-        # LangChain 클라이언트 생성
-        client = ChatAnthropic(
-            model=self.model,
-            anthropic_api_key=self.api_key,
-            temperature=merged_options.get("temperature", 0.7)
-        )
+        # 풀에서 LangChain 클라이언트 가져오기
+        client = self._create_client(merged_options)
 
-        # 메시지 변환
-        lc_messages = self._convert_to_langchain_messages(messages)
+        # 메시지 변환 (고정 구간은 프롬프트 캐시 지정)
+        with metrics.span("convert"):
+            lc_messages, prefix = self._convert_with_cache(messages)
 
         # 응답 생성
-        result = client.invoke(lc_messages)
+        result = await self._ainvoke(client, lc_messages)
 
         # 결과 반환
+        metadata = {
+            "model": self.model,
+            "provider": self.name
+        }
+        if prefix:
+            metadata["prompt_cache"] = self._prompt_cache_metadata(result, prefix)
         return {
             "content": result.content,
             "raw_response": result,
-            "metadata": {
-                "model": self.model,
-                "provider": self.name
-            }
+            "metadata": metadata
         }
 
     async def stream_chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
@@ -161,18 +169,14 @@ class AnthropicProvider(BaseProvider):
         # 옵션 병합
         merged_options = {**self.options, **(options or {})}
 
-        # LangChain 스트리밍 클라이언트 생성
-        client = ChatAnthropic(
-            model=self.model,
-            anthropic_api_key=self.api_key,
-            temperature=merged_options.get("temperature", 0.7),
-            streaming=True
-        )
+        # 풀에서 LangChain 스트리밍 클라이언트 가져오기
+        client = self._create_client(merged_options, streaming=True)
 
-        # 메시지 변환
-        lc_messages = self._convert_to_langchain_messages(messages)
+        # 메시지 변환 (고정 구간은 프롬프트 캐시 지정, 캐시 적중 토큰은 계측의 usage에 기록)
+        with metrics.span("convert"):
+            lc_messages, _ = self._convert_with_cache(messages)
 
         # 스트리밍 응답 처리
-        for chunk in client.stream(lc_messages):
+        async for chunk in self._astream(client, lc_messages):
             if chunk.content:
                 yield chunk.content
\ No newline at end of file
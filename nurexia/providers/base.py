@@ -2,7 +2,124 @@
 모든 AI Provider의 기본 인터페이스 정의.
 """
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, Any, List, Optional, Union, Tuple, AsyncIterator
+import asyncio
+import contextlib
+import threading
+
+from ..config import config_manager
+from .. import metrics
+from .pool import client_pool, make_client_key
+from ..graph.messages import stable_prefix_length
+from ..graph.tokens import count_message_tokens
+
+# 비동기 API가 없는 백엔드 호출을 위한 공용 스레드 풀 (최초 사용 시 생성)
+_sync_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_sync_executor() -> ThreadPoolExecutor:
+    """동기 호출 오프로드용 스레드 풀 반환"""
+    global _sync_executor
+    if _sync_executor is None:
+        _sync_executor = ThreadPoolExecutor(
+            max_workers=config_manager.sync_workers,
+            thread_name_prefix="nurexia-provider"
+        )
+    return _sync_executor
+
+
+# 스트림 종료를 알리는 내부 표식
+_STREAM_END = object()
+
+# 동기 생산자가 큐 여유를 기다리며 소비자 중단 여부를 확인하는 간격(초)
+_PUT_POLL_INTERVAL = 0.1
+
+
+class _StreamError:
+    """생산자 측에서 발생한 예외를 소비자에게 전달하기 위한 래퍼"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+# 역할별 LangChain 메시지 클래스 (최초 변환 시 import)
+_langchain_classes: Optional[Dict[str, Any]] = None
+
+# 텍스트 생성 모델용 프롬프트의 역할 표기
+_PROMPT_TAGS = {"system": "[SYSTEM]", "user": "[USER]", "assistant": "[ASSISTANT]"}
+
+
+def _role_and_content(message: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Message 객체 또는 딕셔너리에서 (역할 문자열, 내용) 추출 (형식이 맞지 않으면 (None, None))"""
+    if isinstance(message, dict):
+        role, content = message.get("role"), message.get("content")
+    else:
+        role, content = getattr(message, "role", None), getattr(message, "content", None)
+    if role is None or content is None:
+        return None, None
+    return getattr(role, "value", role), content
+
+
+def to_langchain_message(role: Any, content: str) -> Any:
+    """
+    메시지 하나를 LangChain 메시지로 변환
+
+    Args:
+        role: 메시지 역할 (MessageRole 또는 문자열)
+        content: 메시지 내용
+
+    Returns:
+        HumanMessage/AIMessage/SystemMessage (지원하지 않는 역할이면 None)
+    """
+    global _langchain_classes
+    if _langchain_classes is None:
+        from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+        _langchain_classes = {"user": HumanMessage, "assistant": AIMessage, "system": SystemMessage}
+    message_class = _langchain_classes.get(getattr(role, "value", role))
+    return message_class(content=content) if message_class else None
+
+
+def to_prompt_segment(role: Any, content: str) -> Optional[str]:
+    """
+    메시지 하나를 텍스트 생성용 프롬프트 조각으로 변환
+
+    Args:
+        role: 메시지 역할 (MessageRole 또는 문자열)
+        content: 메시지 내용
+
+    Returns:
+        "[USER] 내용\n" 형식의 문자열 (지원하지 않는 역할이면 None)
+    """
+    tag = _PROMPT_TAGS.get(getattr(role, "value", role))
+    return f"{tag} {content}\n" if tag else None
+
+
+def convert_messages(messages: Any, key: str, convert: Any) -> List[Any]:
+    """
+    메시지 목록 변환
+
+    메시지 저장소(MessageStore/MessageView)는 메시지별 변환 결과를 보관하므로
+    이전 턴에서 변환한 메시지는 다시 변환하지 않습니다.
+
+    Args:
+        messages: 메시지 저장소, Message 객체 목록 또는 딕셔너리 목록
+        key: 변환 형식 이름 (변환 결과 캐시 구분용)
+        convert: (역할, 내용)을 받아 변환 결과(또는 None)를 반환하는 함수
+
+    Returns:
+        변환 결과 목록 (변환할 수 없는 메시지는 제외)
+    """
+    if hasattr(messages, "converted"):
+        items = messages.converted(key, convert)
+    else:
+        items = []
+        for message in messages:
+            role, content = _role_and_content(message)
+            if role is not None:
+                items.append(convert(role, content))
+    return [item for item in items if item is not None]
+
 
 class BaseProvider(ABC):
     """모든 AI Provider의 기본 인터페이스"""
@@ -10,6 +127,7 @@ class BaseProvider(ABC):
     default_model: str
     available_models: List[str]
     supports_streaming: bool = False  # 스트리밍 지원 여부 (기본값: False)
+    supports_async: bool = False  # 클라이언트의 네이티브 비동기 호출(ainvoke) 지원 여부
 
     def __init__(self, model: Optional[str] = None, **kwargs):
         """
@@ -47,6 +165,237 @@ class BaseProvider(ABC):
         """
         pass
 
+    def _get_client(self, factory: Any, **client_kwargs) -> Any:
+        """
+        클라이언트 풀에서 LangChain 클라이언트를 가져오거나 새로 생성
+
+        Args:
+            factory: 클라이언트 클래스 (예: ChatOpenAI)
+            **client_kwargs: 클라이언트 생성 인자 (모델, 온도 등 생성 옵션 포함)
+
+        Returns:
+            재사용 가능한 클라이언트 인스턴스
+        """
+        key = make_client_key(self.name, factory, client_kwargs)
+        misses = client_pool.misses
+        with metrics.span("client"):
+            client = client_pool.get_or_create(key, lambda: factory(**client_kwargs))
+        metrics.increment("client_pool_miss" if client_pool.misses != misses else "client_pool_hit")
+        return client
+
+    def _convert_messages(self, messages: Any) -> List[Any]:
+        """
+        대화 메시지를 LangChain 메시지 목록으로 변환 (메시지별 변환 결과 재사용)
+
+        Args:
+            messages: 변환할 메시지 목록
+
+        Returns:
+            LangChain 메시지 목록
+        """
+        return convert_messages(messages, "langchain", to_langchain_message)
+
+    def _format_prompt(self, messages: Any) -> str:
+        """
+        대화 메시지를 텍스트 생성 모델용 프롬프트로 변환 (메시지별 변환 결과 재사용)
+
+        Args:
+            messages: 변환할 메시지 목록
+
+        Returns:
+            "[ROLE] 내용" 줄을 이어 붙이고 "[ASSISTANT] "로 끝나는 프롬프트
+        """
+        return "".join(convert_messages(messages, "prompt", to_prompt_segment)) + "[ASSISTANT] "
+
+    def _create_client(self, options: Dict[str, Any], streaming: bool = False) -> Any:
+        """
+        생성 옵션에 맞는 클라이언트를 풀에서 가져오기 (Provider별 구현)
+
+        Args:
+            options: 병합된 생성 옵션
+            streaming: 스트리밍용 클라이언트 여부
+
+        Returns:
+            클라이언트 인스턴스
+        """
+        raise NotImplementedError
+
+    async def warm_up(self):
+        """
+        다음 요청에 사용할 클라이언트를 미리 생성하여 풀에 보관
+
+        대화형 모드에서 사용자 입력을 기다리는 동안 호출하며,
+        실패해도 실제 요청에서 다시 시도하므로 오류는 무시합니다.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                _get_sync_executor(), self._create_client, self.options, self.supports_streaming
+            )
+        except Exception:
+            pass
+
+    def _cache_prefix_length(self, messages: Any) -> int:
+        """
+        Provider 프롬프트 캐시를 적용할 고정 구간 길이
+
+        선두의 시스템/고정(pinned) 메시지 구간이 설정된 최소 토큰 수 이상일 때만
+        캐시 대상으로 봅니다 (짧은 구간은 Provider가 캐시하지 않음).
+
+        Args:
+            messages: 대화 메시지 목록
+
+        Returns:
+            캐시할 메시지 수 (캐시하지 않으면 0)
+        """
+        if not config_manager.prompt_cache_enabled:
+            return 0
+        prefix = stable_prefix_length(messages)
+        if not prefix:
+            return 0
+        if hasattr(messages, "token_counts"):
+            tokens = sum(messages.token_counts(0, prefix))
+        else:
+            tokens = sum(count_message_tokens(msg) for msg in messages[:prefix])
+        return prefix if tokens >= config_manager.prompt_cache_min_tokens else 0
+
+    @staticmethod
+    def _prompt_cache_metadata(result: Any, prefix_length: int) -> Dict[str, Any]:
+        """
+        응답의 토큰 사용량에서 프롬프트 캐시 적중 정보 추출
+
+        Args:
+            result: LangChain 응답 (usage_metadata 포함)
+            prefix_length: 캐시 대상으로 지정한 메시지 수
+
+        Returns:
+            {"prefix_messages", "cache_read_tokens", "cache_creation_tokens", "status"}
+        """
+        details = (getattr(result, "usage_metadata", None) or {}).get("input_token_details") or {}
+        read = details.get("cache_read") or 0
+        created = details.get("cache_creation") or 0
+        return {
+            "prefix_messages": prefix_length,
+            "cache_read_tokens": read,
+            "cache_creation_tokens": created,
+            "status": "hit" if read else "miss",
+        }
+
+    async def _ainvoke(self, client: Any, payload: Any, **kwargs) -> Any:
+        """
+        이벤트 루프를 막지 않고 클라이언트 호출
+
+        네이티브 비동기를 지원하면 ainvoke를 사용하고,
+        그렇지 않으면 크기가 제한된 스레드 풀에서 invoke를 실행합니다.
+
+        Args:
+            client: LangChain 클라이언트
+            payload: 클라이언트 입력 (메시지 목록 또는 프롬프트)
+            **kwargs: 호출마다 전달할 추가 API 인자
+
+        Returns:
+            클라이언트 응답
+        """
+        with metrics.span("generate"):
+            if self.supports_async:
+                result = await client.ainvoke(payload, **kwargs)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(_get_sync_executor(), lambda: client.invoke(payload, **kwargs))
+
+        # 응답에 포함된 토큰 사용량 기록
+        metrics.record_usage_from(result)
+        return result
+
+    async def _astream(self, client: Any, payload: Any, buffer_size: Optional[int] = None, **kwargs) -> AsyncIterator[Any]:
+        """
+        크기가 제한된 버퍼를 통해 클라이언트 스트림을 비동기로 전달
+
+        네이티브 비동기를 지원하면 astream을 사용하고, 그렇지 않으면
+        별도 스레드에서 stream을 실행해 큐로 연결합니다. 버퍼가 가득 차면
+        생산자가 대기하므로 느린 소비자에게 배압(backpressure)이 걸립니다.
+
+        Args:
+            client: LangChain 클라이언트
+            payload: 클라이언트 입력 (메시지 목록 또는 프롬프트)
+            buffer_size: 버퍼에 보관할 최대 청크 수 (기본값: 설정값)
+            **kwargs: 호출마다 전달할 추가 API 인자
+
+        Yields:
+            클라이언트 스트림 청크
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size or config_manager.stream_buffer_size)
+        stop_event = threading.Event()
+
+        async def produce_async():
+            # 취소(CancelledError)되면 가득 찬 큐에서 종료 표식을 기다리지 않고 바로 끝냄
+            try:
+                async for chunk in client.astream(payload, **kwargs):
+                    await queue.put(chunk)
+            except Exception as e:
+                await queue.put(_StreamError(e))
+            else:
+                await queue.put(_STREAM_END)
+
+        def produce_sync():
+            def put(item):
+                # 소비자가 중단했으면 더 이상 전달하지 않음
+                if stop_event.is_set() or loop.is_closed():
+                    return
+                # 큐에 여유가 생길 때까지 스레드를 대기시켜 배압 적용
+                # (소비자 중단이나 이벤트 루프 종료 시 영구 대기하지 않도록 주기적으로 확인)
+                try:
+                    future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+                except RuntimeError:
+                    return
+                while True:
+                    try:
+                        future.result(timeout=_PUT_POLL_INTERVAL)
+                        return
+                    except FutureTimeoutError:
+                        if stop_event.is_set() or loop.is_closed():
+                            future.cancel()
+                            return
+
+            try:
+                for chunk in client.stream(payload, **kwargs):
+                    if stop_event.is_set():
+                        break
+                    put(chunk)
+            except Exception as e:
+                put(_StreamError(e))
+            finally:
+                put(_STREAM_END)
+
+        if self.supports_async:
+            producer = asyncio.ensure_future(produce_async())
+        else:
+            producer = loop.run_in_executor(_get_sync_executor(), produce_sync)
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, _StreamError):
+                    raise item.error
+                # 마지막 청크 등에 포함된 토큰 사용량 기록
+                metrics.record_usage_from(item)
+                yield item
+        finally:
+            # 소비자가 중단한 경우 생산자도 정리
+            stop_event.set()
+            if not producer.done():
+                producer.cancel()
+                # 대기 중인 동기 생산자가 멈추지 않도록 큐를 비움
+                while not queue.empty():
+                    queue.get_nowait()
+                # 비동기 생산자는 취소가 끝날 때까지 대기 (동기 생산자는 stop_event를 보고 스스로 종료)
+                if self.supports_async:
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await producer
+
     @abstractmethod
     async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -75,4 +424,53 @@ class BaseProvider(ABC):
         Raises:
             NotImplementedError: 지원하지 않는 기능 사용 시
         """
-        raise NotImplementedError(f"{self.__class__.__name__} Provider는 스트리밍을 지원하지 않습니다.")
\ No newline at end of file
+        raise NotImplementedError(f"{self.__class__.__name__} Provider는 스트리밍을 지원하지 않습니다.")
+
+class ProviderWrapper(BaseProvider):
+    """
+    다른 Provider를 감싸 기능(캐시 등)을 덧붙이는 데코레이터 기본 클래스
+
+    감싼 Provider의 이름, 모델, 옵션을 그대로 노출하며,
+    재정의하지 않은 호출은 모두 내부 Provider로 위임합니다.
+    """
+
+    def __init__(self, provider: BaseProvider):
+        """
+        래퍼 초기화
+
+        Args:
+            provider: 감쌀 Provider 인스턴스
+        """
+        self.provider = provider
+        self.name = provider.name
+        self.model = provider.model
+        self.options = provider.options
+        self.supports_streaming = provider.supports_streaming
+        self.supports_async = provider.supports_async
+
+    def __getattr__(self, item: str) -> Any:
+        # 래퍼에 없는 속성은 내부 Provider에서 조회
+        if item == "provider":
+            raise AttributeError(item)
+        return getattr(self.provider, item)
+
+    def _process_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """내부 Provider의 옵션 처리 사용"""
+        return self.provider._process_options(options)
+
+    def test_connection(self) -> Tuple[bool, str]:
+        """내부 Provider의 연결 테스트 사용"""
+        return self.provider.test_connection()
+
+    async def warm_up(self):
+        """내부 Provider의 클라이언트 준비"""
+        await self.provider.warm_up()
+
+    async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """내부 Provider로 대화형 응답 생성 위임"""
+        return await self.provider.chat(messages, options)
+
+    async def stream_chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """내부 Provider로 스트리밍 응답 생성 위임"""
+        async for chunk in self.provider.stream_chat(messages, options):
+            yield chunk
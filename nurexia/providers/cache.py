@@ -0,0 +1,261 @@
+"""
+응답 캐시 모듈.
+동일한 (Provider, 모델, 메시지, 생성 옵션) 요청에 대한 응답을
+로컬 SQLite 파일에 저장하여 반복 호출 시 원격 요청을 생략합니다.
+"""
+from typing import Dict, Any, List, Optional, AsyncIterator
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .base import BaseProvider, ProviderWrapper
+from .cascade import CascadeBoundary
+from ..config import config_manager
+
+# 응답 내용에 영향을 주지 않아 캐시 키에서 제외하는 옵션 (출력, 제한 시간, 응답 기록/재생, 경주 시차)
+_NON_GENERATION_OPTIONS = {"verbose", "cache", "stream", "timeout", "record", "cassette", "hedge_delay"}
+
+
+def _normalize_message(message: Any) -> Optional[Dict[str, str]]:
+    """
+    캐시 키 계산을 위해 메시지를 정규화
+
+    Args:
+        message: Message 객체 또는 딕셔너리
+
+    Returns:
+        {"role": ..., "content": ...} 형식의 딕셔너리 (변환 불가 시 None)
+    """
+    if isinstance(message, dict):
+        role, content = message.get("role"), message.get("content")
+    else:
+        role, content = getattr(message, "role", None), getattr(message, "content", None)
+
+    if role is None or content is None:
+        return None
+
+    role = role.value if hasattr(role, "value") else str(role)
+    return {"role": role, "content": content}
+
+
+def make_cache_key(provider: str, model: str, messages: List[Any], options: Dict[str, Any]) -> str:
+    """
+    요청 내용 기반 캐시 키 생성
+
+    Args:
+        provider: Provider 이름
+        model: 모델명
+        messages: 대화 메시지 목록
+        options: 생성 옵션
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    payload = {
+        "provider": provider,
+        "model": model,
+        "messages": [m for m in (_normalize_message(msg) for msg in messages) if m is not None],
+        "options": {k: v for k, v in options.items() if k not in _NON_GENERATION_OPTIONS},
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """TTL과 최대 항목 수(LRU) 제한을 지원하는 SQLite 응답 캐시"""
+
+    def __init__(self, path: str, ttl: float = 0, max_entries: int = 0):
+        """
+        응답 캐시 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            ttl: 항목 유효 시간(초). 0이면 만료 없음
+            max_entries: 최대 항목 수. 0이면 제한 없음
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " content TEXT NOT NULL,"
+            " metadata TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            {"content": ..., "metadata": ...} 또는 None (없거나 만료된 경우)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, metadata, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            content, metadata, created_at = row
+            if self.ttl and created_at + self.ttl < now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+        return {"content": content, "metadata": json.loads(metadata)}
+
+    def set(self, key: str, content: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        응답 저장 후 최대 항목 수를 넘으면 오래 사용되지 않은 항목부터 제거
+
+        Args:
+            key: 캐시 키
+            content: 응답 내용
+            metadata: 응답 메타데이터
+        """
+        now = time.time()
+        encoded = json.dumps(metadata or {}, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, metadata, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, content, encoded, now, now)
+            )
+            if self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 기본 캐시 인스턴스 (최초 사용 시 생성)
+_default_cache: Optional[ResponseCache] = None
+
+
+def get_default_cache() -> ResponseCache:
+    """
+    설정값 기반의 기본 응답 캐시 반환
+
+    Returns:
+        ResponseCache 인스턴스
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResponseCache(
+            config_manager.cache_path,
+            ttl=config_manager.cache_ttl,
+            max_entries=config_manager.cache_max_entries
+        )
+    return _default_cache
+
+
+class CachedProvider(ProviderWrapper):
+    """응답 캐시를 적용하는 Provider 래퍼"""
+
+    def __init__(self, provider: BaseProvider, cache: Optional[ResponseCache] = None):
+        """
+        캐시 Provider 초기화
+
+        Args:
+            provider: 감쌀 Provider 인스턴스
+            cache: 사용할 응답 캐시 (기본값: 설정 기반 기본 캐시)
+        """
+        super().__init__(provider)
+        self.cache = cache or get_default_cache()
+
+    def _cache_key(self, messages: List[Any], options: Optional[Dict[str, Any]]) -> str:
+        """요청에 대한 캐시 키 계산"""
+        merged_options = {**self.options, **(options or {})}
+        return make_cache_key(self.name, self.model, messages, merged_options)
+
+    async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        캐시를 확인한 뒤 대화형 응답 생성
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Returns:
+            응답 결과 (캐시 적중 시 raw_response는 None)
+        """
+        key = self._cache_key(messages, options)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return {
+                "content": cached["content"],
+                "raw_response": None,
+                "metadata": {**cached["metadata"], "cache": "hit"}
+            }
+
+        response = await self.provider.chat(messages, options)
+        self.cache.set(key, response["content"], response.get("metadata"))
+        response["metadata"] = {**response.get("metadata", {}), "cache": "miss"}
+        return response
+
+    async def stream_chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        캐시를 확인한 뒤 스트리밍 응답 생성
+
+        캐시 적중 시 저장된 응답을 한 번에 반환하고, 미적중 시
+        스트림이 정상 종료된 경우에만 전체 응답을 저장합니다.
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Yields:
+            응답 청크
+        """
+        key = self._cache_key(messages, options)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached["content"]
+            return
+
+        chunks = []
+        async for chunk in self.provider.stream_chat(messages, options):
+            # 단계 전환 이전의 초안은 저장하지 않음
+            if isinstance(chunk, CascadeBoundary):
+                chunks.clear()
+            else:
+                chunks.append(chunk)
+            yield chunk
+
+        self.cache.set(key, "".join(chunks), {"model": self.model, "provider": self.name})
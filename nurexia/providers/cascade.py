@@ -0,0 +1,262 @@
+"""
+단계적 Provider(cascade) 모듈.
+저렴한 초안 Provider(예: 로컬 Ollama 모델)가 먼저 답하고 바로 스트리밍하며,
+응답 길이, 스스로 밝힌 불확실성, 정규식 검증 결과를 보고 필요할 때만
+상위 Provider(예: Anthropic)로 넘깁니다. 간단한 질의는 초안으로 끝나므로 지연과 비용이 줄어듭니다.
+"""
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+import asyncio
+import re
+import time
+
+from .base import BaseProvider, _role_and_content
+from ..config import config_manager
+from ..graph.tokens import count_tokens
+
+# 응답에서 불확실성을 스스로 밝히는 표현 (NUREXIA_CASCADE_UNCERTAINTY로 변경)
+DEFAULT_UNCERTAINTY_PATTERN = (
+    r"(?i)\b(?:i'?m not (?:sure|certain)|i am not (?:sure|certain)|i don'?t know|i do not know"
+    r"|i (?:can ?not|can'?t) (?:answer|help|determine)|not enough (?:information|context)"
+    r"|i'?m unable to)\b"
+    r"|확실하지 않|잘 모르|모르겠|알 수 없|답변(?:을|하기)? ?어렵"
+)
+
+
+def _label(provider: BaseProvider) -> str:
+    """결과 기록용 Provider 식별자"""
+    return f"{provider.name}/{provider.model}"
+
+
+def _compile(pattern: Optional[str]) -> Optional[re.Pattern]:
+    """설정된 정규식 컴파일 (비어 있으면 None)"""
+    return re.compile(pattern, re.MULTILINE) if pattern else None
+
+
+class CascadePolicy:
+    """초안 응답을 상위 Provider로 넘길지 판단하는 규칙"""
+
+    def __init__(self, min_chars: Optional[int] = None, max_prompt_tokens: Optional[int] = None,
+                 uncertainty: Optional[str] = None, require: Optional[str] = None, reject: Optional[str] = None):
+        """
+        판단 규칙 초기화 (지정하지 않은 값은 NUREXIA_CASCADE_* 설정 사용)
+
+        Args:
+            min_chars: 이보다 짧은 응답은 넘김
+            max_prompt_tokens: 마지막 사용자 메시지가 이보다 길면 초안 없이 바로 넘김 (0이면 비활성)
+            uncertainty: 응답에서 찾으면 넘기는 불확실성 표현 정규식 (빈 문자열이면 비활성)
+            require: 응답이 반드시 포함해야 하는 정규식 (없으면 넘김)
+            reject: 응답에서 찾으면 넘기는 정규식
+        """
+        self.min_chars = config_manager.cascade_min_chars if min_chars is None else min_chars
+        self.max_prompt_tokens = (config_manager.cascade_max_prompt_tokens if max_prompt_tokens is None
+                                  else max_prompt_tokens)
+        if uncertainty is None:
+            uncertainty = config_manager.cascade_uncertainty
+        self.uncertainty = _compile(DEFAULT_UNCERTAINTY_PATTERN if uncertainty is None else uncertainty)
+        self.require = _compile(config_manager.cascade_require if require is None else require)
+        self.reject = _compile(config_manager.cascade_reject if reject is None else reject)
+
+    def pre_route(self, messages: Any) -> List[str]:
+        """
+        초안 생성 전 판단 (긴 질의는 초안 없이 상위 Provider로)
+
+        Args:
+            messages: 대화 메시지 목록
+
+        Returns:
+            넘기는 이유 목록 (비어 있으면 초안부터 생성)
+        """
+        if not self.max_prompt_tokens:
+            return []
+        prompt = None
+        for message in messages:
+            role, content = _role_and_content(message)
+            if role == "user":
+                prompt = content
+        tokens = count_tokens(prompt or "")
+        return [f"prompt_tokens>{self.max_prompt_tokens}"] if tokens > self.max_prompt_tokens else []
+
+    def evaluate(self, content: str) -> List[str]:
+        """
+        초안 응답 판단
+
+        Args:
+            content: 초안 응답 전체
+
+        Returns:
+            넘기는 이유 목록 (비어 있으면 초안을 최종 응답으로 사용)
+        """
+        reasons = []
+        if len(content.strip()) < self.min_chars:
+            reasons.append("too_short")
+        if self.uncertainty is not None and self.uncertainty.search(content):
+            reasons.append("uncertain")
+        if self.require is not None and not self.require.search(content):
+            reasons.append("missing_required")
+        if self.reject is not None and self.reject.search(content):
+            reasons.append("rejected")
+        return reasons
+
+
+class CascadeBoundary(str):
+    """초안을 버리고 상위 Provider 응답으로 넘어가는 지점을 알리는 청크
+
+    화면에는 안내 문구로 출력되며, 받는 쪽은 이 청크 이전의 내용을 최종 응답에서 제외합니다.
+    """
+
+    def __new__(cls, text: str, info: Dict[str, Any]):
+        boundary = super().__new__(cls, text)
+        boundary.info = info
+        return boundary
+
+
+class CascadeProvider(BaseProvider):
+    """초안 Provider부터 차례로 응답을 받아 판단 규칙을 통과한 응답을 사용하는 Provider"""
+
+    def __init__(self, providers: List[BaseProvider], policy: Optional[CascadePolicy] = None):
+        """
+        단계적 Provider 초기화
+
+        Args:
+            providers: 단계별 Provider 목록 (첫 번째가 초안, 마지막 응답은 판단 없이 사용)
+            policy: 넘김 판단 규칙 (기본값: 설정 기반 규칙)
+        """
+        if not providers:
+            raise ValueError("단계별로 사용할 Provider가 없습니다.")
+        self.providers = providers
+        self.policy = policy or CascadePolicy()
+        primary = providers[0]
+        self.name = primary.name
+        self.model = primary.model
+        # 단계 구성이 다르면 다른 요청으로 취급되도록 옵션에 포함 (캐시 키 등)
+        self.options = {**primary.options, "cascade": [_label(p) for p in providers[1:]]}
+        self.supports_streaming = True
+        self.supports_async = all(p.supports_async for p in providers)
+        # 마지막 요청의 단계별 판단 기록 (스트리밍은 응답 메타데이터가 없으므로 여기에 기록)
+        self.last_cascade: Optional[Dict[str, Any]] = None
+
+    def _process_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """초안 Provider의 옵션 처리 사용"""
+        return self.providers[0]._process_options(options)
+
+    def test_connection(self) -> Tuple[bool, str]:
+        """모든 단계의 연결 테스트 (마지막 단계가 성공하면 성공)"""
+        results = [p.test_connection() for p in self.providers]
+        messages = "; ".join(f"{_label(p)}: {message}" for p, (_, message) in zip(self.providers, results))
+        return results[-1][0], messages
+
+    async def warm_up(self):
+        """모든 단계의 클라이언트 준비"""
+        await asyncio.gather(*(p.warm_up() for p in self.providers))
+
+    def _new_record(self) -> Dict[str, Any]:
+        """요청 하나의 단계별 판단 기록"""
+        return {"tiers": [_label(p) for p in self.providers], "attempts": [], "final": None, "escalated": False}
+
+    def _attempt(self, record: Dict[str, Any], index: int, started: float, content: Optional[str],
+                 reasons: List[str], skipped: bool = False):
+        """단계 하나의 결과를 기록"""
+        attempt = {
+            "provider": _label(self.providers[index]),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+            "chars": len(content or ""),
+            "reasons": reasons,
+        }
+        if skipped:
+            attempt["skipped"] = True
+        record["attempts"].append(attempt)
+        if reasons:
+            record["escalated"] = True
+        else:
+            record["final"] = attempt["provider"]
+
+    async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        단계별로 응답을 받아 판단 규칙을 통과한 응답 반환
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Returns:
+            응답 결과 (metadata["cascade"]에 단계별 판단 기록)
+
+        Raises:
+            Exception: 마지막 단계의 Provider가 실패한 경우
+        """
+        record = self._new_record()
+        self.last_cascade = record
+        pre_reasons = self.policy.pre_route(messages)
+        last = len(self.providers) - 1
+        for index, provider in enumerate(self.providers):
+            started = time.perf_counter()
+            if index == 0 and pre_reasons and last:
+                self._attempt(record, index, started, None, pre_reasons, skipped=True)
+                continue
+            try:
+                response = await provider.chat(messages, options)
+            except Exception as e:
+                if index == last:
+                    raise
+                self._attempt(record, index, started, None, [f"error:{type(e).__name__}"])
+                continue
+            reasons = [] if index == last else self.policy.evaluate(response["content"])
+            self._attempt(record, index, started, response["content"], reasons)
+            if not reasons:
+                response["metadata"] = {**response.get("metadata", {}), "cascade": record}
+                return response
+        raise RuntimeError("cascade ended without a response")
+
+    async def _stream_tier(self, provider: BaseProvider, messages: List[Dict[str, str]],
+                           options: Optional[Dict[str, Any]], chunks: List[str]) -> AsyncIterator[str]:
+        """단계 하나의 스트림 (스트리밍 미지원 Provider는 전체 응답을 하나의 청크로)"""
+        if not provider.supports_streaming:
+            response = await provider.chat(messages, options)
+            chunks.append(response["content"])
+            yield response["content"]
+            return
+        async for chunk in provider.stream_chat(messages, options):
+            chunks.append(chunk)
+            yield chunk
+
+    async def stream_chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        초안을 바로 스트리밍하고, 판단 규칙에 걸리면 CascadeBoundary 청크 뒤에 다음 단계 응답을 스트리밍
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Yields:
+            응답 청크 (단계가 바뀌는 지점에는 CascadeBoundary)
+
+        Raises:
+            Exception: 마지막 단계의 Provider가 실패한 경우
+        """
+        record = self._new_record()
+        self.last_cascade = record
+        pre_reasons = self.policy.pre_route(messages)
+        last = len(self.providers) - 1
+        for index, provider in enumerate(self.providers):
+            started = time.perf_counter()
+            if index == 0 and pre_reasons and last:
+                self._attempt(record, index, started, None, pre_reasons, skipped=True)
+                continue
+            chunks: List[str] = []
+            try:
+                async for chunk in self._stream_tier(provider, messages, options, chunks):
+                    yield chunk
+            except Exception as e:
+                if index == last:
+                    raise
+                reasons = [f"error:{type(e).__name__}"]
+            else:
+                reasons = [] if index == last else self.policy.evaluate("".join(chunks))
+            self._attempt(record, index, started, "".join(chunks), reasons)
+            if not reasons:
+                return
+            if chunks:
+                # 이미 출력한 초안을 버리고 다음 단계로 넘어감을 알림
+                target = _label(self.providers[index + 1])
+                yield CascadeBoundary(f"\n\n[escalated to {target}: {', '.join(reasons)}]\n\n",
+                                      {"from": _label(provider), "to": target, "reasons": reasons})
@@ -5,21 +5,19 @@ from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
 import os
 
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 
 from .base import BaseProvider
+from .. import metrics
+from .registry import PROVIDER_CATALOG
 
 class GoogleProvider(BaseProvider):
     """Google Gemini API Provider"""
     name = "google"
-    default_model = "gemini-2.0-flash-001"
-    available_models = [
-        "gemini-1.0-pro",
-        "gemini-1.5-pro",
-        "gemini-2.0-pro-001",
-        "gemini-2.0-flash-001"
-    ]
+    default_model = PROVIDER_CATALOG["google"]["default_model"]
+    available_models = PROVIDER_CATALOG["google"]["available_models"]
     supports_streaming = True  # 스트리밍 지원 활성화
+    supports_async = True  # 네이티브 비동기 호출 지원
 
     def __init__(self, model: Optional[str] = None, **kwargs):
         """
@@ -77,36 +75,16 @@ class GoogleProvider(BaseProvider):
             error_msg = str(e)
             return False, f"Google Gemini API 연결 실패: {error_msg}"
 
-    def _convert_to_langchain_messages(self, messages):
-        """
-        메시지를 LangChain 형식으로 변환
-
-        Args:
-            messages: 변환할 메시지 목록
-
-        Returns:
-            LangChain 메시지 목록
-        """
-        result = []
-        for msg in messages:
-            # Message 클래스 객체인 경우
-            if hasattr(msg, 'role') and hasattr(msg, 'content'):
-                role = msg.role.value if hasattr(msg.role, 'value') else str(msg.role)
-                if role == "user":
-                    result.append(HumanMessage(content=msg.content))
-                elif role == "assistant":
-                    result.append(AIMessage(content=msg.content))
-                elif role == "system":
-                    result.append(SystemMessage(content=msg.content))
-            # 딕셔너리인 경우
-            elif isinstance(msg, dict) and 'role' in msg and 'content' in msg:
-                if msg["role"] == "user":
-                    result.append(HumanMessage(content=msg["content"]))
-                elif msg["role"] == "assistant":
-                    result.append(AIMessage(content=msg["content"]))
-                elif msg["role"] == "system":
-                    result.append(SystemMessage(content=msg["content"]))
-        return result
+    def _create_client(self, options: Dict[str, Any], streaming: bool = False) -> Any:
+        """풀에서 ChatGoogleGenerativeAI 클라이언트 가져오기 (생성 옵션별로 재사용)"""
+        client_kwargs = {"streaming": True} if streaming else {}
+        return self._get_client(
+            ChatGoogleGenerativeAI,
+            model=self.model,
+            google_api_key=self.api_key,
+            temperature=options.get("temperature", 0.7),
+            **client_kwargs
+        )
 
     async def chat(self, messages, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -122,18 +100,15 @@ class GoogleProvider(BaseProvider):
         # 옵션 병합
         merged_options = {**self.options, **(options or {})}
 
-        # LangChain 클라이언트 생성
-        client = ChatGoogleGenerativeAI(
-            model=self.model,
-            google_api_key=self.api_key,
-            temperature=merged_options.get("temperature", 0.7)
-        )
+        # 풀에서 LangChain 클라이언트 가져오기
+        client = self._create_client(merged_options)
 
         # 메시지 변환
-        lc_messages = self._convert_to_langchain_messages(messages)
+        with metrics.span("convert"):
+            lc_messages = self._convert_messages(messages)
 
         # 응답 생성
-        result = client.invoke(lc_messages)
+        result = await self._ainvoke(client, lc_messages)
 
         # 결과 반환
         return {
@@ -159,18 +134,14 @@ class GoogleProvider(BaseProvider):
         # 옵션 병합
         merged_options = {**self.options, **(options or {})}
 
-        # LangChain 스트리밍 클라이언트 생성
-        client = ChatGoogleGenerativeAI(
-            model=self.model,
-            google_api_key=self.api_key,
-            temperature=merged_options.get("temperature", 0.7),
-            streaming=True
-        )
+        # 풀에서 LangChain 스트리밍 클라이언트 가져오기
+        client = self._create_client(merged_options, streaming=True)
 
         # 메시지 변환
-        lc_messages = self._convert_to_langchain_messages(messages)
+        with metrics.span("convert"):
+            lc_messages = self._convert_messages(messages)
 
         # 스트리밍 응답 처리
-        for chunk in client.stream(lc_messages):
+        async for chunk in self._astream(client, lc_messages):
             if chunk.content:
                 yield chunk.content
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+다중 Provider 경주(hedged request) 모듈.
+같은 요청을 여러 Provider/모델에 (선택적으로 시차를 두고) 보내
+가장 먼저 완료된(스트리밍은 첫 토큰을 보낸) 응답을 사용하고 나머지는 취소합니다.
+"""
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+import asyncio
+import time
+
+from .base import BaseProvider
+
+
+def parse_race_target(spec: str) -> Tuple[str, Optional[str]]:
+    """
+    경주 대상 문자열을 (Provider 이름, 모델명)으로 변환
+
+    Args:
+        spec: "provider" 또는 "provider/model" 형식 문자열
+
+    Returns:
+        (Provider 이름, 모델명 또는 None)
+    """
+    provider, _, model = spec.strip().partition("/")
+    return provider, model or None
+
+
+def _label(provider: BaseProvider) -> str:
+    """결과 기록용 Provider 식별자"""
+    return f"{provider.name}/{provider.model}"
+
+
+async def _cancel_all(tasks: List[asyncio.Task]):
+    """진행 중인 태스크를 모두 취소하고 정리될 때까지 대기"""
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class HedgedProvider(BaseProvider):
+    """여러 Provider에 같은 요청을 보내 가장 빠른 응답을 사용하는 Provider"""
+
+    def __init__(self, providers: List[BaseProvider], hedge_delay: float = 0.0):
+        """
+        경주 Provider 초기화
+
+        Args:
+            providers: 경주에 참여할 Provider 인스턴스 목록 (첫 번째가 기본 Provider)
+            hedge_delay: 다음 후보를 시작하기 전 대기 시간(초). 0이면 동시에 시작하며,
+                앞선 후보가 실패하면 대기 없이 다음 후보를 시작
+        """
+        if not providers:
+            raise ValueError("경주할 Provider가 없습니다.")
+        self.providers = providers
+        self.hedge_delay = max(0.0, hedge_delay)
+        primary = providers[0]
+        self.name = primary.name
+        self.model = primary.model
+        # 경주 구성이 다르면 다른 요청으로 취급되도록 후보 목록을 옵션에 포함 (캐시 키 등)
+        self.options = {**primary.options, "race": [_label(p) for p in providers[1:]]}
+        self.supports_streaming = any(p.supports_streaming for p in providers)
+        self.supports_async = all(p.supports_async for p in providers)
+        # 마지막 요청의 경주 결과 (스트리밍은 응답 메타데이터가 없으므로 여기에 기록)
+        self.last_race: Optional[Dict[str, Any]] = None
+
+    def _process_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """기본 Provider의 옵션 처리 사용"""
+        return self.providers[0]._process_options(options)
+
+    def test_connection(self) -> Tuple[bool, str]:
+        """모든 후보의 연결 테스트 (하나라도 성공하면 성공)"""
+        results = [p.test_connection() for p in self.providers]
+        messages = "; ".join(f"{_label(p)}: {message}" for p, (_, message) in zip(self.providers, results))
+        return any(success for success, _ in results), messages
+
+    async def warm_up(self):
+        """모든 후보의 클라이언트 준비"""
+        await asyncio.gather(*(p.warm_up() for p in self.providers))
+
+    async def _race(self, start_candidate, discard=None) -> Tuple[int, Any, Dict[str, Any]]:
+        """
+        후보를 시차를 두고 시작하여 가장 먼저 성공한 결과 반환
+
+        Args:
+            start_candidate: 후보 인덱스를 받아 결과를 반환하는 코루틴 함수
+            discard: 승리하지 못했지만 성공한 후보의 결과를 정리하는 코루틴 함수
+                (같은 시점에 함께 끝났거나 취소 직전에 끝난 후보, 예: 열린 스트림 닫기)
+
+        Returns:
+            (승리한 후보 인덱스, 결과, 경주 기록)
+
+        Raises:
+            Exception: 모든 후보가 실패한 경우 첫 번째 후보의 예외
+        """
+        started = time.perf_counter()
+        running: Dict[asyncio.Task, int] = {}
+        errors: Dict[int, BaseException] = {}
+        losers: List[Any] = []
+        next_index = 0
+
+        def launch():
+            nonlocal next_index
+            task = asyncio.ensure_future(start_candidate(next_index))
+            running[task] = next_index
+            next_index += 1
+
+        launch()
+        try:
+            while running:
+                # 다음 후보를 시작할 시각까지만 기다림
+                more = next_index < len(self.providers)
+                timeout = self.hedge_delay if more else None
+                if more and not self.hedge_delay:
+                    launch()
+                    continue
+
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    launch()
+                    continue
+
+                # 함께 끝난 후보 중에서는 앞선(우선순위가 높은) 후보가 승리
+                winner = None
+                for task in sorted(done, key=running.get):
+                    index = running.pop(task)
+                    if task.exception() is not None:
+                        errors[index] = task.exception()
+                    elif winner is None:
+                        winner = index, task.result()
+                    else:
+                        losers.append(task.result())
+
+                if winner is not None:
+                    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+                    record = {
+                        "winner": _label(self.providers[winner[0]]),
+                        "candidates": [_label(p) for p in self.providers[:next_index]],
+                        "errors": {_label(self.providers[i]): f"{type(e).__name__}: {e}" for i, e in errors.items()},
+                        "elapsed_ms": elapsed_ms,
+                    }
+                    return winner[0], winner[1], record
+
+                # 실행 중인 후보가 모두 실패했으면 대기 없이 다음 후보 시작
+                if not running and next_index < len(self.providers):
+                    launch()
+        finally:
+            leftover = list(running)
+            await _cancel_all(leftover)
+            if discard is not None:
+                losers.extend(task.result() for task in leftover
+                              if not task.cancelled() and task.exception() is None)
+                for result in losers:
+                    await discard(result)
+
+        raise errors[min(errors)]
+
+    async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        가장 먼저 완료된 후보의 대화형 응답 반환
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Returns:
+            응답 결과 (metadata["race"]에 승자와 후보 목록 기록)
+        """
+        async def start_candidate(index: int) -> Dict[str, Any]:
+            return await self.providers[index].chat(messages, options)
+
+        _, response, record = await self._race(start_candidate)
+        self.last_race = record
+        response["metadata"] = {**response.get("metadata", {}), "race": record}
+        return response
+
+    async def stream_chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        첫 토큰을 가장 먼저 보낸 후보의 스트림 반환
+
+        스트리밍을 지원하지 않는 후보는 전체 응답을 하나의 청크로 취급합니다.
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Yields:
+            응답 청크
+        """
+        async def start_candidate(index: int) -> Tuple[AsyncIterator[str], Optional[str]]:
+            provider = self.providers[index]
+            if not provider.supports_streaming:
+                response = await provider.chat(messages, options)
+                return _single_chunk(response["content"]), None
+            iterator = provider.stream_chat(messages, options).__aiter__()
+            try:
+                return iterator, await iterator.__anext__()
+            except StopAsyncIteration:
+                return iterator, None
+            except BaseException:
+                # 취소되거나 실패한 후보의 스트림 정리
+                await iterator.aclose()
+                raise
+
+        async def discard(result: Tuple[AsyncIterator[str], Optional[str]]):
+            # 승리하지 못한 후보의 열린 스트림 닫기
+            aclose = getattr(result[0], "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        _, (iterator, first), record = await self._race(start_candidate, discard)
+        self.last_race = record
+        try:
+            if first is not None:
+                yield first
+            async for chunk in iterator:
+                yield chunk
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+async def _single_chunk(content: str) -> AsyncIterator[str]:
+    """전체 응답을 하나의 청크로 반환하는 스트림"""
+    yield content
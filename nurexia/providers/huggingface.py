@@ -5,22 +5,18 @@ from typing import Dict, Any, List, Optional, Tuple
 import os
 
 from langchain_huggingface import HuggingFaceEndpoint
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 from .base import BaseProvider
+from .. import metrics
+from .registry import PROVIDER_CATALOG
 
 class HuggingFaceProvider(BaseProvider):
     """HuggingFace API Provider"""
     name = "huggingface"
-    default_model = "HuggingFaceH4/zephyr-7b-beta"
-    available_models = [
-        "HuggingFaceH4/zephyr-7b-beta",
-        "mistralai/Mistral-7B-Instruct-v0.1",
-        "meta-llama/Llama-2-7b-chat-hf",
-        "tiiuae/falcon-7b-instruct",
-        "google/flan-t5-xxl"
-    ]
+    default_model = PROVIDER_CATALOG["huggingface"]["default_model"]
+    available_models = PROVIDER_CATALOG["huggingface"]["available_models"]
     supports_streaming = False  # 스트리밍 미지원
+    supports_async = True  # 네이티브 비동기 호출 지원
 
     def __init__(self, model: Optional[str] = None, **kwargs):
         """
@@ -75,67 +71,16 @@ class HuggingFaceProvider(BaseProvider):
             error_msg = str(e)
             return False, f"HuggingFace API 연결 실패: {error_msg}"
 
-    def _convert_to_langchain_messages(self, messages):
-        """
-        메시지를 LangChain 형식으로 변환
-
-        Args:
-            messages: 변환할 메시지 목록
-
-        Returns:
-            LangChain 메시지 목록
-        """
-        result = []
-        for msg in messages:
-            # Message 클래스 객체인 경우
-            if hasattr(msg, 'role') and hasattr(msg, 'content'):
-                role = msg.role.value if hasattr(msg.role, 'value') else str(msg.role)
-                if role == "user":
-                    result.append(HumanMessage(content=msg.content))
-                elif role == "assistant":
-                    result.append(AIMessage(content=msg.content))
-                elif role == "system":
-                    result.append(SystemMessage(content=msg.content))
-            # 딕셔너리인 경우
-            elif isinstance(msg, dict) and 'role' in msg and 'content' in msg:
-                if msg["role"] == "user":
-                    result.append(HumanMessage(content=msg["content"]))
-                elif msg["role"] == "assistant":
-                    result.append(AIMessage(content=msg["content"]))
-                elif msg["role"] == "system":
-                    result.append(SystemMessage(content=msg["content"]))
-        return result
-
-    def _format_prompt_from_messages(self, messages):
-        """
-        메시지 목록을 HuggingFace 형식의 프롬프트로 변환
-
-        Args:
-            messages: 변환할 메시지 목록
-
-        Returns:
-            HuggingFace 형식의 프롬프트
-        """
-        prompt = ""
-        for message in messages:
-            if hasattr(message, 'role') and hasattr(message, 'content'):
-                role = message.role.value if hasattr(message.role, 'value') else str(message.role)
-                content = message.content
-            elif isinstance(message, dict) and 'role' in message and 'content' in message:
-                role = message["role"]
-                content = message["content"]
-            else:
-                continue
-
-            if role == "system":
-                prompt += f"[SYSTEM] {content}\n"
-            elif role == "user":
-                prompt += f"[USER] {content}\n"
-            elif role == "assistant":
-                prompt += f"[ASSISTANT] {content}\n"
-
-        prompt += "[ASSISTANT] "
-        return prompt
+    def _create_client(self, options: Dict[str, Any], streaming: bool = False) -> Any:
+        """풀에서 HuggingFaceEndpoint 클라이언트 가져오기 (스트리밍 미지원)"""
+        return self._get_client(
+            HuggingFaceEndpoint,
+            endpoint_url=f"https://api-inference.huggingface.co/models/{self.model}",
+            huggingfacehub_api_token=self.api_key,
+            task="text-generation",
+            temperature=options.get("temperature", 0.7),
+            max_length=options.get("max_length", 1024)
+        )
 
     async def chat(self, messages, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -151,20 +96,15 @@ class HuggingFaceProvider(BaseProvider):
         # 옵션 병합
         merged_options = {**self.options, **(options or {})}
 
-        # HuggingFace 엔드포인트 클라이언트 생성
-        client = HuggingFaceEndpoint(
-            endpoint_url=f"https://api-inference.huggingface.co/models/{self.model}",
-            huggingfacehub_api_token=self.api_key,
-            task="text-generation",
-            temperature=merged_options.get("temperature", 0.7),
-            max_length=merged_options.get("max_length", 1024)
-        )
+        # 풀에서 HuggingFace 엔드포인트 클라이언트 가져오기
+        client = self._create_client(merged_options)
 
         # 대부분의 HuggingFace 모델은 채팅 형식이 아닌 텍스트 생성 형식이므로 메시지를 프롬프트로 변환
-        prompt = self._format_prompt_from_messages(messages)
+        with metrics.span("convert"):
+            prompt = self._format_prompt(messages)
 
         # 응답 생성
-        result = client.invoke(prompt)
+        result = await self._ainvoke(client, prompt)
 
         # 결과 반환
         return {
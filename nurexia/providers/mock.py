@@ -0,0 +1,323 @@
+"""
+Mock Provider 구현
+네트워크 없이 지연 시간 분포, 토큰 생성 속도, 오류를 흉내 내어
+워크플로우/스트리밍/배치 경로의 부하 테스트와 오버헤드 측정에 사용합니다.
+"""
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator, Callable
+import asyncio
+import math
+import random
+import re
+import time
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from .base import BaseProvider
+from .. import metrics
+from ..config import config_manager
+from ..graph.tokens import count_tokens
+from .registry import PROVIDER_CATALOG
+
+# lorem 모델이 응답을 만들 때 사용하는 단어
+_LOREM_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua ut enim ad minim veniam quis nostrud"
+).split()
+
+# 스트리밍 토큰 단위 (단어와 뒤따르는 공백)
+_TOKEN_PATTERN = re.compile(r"\s*\S+\s*|\s+")
+
+# 주입할 수 있는 오류 종류: 이름 -> (HTTP 상태 코드, 메시지). 상태 코드가 None이면 별도 예외 사용
+ERROR_KINDS: Dict[str, Tuple[Optional[int], str]] = {
+    "server": (500, "Internal server error"),
+    "overloaded": (529, "Overloaded"),
+    "rate_limit": (429, "Rate limit exceeded"),
+    "bad_request": (400, "Bad request"),
+    "timeout": (None, "Request timed out"),
+    "connection": (None, "Connection reset"),
+}
+
+
+class MockResponse:
+    """주입된 HTTP 오류의 응답 정보 (스케줄러가 Retry-After 헤더를 읽음)"""
+
+    def __init__(self, status_code: int, headers: Optional[Dict[str, str]] = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class MockProviderError(Exception):
+    """Mock Provider가 주입한 API 오류 (status_code로 재시도 여부가 결정됨)"""
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"{status_code} {message}")
+        self.status_code = status_code
+        headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+        self.response = MockResponse(status_code, headers)
+
+
+def make_error(kind: str) -> BaseException:
+    """
+    이름에 해당하는 주입 오류 생성
+
+    Args:
+        kind: ERROR_KINDS의 이름
+
+    Returns:
+        발생시킬 예외 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 오류 종류
+    """
+    if kind not in ERROR_KINDS:
+        raise ValueError(f"알 수 없는 오류 종류: {kind}. 사용 가능한 값: {', '.join(ERROR_KINDS)}")
+    status_code, message = ERROR_KINDS[kind]
+    if kind == "timeout":
+        return asyncio.TimeoutError(message)
+    if kind == "connection":
+        return ConnectionError(message)
+    return MockProviderError(status_code, message, retry_after=1.0 if kind == "rate_limit" else None)
+
+
+def parse_latency(spec: Any) -> Callable[[random.Random], float]:
+    """
+    지연 시간 분포 문자열을 표본 함수로 변환
+
+    지원 형식 (단위: 초):
+        "0.2" 또는 "fixed:0.2"       고정값
+        "uniform:0.1,0.5"           균등 분포
+        "normal:0.3,0.05"           정규 분포 (평균, 표준편차)
+        "lognormal:0.3,0.5"         로그정규 분포 (중앙값, 로그 표준편차; 긴 꼬리)
+        "exponential:0.3"           지수 분포 (평균)
+
+    Args:
+        spec: 분포 문자열 또는 숫자
+
+    Returns:
+        난수 생성기를 받아 0 이상의 지연 시간(초)을 반환하는 함수
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    if isinstance(spec, (int, float)):
+        kind, values = "fixed", [float(spec)]
+    else:
+        kind, _, args = str(spec).strip().partition(":")
+        if not args:
+            kind, args = "fixed", kind
+        try:
+            values = [float(v) for v in args.split(",")]
+        except ValueError:
+            raise ValueError(f"잘못된 지연 시간 분포: {spec}") from None
+
+    samplers: Dict[Tuple[str, int], Callable[[random.Random], float]] = {
+        ("fixed", 1): lambda rng: values[0],
+        ("uniform", 2): lambda rng: rng.uniform(values[0], values[1]),
+        ("normal", 2): lambda rng: rng.gauss(values[0], values[1]),
+        ("lognormal", 2): lambda rng: rng.lognormvariate(math.log(values[0]), values[1]) if values[0] > 0 else 0.0,
+        ("exponential", 1): lambda rng: rng.expovariate(1 / values[0]) if values[0] > 0 else 0.0,
+    }
+    sampler = samplers.get((kind, len(values)))
+    if sampler is None:
+        raise ValueError(f"잘못된 지연 시간 분포: {spec}")
+    return lambda rng: max(0.0, sampler(rng))
+
+
+def split_tokens(text: str) -> List[str]:
+    """응답 텍스트를 스트리밍 토큰(단어와 공백) 단위로 분할"""
+    return _TOKEN_PATTERN.findall(text)
+
+
+class MockChatModel:
+    """
+    LangChain 채팅 모델과 같은 비동기 호출 규약(ainvoke/astream)을 가진 가짜 클라이언트
+
+    실제 Provider와 같은 클라이언트 풀, 메시지 변환, 버퍼링 경로를 거치므로
+    측정되는 시간에서 설정한 지연을 빼면 nurexia 자체의 오버헤드가 됩니다.
+    """
+
+    def __init__(self, model: str, latency: Any = 0.0, token_rate: float = 0.0, error_rate: float = 0.0,
+                 error: str = "server", stream_error_rate: float = 0.0, response_tokens: int = 64,
+                 response: Optional[str] = None, seed: Optional[int] = None):
+        """
+        가짜 클라이언트 초기화
+
+        Args:
+            model: 응답 방식 (echo: 마지막 사용자 메시지 반복, lorem: response_tokens개 단어 생성)
+            latency: 첫 토큰까지의 지연 시간 분포 (parse_latency 형식)
+            token_rate: 초당 스트리밍 토큰 수 (0이면 대기 없음)
+            error_rate: 요청이 시작 전에 실패할 확률 (0~1)
+            error: 주입할 오류 종류 (ERROR_KINDS)
+            stream_error_rate: 스트림이 중간에 끊길 확률 (0~1)
+            response_tokens: lorem 응답의 단어 수
+            response: 지정하면 모델과 관계없이 항상 이 텍스트로 응답
+            seed: 난수 시드 (같은 시드는 같은 지연/오류 순서를 재현)
+        """
+        self.model = model
+        self.sample_latency = parse_latency(latency)
+        self.token_rate = max(0.0, token_rate)
+        self.error_rate = error_rate
+        self.error = error
+        self.stream_error_rate = stream_error_rate
+        self.response_tokens = response_tokens
+        self.response = response
+        self.rng = random.Random(seed)
+        make_error(error)  # 오류 종류를 생성 시점에 검증
+
+    def _respond(self, messages: Any) -> str:
+        """요청에 대한 응답 텍스트 생성"""
+        if self.response is not None:
+            return self.response
+        if self.model == "lorem":
+            words = _LOREM_WORDS
+            return " ".join(words[i % len(words)] for i in range(self.response_tokens))
+        # echo: 마지막 사용자 메시지를 그대로 반환
+        for message in reversed(messages):
+            if getattr(message, "type", None) == "human":
+                return message.content
+        return ""
+
+    def _prepare(self, messages: Any) -> Tuple[float, Optional[BaseException], str, Dict[str, int]]:
+        """지연 시간, 주입할 오류, 응답 텍스트, 토큰 사용량 결정"""
+        delay = self.sample_latency(self.rng)
+        error = make_error(self.error) if self.rng.random() < self.error_rate else None
+        text = self._respond(messages)
+        input_tokens = sum(count_tokens(getattr(m, "content", "")) for m in messages)
+        output_tokens = len(split_tokens(text))
+        usage = {"input_tokens": input_tokens, "output_tokens": output_tokens,
+                 "total_tokens": input_tokens + output_tokens}
+        return delay, error, text, usage
+
+    def _plan_stream(self, text: str) -> Tuple[List[str], Optional[int]]:
+        """스트리밍 토큰 목록과 (주입 시) 중단할 토큰 위치"""
+        tokens = split_tokens(text) or [""]
+        # 첫 토큰 이후에 끊겨야 재시도할 수 없는 중간 실패가 됨
+        broken = self.rng.random() < self.stream_error_rate
+        cut = self.rng.randrange(1, len(tokens)) if broken and len(tokens) > 1 else None
+        return tokens, cut
+
+    async def ainvoke(self, messages: Any, **kwargs) -> AIMessage:
+        """전체 응답 생성 (지연 시간 + 토큰 생성 시간 대기)"""
+        delay, error, text, usage = self._prepare(messages)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        if self.token_rate:
+            await asyncio.sleep(usage["output_tokens"] / self.token_rate)
+        return AIMessage(content=text, usage_metadata=usage, response_metadata={"model": self.model})
+
+    async def astream(self, messages: Any, **kwargs) -> AsyncIterator[AIMessageChunk]:
+        """토큰 단위 스트리밍 (토큰 간격은 누적 오차가 없도록 시작 시각 기준으로 계산)"""
+        delay, error, text, usage = self._prepare(messages)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        tokens, cut = self._plan_stream(text)
+        started = time.perf_counter()
+        for i, token in enumerate(tokens):
+            if i == cut:
+                raise make_error(self.error)
+            if self.token_rate:
+                wait = started + i / self.token_rate - time.perf_counter()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            last = i == len(tokens) - 1
+            yield AIMessageChunk(content=token, usage_metadata=usage if last else None)
+
+
+class MockProvider(BaseProvider):
+    """네트워크 없이 응답을 흉내 내는 Provider (부하 테스트/벤치마크용)"""
+    name = "mock"
+    default_model = PROVIDER_CATALOG["mock"]["default_model"]
+    available_models = PROVIDER_CATALOG["mock"]["available_models"]
+    supports_streaming = True
+    supports_async = True
+
+    # 환경 변수 대신 호출 옵션으로 지정할 수 있는 동작 설정
+    BEHAVIOR_OPTIONS = ("latency", "token_rate", "error_rate", "error", "stream_error_rate",
+                        "response_tokens", "response", "seed")
+
+    def _process_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Mock 옵션 처리 (지정하지 않은 동작 설정은 NUREXIA_MOCK_* 환경 변수 사용)
+
+        Args:
+            options: 처리할 옵션
+
+        Returns:
+            처리된 옵션
+        """
+        config = config_manager.get_provider_config(self.name)
+        processed_options = {"temperature": options.get("temperature", 0.7)}
+        for key in self.BEHAVIOR_OPTIONS:
+            processed_options[key] = options.get(key, config.get(key))
+        # 잘못된 분포는 첫 요청이 아닌 생성 시점에 오류로 알림
+        parse_latency(processed_options["latency"])
+        return processed_options
+
+    def test_connection(self) -> Tuple[bool, str]:
+        """
+        연결 테스트 (항상 성공)
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 메시지)
+        """
+        return True, f"Mock Provider 준비 완료! 모델: {self.model}, 지연 시간: {self.options['latency']}"
+
+    def _create_client(self, options: Dict[str, Any], streaming: bool = False) -> Any:
+        """풀에서 가짜 클라이언트 가져오기 (동작 설정별로 재사용)"""
+        return self._get_client(
+            MockChatModel,
+            model=self.model,
+            **{key: options[key] for key in self.BEHAVIOR_OPTIONS if options.get(key) is not None}
+        )
+
+    async def chat(self, messages, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        대화형 응답 생성
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Returns:
+            응답 결과
+        """
+        merged_options = {**self.options, **(options or {})}
+        client = self._create_client(merged_options)
+
+        with metrics.span("convert"):
+            lc_messages = self._convert_messages(messages)
+
+        result = await self._ainvoke(client, lc_messages)
+
+        return {
+            "content": result.content,
+            "raw_response": result,
+            "metadata": {
+                "model": self.model,
+                "provider": self.name,
+                "usage": result.usage_metadata
+            }
+        }
+
+    async def stream_chat(self, messages, options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        스트리밍 대화형 응답 생성
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Yields:
+            응답 청크
+        """
+        merged_options = {**self.options, **(options or {})}
+        client = self._create_client(merged_options, streaming=True)
+
+        with metrics.span("convert"):
+            lc_messages = self._convert_messages(messages)
+
+        async for chunk in self._astream(client, lc_messages):
+            if chunk.content:
+                yield chunk.content
@@ -2,26 +2,23 @@
 OpenAI API Provider 구현
 """
 from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+import hashlib
 import os
 
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 
 from .base import BaseProvider
+from .. import metrics
+from .registry import PROVIDER_CATALOG
 
 class OpenAIProvider(BaseProvider):
     """OpenAI API Provider"""
     name = "openai"
-    default_model = "gpt-4.5-preview-2025-02-27"
-    available_models = [
-        "gpt-3.5-turbo",
-        "gpt-4",
-        "gpt-4o",
-        "gpt-4-turbo",
-        "gpt-4-vision-preview",
-        "gpt-4.5-preview-2025-02-27"
-    ]
+    default_model = PROVIDER_CATALOG["openai"]["default_model"]
+    available_models = PROVIDER_CATALOG["openai"]["available_models"]
     supports_streaming = True  # 스트리밍 지원 활성화
+    supports_async = True  # 네이티브 비동기 호출 지원
 
     def __init__(self, model: Optional[str] = None, **kwargs):
         """
@@ -79,36 +76,37 @@ class OpenAIProvider(BaseProvider):
             error_msg = str(e)
             return False, f"OpenAI API 연결 실패: {error_msg}"
 
-    def _convert_to_langchain_messages(self, messages):
+    def _create_client(self, options: Dict[str, Any], streaming: bool = False) -> Any:
+        """풀에서 ChatOpenAI 클라이언트 가져오기 (생성 옵션별로 재사용)"""
+        client_kwargs = {"streaming": True} if streaming else {}
+        return self._get_client(
+            ChatOpenAI,
+            model=self.model,
+            openai_api_key=self.api_key,
+            temperature=options.get("temperature", 0.7),
+            **client_kwargs
+        )
+
+    def _cache_kwargs(self, messages: Any) -> Tuple[Dict[str, Any], int]:
         """
-        메시지를 LangChain 형식으로 변환
+        고정 구간에 대한 프롬프트 캐시 키 생성
+
+        OpenAI는 1024토큰 이상의 동일한 접두부를 자동으로 캐시하며, 같은 접두부를
+        가진 요청에 같은 prompt_cache_key를 보내면 캐시 적중률이 높아집니다.
 
         Args:
-            messages: 변환할 메시지 목록
+            messages: 대화 메시지 목록
 
         Returns:
-            LangChain 메시지 목록
+            (API 추가 인자, 캐시 대상 메시지 수)
         """
-        result = []
-        for msg in messages:
-            # Message 클래스 객체인 경우
-            if hasattr(msg, 'role') and hasattr(msg, 'content'):
-                role = msg.role.value if hasattr(msg.role, 'value') else str(msg.role)
-                if role == "user":
-                    result.append(HumanMessage(content=msg.content))
-                elif role == "assistant":
-                    result.append(AIMessage(content=msg.content))
-                elif role == "system":
-                    result.append(SystemMessage(content=msg.content))
-            # 딕셔너리인 경우
-            elif isinstance(msg, dict) and 'role' in msg and 'content' in msg:
-                if msg["role"] == "user":
-                    result.append(HumanMessage(content=msg["content"]))
-                elif msg["role"] == "assistant":
-                    result.append(AIMessage(content=msg["content"]))
-                elif msg["role"] == "system":
-                    result.append(SystemMessage(content=msg["content"]))
-        return result
+        prefix = self._cache_prefix_length(messages)
+        if not prefix:
+            return {}, 0
+        # 모델과 고정 구간 내용으로 키 생성 (구간 변환 결과는 메시지 저장소에 캐시됨)
+        source = f"{self.model}\n{self._format_prompt(messages[:prefix])}"
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:32]
+        return {"prompt_cache_key": f"nurexia-{digest}"}, prefix
 
     async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -124,27 +122,28 @@ class OpenAIProvider(BaseProvider):
         # 옵션 병합
         merged_options = {**self.options, **(options or {})}
 
-        # LangChain 클라이언트 생성
-        client = ChatOpenAI(
-            model=self.model,
-            openai_api_key=self.api_key,
-            temperature=merged_options.get("temperature", 0.7)
-        )
+        # 풀에서 LangChain 클라이언트 가져오기
+        client = self._create_client(merged_options)
 
-        # 메시지 변환
-        lc_messages = self._convert_to_langchain_messages(messages)
+        # 메시지 변환 (고정 구간은 프롬프트 캐시 키 지정)
+        with metrics.span("convert"):
+            lc_messages = self._convert_messages(messages)
+            cache_kwargs, prefix = self._cache_kwargs(messages)
 
         # 응답 생성
-        result = client.invoke(lc_messages)
+        result = await self._ainvoke(client, lc_messages, **cache_kwargs)
 
         # 결과 반환
+        metadata = {
+            "model": self.model,
+            "provider": self.name
+        }
+        if prefix:
+            metadata["prompt_cache"] = self._prompt_cache_metadata(result, prefix)
         return {
             "content": result.content,
             "raw_response": result,
-            "metadata": {
-                "model": self.model,
-                "provider": self.name
-            }
+            "metadata": metadata
         }
 
     async def stream_chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
@@ -161,18 +160,15 @@ class OpenAIProvider(BaseProvider):
         # 옵션 병합
         merged_options = {**self.options, **(options or {})}
 
-        # LangChain 스트리밍 클라이언트 생성
-        client = ChatOpenAI(
-            model=self.model,
-            openai_api_key=self.api_key,
-            temperature=merged_options.get("temperature", 0.7),
-            streaming=True
-        )
+        # 풀에서 LangChain 스트리밍 클라이언트 가져오기
+        client = self._create_client(merged_options, streaming=True)
 
-        # 메시지 변환
-        lc_messages = self._convert_to_langchain_messages(messages)
+        # 메시지 변환 (고정 구간은 프롬프트 캐시 키 지정, 캐시 적중 토큰은 계측의 usage에 기록)
+        with metrics.span("convert"):
+            lc_messages = self._convert_messages(messages)
+            cache_kwargs, _ = self._cache_kwargs(messages)
 
         # 스트리밍 응답 처리
-        for chunk in client.stream(lc_messages):
+        async for chunk in self._astream(client, lc_messages, **cache_kwargs):
             if chunk.content:
                 yield chunk.content
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+LLM 클라이언트 풀.
+Provider/모델/생성 옵션별로 생성된 클라이언트를 재사용하여
+설정 검증과 HTTP 연결(keep-alive) 비용을 줄입니다.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+import threading
+
+from ..config import config_manager
+
+
+class ClientPool:
+    """LRU 방식으로 오래된 클라이언트를 제거하는 프로세스 전역 클라이언트 풀"""
+
+    def __init__(self, max_size: int = 32):
+        """
+        클라이언트 풀 초기화
+
+        Args:
+            max_size: 보관할 최대 클라이언트 수
+        """
+        self.max_size = max(1, max_size)
+        self._clients: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        키에 해당하는 클라이언트를 반환하고, 없으면 생성하여 보관
+
+        Args:
+            key: 클라이언트 식별 키
+            factory: 클라이언트 생성 함수
+
+        Returns:
+            풀에 보관된 클라이언트
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return client
+
+        # 생성 비용이 큰 작업은 잠금 밖에서 수행
+        client = factory()
+
+        with self._lock:
+            existing = self._clients.get(key)
+            if existing is not None:
+                # 다른 스레드가 먼저 생성한 경우 기존 클라이언트 사용
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return existing
+
+            self.misses += 1
+            self._clients[key] = client
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def clear(self):
+        """보관 중인 모든 클라이언트 제거"""
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+def make_client_key(provider_name: str, factory: Callable[..., Any], client_kwargs: dict) -> Tuple:
+    """
+    클라이언트 풀 키 생성
+
+    Args:
+        provider_name: Provider 이름
+        factory: 클라이언트 클래스 또는 생성 함수
+        client_kwargs: 클라이언트 생성 인자
+
+    Returns:
+        해시 가능한 풀 키
+    """
+    items = tuple(sorted((name, repr(value)) for name, value in client_kwargs.items()))
+    return (provider_name, getattr(factory, "__qualname__", repr(factory)), items)
+
+
+# 싱글톤 인스턴스 생성
+client_pool = ClientPool(config_manager.client_pool_size)
@@ -0,0 +1,206 @@
+"""
+Provider 카탈로그 및 지연 로딩 참조.
+SDK를 import하지 않고도 Provider 메타데이터를 조회할 수 있도록
+모델 정보를 한곳에 모아 두고, 실제 구현 모듈은 최초 사용 시 import합니다.
+"""
+from typing import Dict, Any, List, Optional, Type
+import importlib
+import threading
+
+# 컨텍스트 한도를 알 수 없을 때 사용하는 기본값 (토큰)
+DEFAULT_CONTEXT_WINDOW = 4096
+
+# Provider 메타데이터 (구현 클래스도 이 값을 참조)
+# default_context_window/context_windows: 모델별 컨텍스트 한도 (토큰)
+PROVIDER_CATALOG: Dict[str, Dict[str, Any]] = {
+    "anthropic": {
+        "module": "anthropic",
+        "class_name": "AnthropicProvider",
+        "default_model": "claude-3-7-sonnet-20250219",
+        "available_models": [
+            "claude-3-haiku-20240307",
+            "claude-3-sonnet-20240229",
+            "claude-3-opus-20240229",
+            "claude-3-5-sonnet-20240620",
+            "claude-3-7-sonnet-20250219"
+        ],
+        "supports_streaming": True,
+        "default_context_window": 200000,
+    },
+    "openai": {
+        "module": "openai",
+        "class_name": "OpenAIProvider",
+        "default_model": "gpt-4.5-preview-2025-02-27",
+        "available_models": [
+            "gpt-3.5-turbo",
+            "gpt-4",
+            "gpt-4o",
+            "gpt-4-turbo",
+            "gpt-4-vision-preview",
+            "gpt-4.5-preview-2025-02-27"
+        ],
+        "supports_streaming": True,
+        "default_context_window": 128000,
+        "context_windows": {
+            "gpt-3.5-turbo": 16385,
+            "gpt-4": 8192,
+        },
+    },
+    "google": {
+        "module": "google",
+        "class_name": "GoogleProvider",
+        "default_model": "gemini-2.0-flash-001",
+        "available_models": [
+            "gemini-1.0-pro",
+            "gemini-1.5-pro",
+            "gemini-2.0-pro-001",
+            "gemini-2.0-flash-001"
+        ],
+        "supports_streaming": True,
+        "default_context_window": 1048576,
+        "context_windows": {
+            "gemini-1.0-pro": 32760,
+            "gemini-1.5-pro": 2097152,
+            "gemini-2.0-pro-001": 2097152,
+        },
+    },
+    "huggingface": {
+        "module": "huggingface",
+        "class_name": "HuggingFaceProvider",
+        "default_model": "HuggingFaceH4/zephyr-7b-beta",
+        "available_models": [
+            "HuggingFaceH4/zephyr-7b-beta",
+            "mistralai/Mistral-7B-Instruct-v0.1",
+            "meta-llama/Llama-2-7b-chat-hf",
+            "tiiuae/falcon-7b-instruct",
+            "google/flan-t5-xxl"
+        ],
+        "supports_streaming": False,
+        "default_context_window": 4096,
+        "context_windows": {
+            "mistralai/Mistral-7B-Instruct-v0.1": 8192,
+            "tiiuae/falcon-7b-instruct": 2048,
+            "google/flan-t5-xxl": 512,
+        },
+    },
+    "ollama": {
+        "module": "ollama",
+        "class_name": "OllamaProvider",
+        "default_model": "gemma3:12b",
+        "available_models": [
+            "gemma:2b",
+            "gemma:7b",
+            "gemma3:12b",
+            "llama2:7b",
+            "llama2:13b",
+            "llama3:8b",
+            "llama3:70b",
+            "mistral:7b",
+            "mixtral:8x7b"
+        ],
+        "supports_streaming": True,
+        "default_context_window": 8192,
+        "context_windows": {
+            "llama2:7b": 4096,
+            "llama2:13b": 4096,
+            "gemma3:12b": 131072,
+            "mistral:7b": 32768,
+            "mixtral:8x7b": 32768,
+        },
+    },
+    # 네트워크 없이 지연/토큰 속도/오류를 흉내 내는 부하 테스트용 Provider
+    "mock": {
+        "module": "mock",
+        "class_name": "MockProvider",
+        "default_model": "echo",
+        "available_models": ["echo", "lorem"],
+        "supports_streaming": True,
+        "default_context_window": 128000,
+    },
+    # 기록된 응답(--record)을 원래 시각대로 재생하는 Provider
+    "replay": {
+        "module": "replay",
+        "class_name": "ReplayProvider",
+        "default_model": "cassette",
+        "available_models": ["cassette"],
+        "supports_streaming": True,
+        "default_context_window": 128000,
+    },
+}
+
+
+def get_context_window(provider_name: str, model: Optional[str] = None) -> int:
+    """
+    모델의 컨텍스트 한도(토큰) 조회
+
+    Args:
+        provider_name: Provider 이름
+        model: 모델명 (None이면 Provider 기본 모델)
+
+    Returns:
+        컨텍스트 한도 (알 수 없으면 DEFAULT_CONTEXT_WINDOW)
+    """
+    spec = PROVIDER_CATALOG.get(provider_name, {})
+    model = model or spec.get("default_model")
+    windows = spec.get("context_windows", {})
+    return windows.get(model, spec.get("default_context_window", DEFAULT_CONTEXT_WINDOW))
+
+
+class LazyProvider:
+    """
+    Provider 클래스에 대한 지연 로딩 참조
+
+    메타데이터(default_model, available_models 등)는 즉시 제공하고,
+    구현 모듈과 SDK는 인스턴스를 처음 생성할 때 import합니다.
+    """
+
+    def __init__(self, name: str, module: str, class_name: str, default_model: str,
+                 available_models: List[str], supports_streaming: bool = False, **metadata):
+        """
+        지연 로딩 참조 초기화
+
+        Args:
+            name: Provider 이름
+            module: nurexia.providers 하위 구현 모듈명
+            class_name: 구현 클래스명
+            default_model: 기본 모델명
+            available_models: 사용 가능한 모델 목록
+            supports_streaming: 스트리밍 지원 여부
+            **metadata: 추가 메타데이터
+        """
+        self.name = name
+        self.module = module
+        self.class_name = class_name
+        self.default_model = default_model
+        self.available_models = available_models
+        self.supports_streaming = supports_streaming
+        self.metadata = metadata
+        self._provider_class: Optional[Type] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """구현 클래스가 이미 import되었는지 여부"""
+        return self._provider_class is not None
+
+    def load(self) -> Type:
+        """
+        구현 클래스를 import하여 반환
+
+        Returns:
+            Provider 클래스
+        """
+        if self._provider_class is None:
+            with self._lock:
+                if self._provider_class is None:
+                    module = importlib.import_module(f".{self.module}", __package__)
+                    self._provider_class = getattr(module, self.class_name)
+        return self._provider_class
+
+    def __call__(self, *args, **kwargs):
+        """Provider 인스턴스 생성 (이 시점에 구현 모듈을 import)"""
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "lazy"
+        return f"<LazyProvider {self.name} ({self.module}.{self.class_name}, {state})>"
@@ -0,0 +1,319 @@
+"""
+응답 기록/재생 모듈.
+실제 Provider와 주고받은 chat/stream_chat 응답을 청크별 시각과 함께 JSONL 파일(카세트)에
+기록하고, replay Provider로 원래 속도(또는 배속)대로 재생하여 네트워크 없이
+실제와 같은 응답 패턴으로 워크플로우/스트리밍/배치 경로를 테스트합니다.
+"""
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator, Union
+import asyncio
+import json
+import os
+import threading
+import time
+
+from .base import BaseProvider, ProviderWrapper
+from .cache import make_cache_key
+from ..config import config_manager
+from .registry import PROVIDER_CATALOG
+
+
+def request_key(messages: List[Any]) -> str:
+    """
+    카세트 항목을 찾기 위한 요청 키 (Provider/모델/생성 옵션과 무관하게 메시지만 사용)
+
+    Args:
+        messages: 대화 메시지 목록
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    return make_cache_key("", "", messages, {})
+
+
+class Cassette:
+    """기록된 응답을 담는 JSONL 파일 (한 줄에 요청 하나)"""
+
+    def __init__(self, path: str):
+        """
+        카세트 초기화
+
+        Args:
+            path: JSONL 파일 경로
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._entries: Optional[List[Dict[str, Any]]] = None
+        self._by_key: Dict[str, List[int]] = {}
+        self._cursors: Dict[Optional[str], int] = {}
+
+    def append(self, entry: Dict[str, Any]):
+        """
+        응답 항목 하나를 파일 끝에 추가
+
+        Args:
+            entry: 기록할 항목
+        """
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            # 이미 읽어 둔 항목이 있으면 다음 조회에서 다시 읽도록 무효화
+            self._entries = None
+
+    def _load(self) -> List[Dict[str, Any]]:
+        """파일의 항목을 읽어 요청 키별로 색인 (잠금을 잡은 상태에서 호출)"""
+        if self._entries is None:
+            entries = []
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue
+                        if isinstance(entry, dict) and "content" in entry:
+                            entries.append(entry)
+            except FileNotFoundError:
+                pass
+            self._entries = entries
+            self._by_key = {}
+            for i, entry in enumerate(entries):
+                self._by_key.setdefault(entry.get("key"), []).append(i)
+        return self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def next_entry(self, key: str, strict: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        요청에 재생할 항목 선택
+
+        같은 요청이 여러 번 기록되었으면 기록된 순서대로 돌아가며 반환하고,
+        일치하는 요청이 없으면 (strict가 아닐 때) 전체 항목을 기록 순서대로 반환합니다.
+
+        Args:
+            key: request_key()로 계산한 요청 키
+            strict: 참이면 일치하는 요청만 재생
+
+        Returns:
+            카세트 항목 (재생할 항목이 없으면 None)
+        """
+        with self._lock:
+            entries = self._load()
+            indexes = self._by_key.get(key)
+            if indexes is None:
+                if strict or not entries:
+                    return None
+                key, indexes = None, range(len(entries))
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            return entries[indexes[cursor % len(indexes)]]
+
+
+# 경로별 카세트 (요청마다 Provider를 새로 만들어도 재생 순서와 파일 잠금을 공유)
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str) -> Cassette:
+    """
+    경로에 해당하는 공용 카세트 반환
+
+    Args:
+        path: JSONL 파일 경로
+
+    Returns:
+        Cassette 인스턴스
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+        return _cassettes[path]
+
+
+class RecordingProvider(ProviderWrapper):
+    """감싼 Provider의 응답을 카세트에 기록하는 래퍼"""
+
+    def __init__(self, provider: BaseProvider, cassette: Union[str, Cassette]):
+        """
+        기록 Provider 초기화
+
+        Args:
+            provider: 감쌀 Provider 인스턴스
+            cassette: 기록할 카세트 또는 파일 경로
+        """
+        super().__init__(provider)
+        self.cassette = get_cassette(cassette) if isinstance(cassette, str) else cassette
+
+    def _record(self, messages: List[Any], kind: str, content: str, latency: float,
+                metadata: Optional[Dict[str, Any]] = None, chunks: Optional[List[Tuple[float, str]]] = None):
+        """응답 하나를 카세트에 추가"""
+        entry = {
+            "key": request_key(messages),
+            "provider": self.name,
+            "model": self.model,
+            "kind": kind,
+            "content": content,
+            "latency": round(latency, 6),
+            "metadata": metadata or {},
+            "recorded_at": time.time(),
+        }
+        if chunks is not None:
+            entry["chunks"] = chunks
+        self.cassette.append(entry)
+
+    async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        대화형 응답을 생성하고 소요 시간과 함께 기록
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Returns:
+            응답 결과
+        """
+        started = time.perf_counter()
+        response = await self.provider.chat(messages, options)
+        self._record(messages, "chat", response["content"], time.perf_counter() - started, response.get("metadata"))
+        return response
+
+    async def stream_chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        스트리밍 응답을 전달하면서 청크별 시각(요청 시작 기준 초)을 기록
+
+        스트림이 정상 종료된 경우에만 기록합니다.
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Yields:
+            응답 청크
+        """
+        started = time.perf_counter()
+        chunks = []
+        async for chunk in self.provider.stream_chat(messages, options):
+            chunks.append((round(time.perf_counter() - started, 6), chunk))
+            yield chunk
+        self._record(messages, "stream", "".join(chunk for _, chunk in chunks),
+                     time.perf_counter() - started, {"model": self.model, "provider": self.name}, chunks)
+
+
+class ReplayProvider(BaseProvider):
+    """카세트에 기록된 응답을 원래 시각대로 재생하는 Provider"""
+    name = "replay"
+    default_model = PROVIDER_CATALOG["replay"]["default_model"]
+    available_models = PROVIDER_CATALOG["replay"]["available_models"]
+    supports_streaming = True
+    supports_async = True
+
+    def __init__(self, model: Optional[str] = None, **kwargs):
+        """
+        재생 Provider 초기화
+
+        Args:
+            model: 모델명 (재생에는 영향 없음)
+            **kwargs: 추가 옵션 (cassette: 카세트 경로, speed: 재생 배속, strict: 일치하는 요청만 재생)
+        """
+        super().__init__(model, **kwargs)
+        self.cassette = get_cassette(self.options["cassette"])
+
+    def _process_options(self, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        재생 옵션 처리 (지정하지 않으면 NUREXIA_REPLAY_* 환경 변수 사용)
+
+        Args:
+            options: 처리할 옵션
+
+        Returns:
+            처리된 옵션
+        """
+        config = config_manager.get_provider_config(self.name)
+        return {
+            "temperature": options.get("temperature", 0.7),
+            "cassette": options.get("cassette") or config["cassette"],
+            "speed": max(0.0, float(options.get("speed", config["speed"]))),
+            "strict": bool(options.get("strict", config["strict"])),
+        }
+
+    def test_connection(self) -> Tuple[bool, str]:
+        """
+        카세트 파일 확인
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 메시지)
+        """
+        count = len(self.cassette)
+        if not count:
+            return False, f"재생할 응답이 없습니다: {self.cassette.path}"
+        return True, f"카세트 준비 완료! {self.cassette.path} ({count}개 응답)"
+
+    def _next_entry(self, messages: Any, options: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], float]:
+        """재생할 항목과 배속 (항목이 없으면 LookupError)"""
+        merged_options = {**self.options, **(options or {})}
+        entry = self.cassette.next_entry(request_key(messages), merged_options["strict"])
+        if entry is None:
+            raise LookupError(f"카세트에 재생할 응답이 없습니다: {self.cassette.path}")
+        return entry, merged_options["speed"]
+
+    @staticmethod
+    async def _wait_until(started: float, offset: float, speed: float):
+        """요청 시작 후 offset초(배속 적용) 시점까지 대기 (speed가 0이면 대기 없음)"""
+        if speed:
+            delay = started + offset / speed - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def _metadata(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """재생 응답의 메타데이터 (원래 Provider/모델 기록)"""
+        metadata = {k: v for k, v in (entry.get("metadata") or {}).items() if k not in ("cache", "race")}
+        metadata.update({
+            "model": self.model,
+            "provider": self.name,
+            "recorded": f"{entry.get('provider')}/{entry.get('model')}",
+        })
+        return metadata
+
+    async def chat(self, messages, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        기록된 응답을 원래 소요 시간 후 반환
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Returns:
+            응답 결과
+        """
+        started = time.perf_counter()
+        entry, speed = self._next_entry(messages, options)
+        await self._wait_until(started, entry.get("latency", 0.0), speed)
+        return {
+            "content": entry["content"],
+            "raw_response": None,
+            "metadata": self._metadata(entry)
+        }
+
+    async def stream_chat(self, messages, options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        기록된 청크를 원래 시각대로 스트리밍 (chat으로 기록된 응답은 소요 시간 후 한 번에 반환)
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션
+
+        Yields:
+            응답 청크
+        """
+        started = time.perf_counter()
+        entry, speed = self._next_entry(messages, options)
+        chunks = entry.get("chunks") or [(entry.get("latency", 0.0), entry["content"])]
+        for offset, chunk in chunks:
+            await self._wait_until(started, offset, speed)
+            yield chunk
@@ -0,0 +1,379 @@
+"""
+Provider 요청 스케줄러.
+Provider별 토큰 버킷 속도 제한(분당 요청/토큰), 동시 실행 상한,
+호출 제한 시간, 지터가 포함된 지수 백오프 재시도를 제공합니다.
+"""
+from typing import Dict, Any, List, Optional, AsyncIterator, Awaitable, Callable
+import asyncio
+import random
+import threading
+import time
+import weakref
+
+from .base import BaseProvider, ProviderWrapper
+from ..config import config_manager
+from ..graph.tokens import count_message_tokens
+
+# 재시도 대상 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+# 상태 코드가 없을 때 재시도 대상으로 판단하는 예외 클래스 이름
+RETRYABLE_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "OverloadedError",
+    "ServiceUnavailable",
+    "ResourceExhausted",
+    "DeadlineExceeded",
+    "ConnectError",
+    "ConnectTimeout",
+    "ReadTimeout",
+    "RemoteProtocolError",
+}
+
+
+def estimate_tokens(messages: List[Any]) -> int:
+    """
+    분당 토큰 제한을 위한 요청 토큰 수 추정
+
+    Args:
+        messages: 대화 메시지 목록
+
+    Returns:
+        추정 토큰 수
+    """
+    if hasattr(messages, "token_counts"):
+        return sum(messages.token_counts())
+    return sum(count_message_tokens(msg) for msg in messages)
+
+
+def _get_status_code(error: BaseException) -> Optional[int]:
+    """예외에서 HTTP 상태 코드 추출"""
+    for attr in ("status_code", "status", "code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    재시도 가능한 오류인지 판단
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        제한 시간 초과, 연결 오류, 429/5xx 응답이면 True
+    """
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    status_code = _get_status_code(error)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def _get_retry_after(error: BaseException) -> Optional[float]:
+    """응답의 Retry-After 헤더 값(초) 추출"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """분당 처리량을 제한하는 비동기 토큰 버킷"""
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            per_minute: 분당 보충되는 토큰 수. 0 이하면 제한 없음
+            capacity: 최대 누적 토큰 수 (기본값: per_minute)
+        """
+        self.per_minute = per_minute
+        self.capacity = capacity or per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def unlimited(self) -> bool:
+        """제한 없음 여부"""
+        return self.per_minute <= 0
+
+    def _reserve(self, amount: float) -> float:
+        """토큰을 예약하고 사용 가능해질 때까지 기다려야 하는 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            rate = self.per_minute / 60.0
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            # 용량보다 큰 요청은 용량만큼만 차감하여 영구 대기를 방지
+            self._tokens -= min(amount, self.capacity)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / rate
+
+    async def acquire(self, amount: float = 1):
+        """
+        토큰을 확보할 때까지 대기
+
+        Args:
+            amount: 필요한 토큰 수
+        """
+        if self.unlimited:
+            return
+        delay = self._reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RequestScheduler:
+    """Provider 하나에 대한 속도 제한, 동시 실행 상한, 재시도 정책"""
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 max_in_flight: int = 16, timeout: float = 0, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0, idle_timeout: float = 0):
+        """
+        스케줄러 초기화
+
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (0이면 제한 없음)
+            tokens_per_minute: 분당 최대 입력 토큰 수 (0이면 제한 없음)
+            max_in_flight: 최대 동시 실행 요청 수
+            timeout: 호출당 제한 시간(초, 재시도와 대기 포함, 스트림은 첫 청크까지, 0이면 제한 없음)
+            max_retries: 최대 재시도 횟수
+            backoff_base: 첫 재시도 대기 시간(초)
+            backoff_max: 최대 재시도 대기 시간(초)
+            idle_timeout: 스트림 청크 사이의 최대 대기 시간(초, 0이면 제한 없음)
+        """
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.max_in_flight = max(1, max_in_flight)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.idle_timeout = idle_timeout
+        # 이벤트 루프별 세마포어 (루프 객체를 키로 사용, 닫힌 루프의 항목은 제거)
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프용 동시 실행 세마포어 반환"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # 대기한 적 있는 세마포어는 루프를 참조하므로 약한 참조만으로는 정리되지 않음
+            for closed in [other for other in self._semaphores if other.is_closed()]:
+                del self._semaphores[closed]
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_in_flight)
+        return semaphore
+
+    def backoff_delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        재시도 대기 시간 계산 (full jitter 지수 백오프, Retry-After 우선)
+
+        Args:
+            attempt: 0부터 시작하는 재시도 순번
+            error: 직전에 발생한 예외
+
+        Returns:
+            대기 시간(초)
+        """
+        retry_after = _get_retry_after(error) if error is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def _admit(self, estimated_tokens: int):
+        """속도 제한 토큰 확보"""
+        await self.request_bucket.acquire(1)
+        await self.token_bucket.acquire(estimated_tokens)
+
+    def _deadline(self, timeout: Optional[float]) -> Optional[float]:
+        """호출 마감 시각 계산"""
+        timeout = self.timeout if timeout is None else timeout
+        return time.monotonic() + timeout if timeout else None
+
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """마감까지 남은 시간 (마감이 지났으면 TimeoutError)"""
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        return remaining
+
+    def _retry_delay(self, attempt: int, error: BaseException, deadline: Optional[float]) -> Optional[float]:
+        """
+        재시도 전 대기 시간 계산
+
+        Args:
+            attempt: 0부터 시작하는 재시도 순번
+            error: 직전에 발생한 예외
+            deadline: 호출 마감 시각
+
+        Returns:
+            대기 시간(초), 재시도하지 않으면 None (재시도 한도 초과, 재시도 불가 오류, 대기 중 마감 도달)
+        """
+        if attempt >= self.max_retries or not is_retryable(error):
+            return None
+        delay = self.backoff_delay(attempt, error)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    async def run(self, call: Callable[[], Awaitable[Any]], estimated_tokens: int = 0,
+                  timeout: Optional[float] = None) -> Any:
+        """
+        스케줄링 정책을 적용하여 비동기 호출 실행
+
+        Args:
+            call: 호출할 때마다 새 코루틴을 반환하는 함수
+            estimated_tokens: 분당 토큰 제한에 사용할 추정 토큰 수
+            timeout: 호출 전체 제한 시간(초, 재시도와 대기 포함, 기본값: 스케줄러 설정)
+
+        Returns:
+            호출 결과
+        """
+        deadline = self._deadline(timeout)
+        attempt = 0
+        while True:
+            await self._admit(estimated_tokens)
+            try:
+                async with self._semaphore():
+                    return await asyncio.wait_for(call(), self._remaining(deadline))
+            except Exception as e:
+                delay = self._retry_delay(attempt, e, deadline)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def stream(self, call: Callable[[], AsyncIterator[Any]], estimated_tokens: int = 0,
+                     timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """
+        스케줄링 정책을 적용하여 스트림 실행
+
+        첫 청크를 받기 전에 발생한 오류만 재시도합니다. 제한 시간은 첫 청크까지(재시도 포함)
+        적용되고, 이후에는 청크 사이의 대기 시간(idle_timeout)만 제한하므로 긴 응답도 끊기지 않습니다.
+
+        Args:
+            call: 호출할 때마다 새 비동기 이터레이터를 반환하는 함수
+            estimated_tokens: 분당 토큰 제한에 사용할 추정 토큰 수
+            timeout: 첫 청크까지의 제한 시간(초, 기본값: 스케줄러 설정)
+
+        Yields:
+            스트림 청크
+        """
+        deadline = self._deadline(timeout)
+        attempt = 0
+        while True:
+            await self._admit(estimated_tokens)
+            started = False
+            async with self._semaphore():
+                iterator = call().__aiter__()
+                try:
+                    while True:
+                        wait = (self.idle_timeout or None) if started else self._remaining(deadline)
+                        try:
+                            chunk = await asyncio.wait_for(iterator.__anext__(), wait)
+                        except StopAsyncIteration:
+                            return
+                        started = True
+                        yield chunk
+                except Exception as e:
+                    delay = None if started else self._retry_delay(attempt, e, deadline)
+                    if delay is None:
+                        raise
+                finally:
+                    aclose = getattr(iterator, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+# Provider별 스케줄러 (프로세스 전역에서 속도 제한을 공유)
+_schedulers: Dict[str, RequestScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(provider_name: str) -> RequestScheduler:
+    """
+    Provider의 공유 스케줄러 반환 (설정은 ConfigManager에서 읽음)
+
+    Args:
+        provider_name: Provider 이름
+
+    Returns:
+        RequestScheduler 인스턴스
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(provider_name)
+        if scheduler is None:
+            scheduler = RequestScheduler(**config_manager.get_scheduler_config(provider_name))
+            _schedulers[provider_name] = scheduler
+        return scheduler
+
+
+class ScheduledProvider(ProviderWrapper):
+    """요청 스케줄러를 거쳐 호출하는 Provider 래퍼"""
+
+    def __init__(self, provider: BaseProvider, scheduler: Optional[RequestScheduler] = None):
+        """
+        스케줄 Provider 초기화
+
+        Args:
+            provider: 감쌀 Provider 인스턴스
+            scheduler: 사용할 스케줄러 (기본값: Provider별 공유 스케줄러)
+        """
+        super().__init__(provider)
+        self.scheduler = scheduler or get_scheduler(provider.name)
+
+    async def chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        속도 제한과 재시도를 적용하여 대화형 응답 생성
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션 (timeout: 호출 제한 시간)
+
+        Returns:
+            응답 결과
+        """
+        return await self.scheduler.run(
+            lambda: self.provider.chat(messages, options),
+            estimated_tokens=estimate_tokens(messages),
+            timeout=(options or {}).get("timeout")
+        )
+
+    async def stream_chat(self, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """
+        속도 제한과 재시도를 적용하여 스트리밍 응답 생성
+
+        Args:
+            messages: 대화 메시지 목록
+            options: 추가 옵션 (timeout: 첫 청크까지의 제한 시간)
+
+        Yields:
+            응답 청크
+        """
+        async for chunk in self.scheduler.stream(
+            lambda: self.provider.stream_chat(messages, options),
+            estimated_tokens=estimate_tokens(messages),
+            timeout=(options or {}).get("timeout")
+        ):
+            yield chunk
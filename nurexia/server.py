@@ -0,0 +1,298 @@
+"""
+로컬 서버 모드.
+하나의 프로세스에서 Provider와 클라이언트 풀을 유지한 채
+워크플로우를 HTTP로 제공합니다.
+
+엔드포인트:
+    GET  /health          서버 상태 확인
+    POST /v1/chat         워크플로우 실행 결과를 JSON으로 반환
+    POST /v1/chat/stream  응답 청크를 SSE(text/event-stream)로 전송
+    POST /v1/batch        JSONL 요청 본문을 실행하고 결과를 JSONL로 전송
+"""
+from typing import Dict, Any, Optional, Tuple
+import asyncio
+import io
+import json
+
+from . import __version__
+from .graph.workflow import create_workflow
+from .providers import PROVIDERS
+from .utils.batch import build_batch_state, execute_batch
+from .utils.streaming import iter_streaming
+from .providers.cascade import CascadeBoundary
+
+# 허용하는 최대 요청 본문 크기 (바이트)
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """HTTP 상태 코드를 갖는 요청 처리 오류"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class _ChunkedSink:
+    """execute_batch 출력을 HTTP chunked 응답으로 전달하는 쓰기 어댑터"""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+
+    def write(self, data: str):
+        encoded = data.encode("utf-8")
+        self.writer.write(b"%x\r\n%s\r\n" % (len(encoded), encoded))
+
+    def flush(self):
+        pass
+
+
+class NurexiaServer:
+    """워크플로우와 스트리밍을 HTTP로 제공하는 asyncio 기반 서버"""
+
+    def __init__(self, defaults: Dict[str, Any], concurrency: int = 32):
+        """
+        서버 초기화
+
+        Args:
+            defaults: 요청에 값이 없을 때 사용할 GraphState 기본 인자
+            concurrency: 배치 요청의 최대 동시 실행 수
+        """
+        self.defaults = defaults
+        self.concurrency = concurrency
+        self.workflow = create_workflow()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def preload(self, provider_names=None):
+        """
+        Provider 구현 모듈을 미리 import하여 첫 요청의 지연을 제거
+
+        Args:
+            provider_names: 미리 불러올 Provider 이름 목록 (기본값: 전체)
+        """
+        loop = asyncio.get_running_loop()
+        for name in provider_names or list(PROVIDERS):
+            if name not in PROVIDERS:
+                continue
+            try:
+                await loop.run_in_executor(None, PROVIDERS[name].load)
+            except ImportError:
+                # 설치되지 않은 백엔드는 요청 시 오류로 보고
+                pass
+
+    async def start(self, host: str, port: int):
+        """
+        서버 소켓을 열고 요청 수신 시작
+
+        Args:
+            host: 바인딩할 호스트
+            port: 바인딩할 포트
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+
+    async def serve_forever(self):
+        """서버가 종료될 때까지 요청 처리"""
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        """HTTP 요청 하나를 읽어 (method, path, headers, body)로 반환 (연결 종료 시 None)"""
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+
+        try:
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "Malformed request line")
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", "0") or 0)
+        if length > MAX_BODY_SIZE:
+            raise HTTPError(413, "Request body too large")
+        body = await reader.readexactly(length) if length else b""
+
+        return method.upper(), target.split("?", 1)[0], headers, body
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 하나에서 keep-alive로 들어오는 요청들을 순서대로 처리"""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as e:
+                    await self._send_json(writer, e.status, {"error": e.message}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                try:
+                    await self._dispatch(writer, method, path, body, keep_alive)
+                except HTTPError as e:
+                    await self._send_json(writer, e.status, {"error": e.message}, keep_alive)
+                except Exception as e:
+                    await self._send_json(writer, 500, {"error": f"{type(e).__name__}: {e}"}, keep_alive)
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, writer: asyncio.StreamWriter, method: str, path: str, body: bytes, keep_alive: bool):
+        """경로별 핸들러 호출"""
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(405, "Use GET")
+            await self._send_json(writer, 200, {"status": "ok", "version": __version__}, keep_alive)
+            return
+
+        routes = {
+            "/v1/chat": self._handle_chat,
+            "/v1/chat/stream": self._handle_stream,
+            "/v1/batch": self._handle_batch,
+        }
+        handler = routes.get(path)
+        if handler is None:
+            raise HTTPError(404, f"Unknown path: {path}")
+        if method != "POST":
+            raise HTTPError(405, "Use POST")
+        await handler(writer, body, keep_alive)
+
+    def _parse_item(self, body: bytes) -> Dict[str, Any]:
+        """요청 본문을 배치 요청과 같은 형식의 딕셔너리로 변환"""
+        try:
+            item = json.loads(body.decode("utf-8") or "{}")
+        except ValueError:
+            raise HTTPError(400, "Request body must be JSON")
+        if not isinstance(item, dict) or ("prompt" not in item and "messages" not in item):
+            raise HTTPError(400, "Request requires 'prompt' or 'messages'")
+        return item
+
+    async def _handle_chat(self, writer: asyncio.StreamWriter, body: bytes, keep_alive: bool):
+        """워크플로우를 실행하고 결과를 JSON으로 반환"""
+        state = build_batch_state(self._parse_item(body), self.defaults)
+        state = await self.workflow.ainvoke(state)
+        await self._send_json(writer, 200, {
+            "result": state.result,
+            "error": state.error,
+            "provider": state.provider,
+            "model": state.model,
+            "metadata": state.metadata
+        }, keep_alive)
+
+    async def _handle_stream(self, writer: asyncio.StreamWriter, body: bytes, keep_alive: bool):
+        """응답 청크를 SSE 이벤트로 전송"""
+        state = build_batch_state(self._parse_item(body), self.defaults)
+        await self._send_head(writer, 200, "text/event-stream", keep_alive, {"Cache-Control": "no-cache"})
+        sink = _ChunkedSink(writer)
+
+        try:
+            async for chunk in iter_streaming(state):
+                if isinstance(chunk, CascadeBoundary):
+                    # 단계적 모드에서 상위 Provider로 넘어가는 지점은 별도 이벤트로 전달
+                    escalation = json.dumps({"text": str(chunk), **chunk.info}, ensure_ascii=False)
+                    sink.write(f"event: escalate\ndata: {escalation}\n\n")
+                else:
+                    sink.write(f"data: {json.dumps({'chunk': chunk}, ensure_ascii=False)}\n\n")
+                # 느린 클라이언트에 대해 배압 적용
+                await writer.drain()
+            sink.write("event: done\ndata: {}\n\n")
+        except Exception as e:
+            error = json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False)
+            sink.write(f"event: error\ndata: {error}\n\n")
+
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _handle_batch(self, writer: asyncio.StreamWriter, body: bytes, keep_alive: bool):
+        """JSONL 본문을 제한된 동시성으로 실행하고 결과를 JSONL로 전송"""
+        # 응답 헤더를 보낸 뒤에는 오류 응답을 보낼 수 없으므로 본문은 먼저 검사
+        try:
+            source = io.StringIO(body.decode("utf-8"))
+        except UnicodeDecodeError:
+            raise HTTPError(400, "Request body must be UTF-8 JSONL")
+        await self._send_head(writer, 200, "application/x-ndjson", keep_alive)
+        sink = _ChunkedSink(writer)
+
+        try:
+            await execute_batch(
+                self.workflow,
+                source,
+                sink,
+                self.defaults,
+                concurrency=self.concurrency
+            )
+        except Exception as e:
+            # 배치 도중 오류는 오류 레코드로 전달하고 chunked 응답을 정상 종료
+            sink.write(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False) + "\n")
+
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _send_head(self, writer: asyncio.StreamWriter, status: int, content_type: str,
+                         keep_alive: bool, extra_headers: Optional[Dict[str, str]] = None):
+        """chunked 전송용 응답 헤더 전송"""
+        lines = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            f"Content-Type: {content_type}; charset=utf-8",
+            "Transfer-Encoding: chunked",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        lines += [f"{name}: {value}" for name, value in (extra_headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any], keep_alive: bool):
+        """JSON 응답 전송"""
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def run_server(host: str, port: int, defaults: Dict[str, Any], concurrency: int = 32,
+                     preload=None, on_ready=None):
+    """
+    서버를 시작하고 종료될 때까지 실행
+
+    Args:
+        host: 바인딩할 호스트
+        port: 바인딩할 포트
+        defaults: GraphState 기본 인자
+        concurrency: 배치 요청의 최대 동시 실행 수
+        preload: 미리 불러올 Provider 이름 목록 (기본값: 전체)
+        on_ready: 요청 수신 준비 후 호출할 콜백
+    """
+    server = NurexiaServer(defaults, concurrency=concurrency)
+    await server.preload(preload)
+    await server.start(host, port)
+    if on_ready:
+        on_ready()
+    await server.serve_forever()
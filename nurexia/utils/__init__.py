@@ -1,9 +1,12 @@
 """
 유틸리티 함수 모듈.
-출력 포맷팅과 스트리밍 기능을 제공합니다.
+출력 포맷팅, 스트리밍(출력 버퍼), 배치 실행, 대화형 모드 기능을 제공합니다.
 """
 
-from .formatter import format_output, format_error
+from .formatter import format_output, format_error, format_metrics
 from .streaming import execute_streaming, setup_streaming
+from .writer import StreamWriter
+from .batch import execute_batch
+from .repl import run_repl
 
-__all__ = ['format_output', 'format_error', 'execute_streaming', 'setup_streaming']
\ No newline at end of file
+__all__ = ['format_output', 'format_error', 'format_metrics', 'execute_streaming', 'setup_streaming', 'StreamWriter', 'execute_batch', 'run_repl']
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+배치 실행 기능 구현 모듈
+JSONL 입력의 프롬프트를 제한된 동시성으로 워크플로우에 통과시키고
+결과를 JSONL로 출력합니다.
+"""
+
+import asyncio
+import json
+from collections import deque
+from typing import Any, Callable, Dict, IO, Optional, Tuple
+
+from ..graph.state import GraphState, MessageRole
+
+
+def parse_batch_line(line: str) -> Dict[str, Any]:
+    """배치 입력 한 줄을 요청 딕셔너리로 변환합니다.
+
+    Args:
+        line: JSONL 한 줄. JSON 문자열이면 프롬프트로 간주하고,
+            객체이면 prompt 또는 messages 키를 사용합니다.
+
+    Returns:
+        요청 딕셔너리
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 경우
+    """
+    item = json.loads(line)
+    if isinstance(item, str):
+        return {"prompt": item}
+    if not isinstance(item, dict):
+        raise ValueError("Batch line must be a JSON string or object")
+    if "prompt" not in item and "messages" not in item:
+        raise ValueError("Batch item requires 'prompt' or 'messages'")
+    return item
+
+
+def build_batch_state(item: Dict[str, Any], defaults: Dict[str, Any]) -> GraphState:
+    """배치 요청으로부터 GraphState를 생성합니다.
+
+    요청에 provider, model, mode, temperature, race, hedge_delay, cascade가 있으면 기본값보다 우선합니다.
+
+    Args:
+        item: 배치 요청 딕셔너리
+        defaults: GraphState 기본 인자 (provider, model, mode, working_directory, options)
+
+    Returns:
+        초기화된 GraphState
+    """
+    options = dict(defaults.get("options", {}))
+    for key in ("temperature", "race", "hedge_delay", "cascade"):
+        if key in item:
+            options[key] = item[key]
+
+    state = GraphState(
+        provider=item.get("provider", defaults.get("provider", "anthropic")),
+        model=item.get("model", defaults.get("model")),
+        mode=item.get("mode", defaults.get("mode", "chat")),
+        working_directory=defaults.get("working_directory", "."),
+        options=options
+    )
+
+    for message in item.get("messages", []):
+        state.add_message(MessageRole(message["role"]), message["content"])
+    if "prompt" in item:
+        state.add_message(MessageRole.USER, item["prompt"])
+
+    return state
+
+
+async def _run_item(workflow, index: int, line: str, defaults: Dict[str, Any],
+                    semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    """배치 요청 하나를 실행하고 출력 레코드를 반환합니다."""
+    record: Dict[str, Any] = {"index": index}
+    try:
+        item = parse_batch_line(line)
+        if "id" in item:
+            record["id"] = item["id"]
+
+        async with semaphore:
+            state = await workflow.ainvoke(build_batch_state(item, defaults))
+
+        record["result"] = state.result
+        record["error"] = state.error
+    except Exception as e:
+        record["result"] = None
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+
+async def _read_lines(source: IO[str]):
+    """입력 스트림에서 비어 있지 않은 줄을 하나씩 읽습니다 (이벤트 루프를 막지 않음)."""
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await loop.run_in_executor(None, source.readline)
+        if not line:
+            break
+        line = line.strip()
+        if line:
+            yield line
+
+
+async def execute_batch(workflow, source: IO[str], sink: IO[str], defaults: Dict[str, Any],
+                        concurrency: int = 8, ordered: bool = True,
+                        on_record: Optional[Callable[[Dict[str, Any]], None]] = None) -> Tuple[int, int]:
+    """JSONL 배치를 제한된 동시성으로 실행합니다.
+
+    입력은 한 줄씩 읽으며, 동시에 실행 중이거나 출력 대기 중인 요청 수가
+    제한되므로 입력 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        workflow: ainvoke(state)를 제공하는 워크플로우
+        source: JSONL 입력 스트림
+        sink: JSONL 출력 스트림
+        defaults: GraphState 기본 인자
+        concurrency: 최대 동시 실행 수
+        ordered: True면 입력 순서, False면 완료 순서로 출력
+        on_record: 출력된 레코드마다 호출할 콜백
+
+    Returns:
+        (전체 요청 수, 실패 요청 수)
+    """
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    total = failed = 0
+
+    def emit(record: Dict[str, Any]):
+        nonlocal failed
+        if record.get("error"):
+            failed += 1
+        sink.write(json.dumps(record, ensure_ascii=False) + "\n")
+        sink.flush()
+        if on_record:
+            on_record(record)
+
+    if ordered:
+        # 출력 대기 중인 요청을 포함해 창 크기를 제한 (선두가 끝나야 다음 줄을 더 읽음)
+        window: deque = deque()
+        max_window = concurrency * 4
+        async for line in _read_lines(source):
+            window.append(asyncio.ensure_future(_run_item(workflow, total, line, defaults, semaphore)))
+            total += 1
+            while len(window) >= max_window or (window and window[0].done()):
+                emit(await window.popleft())
+        while window:
+            emit(await window.popleft())
+    else:
+        pending = set()
+        async for line in _read_lines(source):
+            pending.add(asyncio.ensure_future(_run_item(workflow, total, line, defaults, semaphore)))
+            total += 1
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    emit(task.result())
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                emit(task.result())
+
+    return total, failed
@@ -1,9 +1,12 @@
 """
 출력 포맷팅 기능 구현 모듈
-다양한 출력 형식(text, json, markdown)을 지원합니다.
+다양한 출력 형식(text, json, markdown, sse)을 지원합니다.
+스트리밍 모드에서는 StreamFormatter가 청크를 도착 즉시 같은 형식으로 이어서 포맷팅합니다
+(json은 NDJSON 이벤트, sse는 Server-Sent Events).
 """
 
 import json
+import time
 from typing import Any, Dict, List, Optional
 
 
@@ -23,6 +26,9 @@ def format_output(response: str, output_format: str = "text") -> str:
         return json.dumps({"response": response}, ensure_ascii=False, indent=2)
     elif output_format == "markdown":
         return f"```markdown\n{response}\n```"
+    elif output_format == "sse":
+        data = json.dumps({"event": "done", "response": response}, ensure_ascii=False)
+        return f"event: done\ndata: {data}\n"
     else:
         # 알 수 없는 형식은 기본 텍스트로 반환
         return response
@@ -47,4 +53,174 @@ def format_error(error_message: str, verbose: bool = False, details: Optional[Di
     for key, value in details.items():
         result += f"  {key}: {value}\n"
 
-    return result
\ No newline at end of file
+    return result
+
+
+def format_metrics(record: Dict[str, Any]) -> str:
+    """호출 계측 결과를 사람이 읽기 쉬운 소요 시간 표로 포맷팅합니다.
+
+    Args:
+        record: nurexia.metrics.CallMetrics.to_dict() 결과
+
+    Returns:
+        포맷팅된 소요 시간 요약 문자열
+    """
+    lines = [f"Timing ({record.get('provider')}/{record.get('model')}):"]
+    for name, value in record.get("timings_ms", {}).items():
+        lines.append(f"  {name:<14} {value:10.1f} ms")
+    if record.get("first_token_ms") is not None:
+        lines.append(f"  {'first_token':<14} {record['first_token_ms']:10.1f} ms")
+    if record.get("total_ms") is not None:
+        lines.append(f"  {'total':<14} {record['total_ms']:10.1f} ms")
+    if record.get("counters"):
+        counters = ", ".join(f"{k}={v}" for k, v in record["counters"].items())
+        lines.append(f"  counters: {counters}")
+    if record.get("usage"):
+        usage = ", ".join(f"{k}={v}" for k, v in record["usage"].items())
+        lines.append(f"  tokens: {usage}")
+    return "\n".join(lines)
+
+
+def format_cascade(record: Dict[str, Any]) -> str:
+    """단계적 모드의 단계별 판단 기록을 한 줄로 포맷팅합니다.
+
+    Args:
+        record: CascadeProvider의 판단 기록 (attempts, final, escalated)
+
+    Returns:
+        예: "Cascade: ollama/llama3 (too_short) -> anthropic/claude (answered by anthropic/claude)"
+    """
+    steps = []
+    for attempt in record.get("attempts", []):
+        reasons = ", ".join(attempt["reasons"])
+        steps.append(f"{attempt['provider']} ({reasons})" if reasons else attempt["provider"])
+    return f"Cascade: {' -> '.join(steps)} (answered by {record.get('final')})"
+
+
+class StreamFormatter:
+    """스트리밍 응답을 출력 형식에 맞게 이어서 포맷팅 (text: 청크를 그대로 출력)
+
+    start → chunk(여러 번, 단계적 모드에서는 중간에 escalate) → finish 또는 error 순서로 호출하며,
+    각 메서드는 바로 출력할 문자열을 반환합니다.
+    """
+
+    # 한 이벤트가 한 줄(또는 한 블록)인 구조화된 형식 여부
+    structured = False
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.seq = 0
+
+    def elapsed_ms(self) -> float:
+        """스트림 시작 후 경과 시간 (밀리초)"""
+        return round((time.perf_counter() - self.started) * 1000, 3)
+
+    def start(self, provider: str, model: Optional[str]) -> str:
+        """스트림 시작 시 출력할 내용"""
+        return ""
+
+    def chunk(self, text: str) -> str:
+        """청크 하나에 대해 출력할 내용"""
+        return text
+
+    def escalate(self, text: str, info: Dict[str, Any]) -> str:
+        """
+        단계적 모드에서 초안을 버리고 상위 Provider로 넘어갈 때 출력할 내용
+
+        Args:
+            text: 안내 문구
+            info: 넘김 정보 (from, to, reasons)
+        """
+        return text
+
+    def finish(self, summary: Dict[str, Any]) -> str:
+        """
+        스트림 종료 시 출력할 내용
+
+        Args:
+            summary: stream_summary() 결과 (청크 수, TTFT, 전체 시간, 토큰 사용량 등)
+        """
+        return "\n"
+
+    def error(self, message: str) -> str:
+        """스트림 도중 오류가 발생했을 때 출력할 내용"""
+        return f"\nError during streaming: {message}\n"
+
+
+class MarkdownStreamFormatter(StreamFormatter):
+    """청크를 markdown 코드 블록 안에 이어서 출력 (전체 출력은 format_output과 같음)"""
+
+    def start(self, provider: str, model: Optional[str]) -> str:
+        return "```markdown\n"
+
+    def finish(self, summary: Dict[str, Any]) -> str:
+        return "\n```\n"
+
+    def error(self, message: str) -> str:
+        return f"\n```\n\nError during streaming: {message}\n"
+
+
+class NDJSONStreamFormatter(StreamFormatter):
+    """이벤트마다 JSON 한 줄 (start, chunk, escalate, done, error)
+
+    모든 이벤트에 순번(seq)과 스트림 시작 후 경과 시간(t_ms)이 포함됩니다.
+    """
+
+    structured = True
+
+    def _event(self, event: str, **fields) -> str:
+        """이벤트 하나를 직렬화 (순번 증가)"""
+        record = {"event": event, "seq": self.seq, "t_ms": self.elapsed_ms(), **fields}
+        self.seq += 1
+        return self._frame(event, record)
+
+    def _frame(self, event: str, record: Dict[str, Any]) -> str:
+        """직렬화된 이벤트를 출력 단위로 감싸기"""
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    def start(self, provider: str, model: Optional[str]) -> str:
+        # 경과 시간은 Provider 준비가 끝나고 스트림을 시작한 시점부터
+        self.started = time.perf_counter()
+        return self._event("start", provider=provider, model=model)
+
+    def chunk(self, text: str) -> str:
+        return self._event("chunk", text=text)
+
+    def escalate(self, text: str, info: Dict[str, Any]) -> str:
+        # 받는 쪽은 이 이벤트 이전의 chunk를 최종 응답에서 제외
+        return self._event("escalate", **info)
+
+    def finish(self, summary: Dict[str, Any]) -> str:
+        return self._event("done", **summary)
+
+    def error(self, message: str) -> str:
+        return self._event("error", message=message)
+
+
+class SSEStreamFormatter(NDJSONStreamFormatter):
+    """NDJSON과 같은 이벤트를 Server-Sent Events 형식(event/id/data)으로 출력"""
+
+    def _frame(self, event: str, record: Dict[str, Any]) -> str:
+        data = json.dumps(record, ensure_ascii=False)
+        return f"event: {event}\nid: {record['seq']}\ndata: {data}\n\n"
+
+
+# 출력 형식별 스트리밍 포맷터
+STREAM_FORMATTERS = {
+    "text": StreamFormatter,
+    "markdown": MarkdownStreamFormatter,
+    "json": NDJSONStreamFormatter,
+    "sse": SSEStreamFormatter,
+}
+
+
+def create_stream_formatter(output_format: str = "text") -> StreamFormatter:
+    """출력 형식에 맞는 스트리밍 포맷터 생성 (알 수 없는 형식은 text)
+
+    Args:
+        output_format: 출력 형식 (text, json, markdown, sse)
+
+    Returns:
+        StreamFormatter 인스턴스
+    """
+    return STREAM_FORMATTERS.get(output_format, StreamFormatter)()
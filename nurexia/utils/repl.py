@@ -0,0 +1,102 @@
+"""
+대화형(REPL) 채팅 모드 구현 모듈
+하나의 프로세스에서 Provider 인스턴스, 클라이언트 풀, GraphState를 유지하며
+여러 차례의 대화를 스트리밍으로 처리합니다.
+"""
+
+import asyncio
+import threading
+from typing import Optional
+
+import click
+
+from ..providers import get_provider
+from ..graph.state import GraphState, MessageRole
+from .streaming import execute_streaming
+
+# 대화형 모드 명령
+EXIT_COMMANDS = {"/exit", "/quit"}
+CLEAR_COMMAND = "/clear"
+
+
+async def _read_line(prompt: str) -> str:
+    """이벤트 루프를 막지 않고 한 줄 입력
+
+    입력 대기 스레드는 데몬 스레드로 실행하여 종료 시 프로세스를 붙잡지 않습니다.
+
+    Args:
+        prompt: 입력 프롬프트
+
+    Returns:
+        입력된 줄
+
+    Raises:
+        EOFError: 입력이 끝난 경우
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def reader():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_exception(e))
+        else:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(line))
+
+    threading.Thread(target=reader, name="nurexia-repl-input", daemon=True).start()
+    return await future
+
+
+async def run_repl(state: GraphState, store=None, session_id: Optional[str] = None, prompt: str = "> "):
+    """대화형 채팅 루프를 실행합니다.
+
+    Provider는 한 번만 생성하며, 사용자가 입력하는 동안 클라이언트를 미리 준비합니다.
+    /exit 또는 /quit(또는 EOF)로 종료하고, /clear로 대화 이력을 비웁니다.
+
+    Args:
+        state: 대화 상태 (턴마다 메시지가 누적됨)
+        store: 턴마다 상태를 저장할 CheckpointStore (선택)
+        session_id: 저장에 사용할 세션 ID
+        prompt: 입력 프롬프트
+    """
+    provider_instance = get_provider(state.provider, state.model, **state.options)
+    if not provider_instance.supports_streaming:
+        click.echo(f"{state.provider} Provider는 스트리밍을 지원하지 않아 응답을 한 번에 출력합니다.")
+    click.echo("Type /exit to quit, /clear to reset the conversation.")
+
+    while True:
+        # 입력을 기다리는 동안 클라이언트 생성 (이후 턴은 풀에서 재사용)
+        warm_up = asyncio.ensure_future(provider_instance.warm_up())
+        try:
+            line = await _read_line(prompt)
+        except EOFError:
+            click.echo()
+            break
+        finally:
+            await warm_up
+
+        text = line.strip()
+        if not text:
+            continue
+        if text in EXIT_COMMANDS:
+            break
+        if text == CLEAR_COMMAND:
+            state.messages.clear()
+            if store:
+                store.save(session_id, state)
+            click.echo("Conversation cleared.")
+            continue
+
+        turn_start = len(state.messages)
+        state.add_message(MessageRole.USER, text)
+        state.error = state.result = None
+        # 상세 모드에서 이번 턴의 계측 결과만 출력되도록 초기화
+        state.metadata["metrics"] = []
+
+        await execute_streaming(state, provider_instance)
+        if state.error:
+            # 실패한 턴은 대화 이력에서 제외 (사용자 메시지가 연속되지 않도록)
+            state.messages.truncate(turn_start)
+        elif store:
+            store.save(session_id, state)
@@ -4,47 +4,154 @@ AI Provider로부터 스트리밍 응답을 받아 처리합니다.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 
 import click
 
+from .. import metrics
 from ..providers import get_provider
+from ..providers.cascade import CascadeBoundary
 from ..graph.state import GraphState, MessageRole
+from ..graph.nodes import retrieve_node
+from .formatter import format_metrics, format_cascade, create_stream_formatter
+from .writer import StreamWriter
 
 
-async def execute_streaming(state: GraphState):
-    """스트리밍 모드로 AI 응답을 출력합니다.
+async def iter_streaming(state: GraphState, provider_instance=None) -> AsyncIterator[str]:
+    """Graph 상태에 대한 AI 응답을 청크 단위로 반환합니다.
+
+    스트리밍을 지원하지 않는 Provider는 전체 응답을 하나의 청크로 반환합니다.
 
     Args:
         state: 현재 Graph 상태
+        provider_instance: 재사용할 Provider 인스턴스 (기본값: 상태로부터 생성)
+
+    Yields:
+        응답 청크
     """
-    try:
-        # Provider 인스턴스 생성
-        provider_instance = get_provider(
-            state.provider,
-            state.model,
-            **state.options
-        )
-
-        # 스트리밍 지원 확인
-        if not provider_instance.supports_streaming:
-            click.echo(f"\n{state.provider} Provider는 스트리밍을 지원하지 않습니다.")
-            click.echo("비스트리밍 모드로 실행합니다...")
+    with metrics.measure_call(state):
+        if provider_instance is None:
+            with metrics.span("get_provider"):
+                provider_instance = get_provider(
+                    state.provider,
+                    state.model,
+                    **state.options
+                )
+
+        # agent/edit 모드에서는 작업 디렉터리의 관련 코드 조각 검색
+        await retrieve_node(state)
+
+        # 모델 컨텍스트 한도에 맞게 정리된 이력 사용
+        with metrics.span("context"):
+            messages = state.get_context_messages()
 
-            # 일반 모드로 대체 실행
-            messages = state.get_conversation_history()
+        if not provider_instance.supports_streaming:
             response = await provider_instance.chat(messages)
-            click.echo(response["content"])
+            metrics.mark_first_token()
+            yield response["content"]
             return
 
-        # 스트리밍 시작
-        messages = state.get_conversation_history()
-
         async for chunk in provider_instance.stream_chat(messages):
-            click.echo(chunk, nl=False)
-        click.echo()  # 줄바꿈으로 마무리
+            metrics.mark_first_token()
+            yield chunk
+
+        # 경주 모드이면 승리한 Provider 기록
+        race = getattr(provider_instance, "last_race", None)
+        if race is not None:
+            state.metadata["race"] = race
+        # 단계적 모드이면 단계별 판단 기록
+        cascade = getattr(provider_instance, "last_cascade", None)
+        if cascade is not None:
+            state.metadata["cascade"] = cascade
+
+
+def stream_summary(state: GraphState, chunks: List[str]) -> Dict[str, Any]:
+    """스트리밍 종료 이벤트에 기록할 요약 (청크 수, TTFT, 전체 시간, 토큰 사용량)
+
+    Args:
+        state: 스트리밍을 마친 Graph 상태
+        chunks: 받은 청크 목록
+
+    Returns:
+        요약 딕셔너리
+    """
+    record = (state.metadata.get("metrics") or [{}])[-1]
+    summary = {
+        "provider": state.provider,
+        "model": state.model,
+        "chunks": len(chunks),
+        "chars": sum(len(chunk) for chunk in chunks),
+        "first_token_ms": record.get("first_token_ms"),
+        "total_ms": record.get("total_ms"),
+        "usage": record.get("usage", {}),
+    }
+    if "race" in state.metadata:
+        summary["race_winner"] = state.metadata["race"]["winner"]
+    if "cascade" in state.metadata:
+        summary["cascade_final"] = state.metadata["cascade"]["final"]
+        summary["escalated"] = state.metadata["cascade"]["escalated"]
+    return summary
+
+
+async def execute_streaming(state: GraphState, provider_instance=None, output_format: str = "text"):
+    """스트리밍 모드로 AI 응답을 출력합니다.
+
+    완료된 응답은 state.result와 대화 이력(assistant 메시지)에 기록됩니다.
+
+    Args:
+        state: 현재 Graph 상태
+        provider_instance: 재사용할 Provider 인스턴스 (기본값: 상태로부터 생성)
+        output_format: 출력 형식 (text, markdown, json(NDJSON 이벤트), sse)
+    """
+    formatter = create_stream_formatter(output_format)
+    # 구조화된 형식은 파이프로 받는 쪽이 바로 처리할 수 있도록 터미널이 아니어도 프레임 단위로 출력
+    writer = StreamWriter(interactive=True if formatter.structured else None,
+                          line_flush=not formatter.structured)
+    try:
+        if provider_instance is None:
+            # Provider 인스턴스 생성
+            provider_instance = get_provider(
+                state.provider,
+                state.model,
+                **state.options
+            )
+
+            # 스트리밍 지원 확인 (구조화된 형식이면 안내는 표준 오류로)
+            if not provider_instance.supports_streaming:
+                click.echo(f"\n{state.provider} Provider는 스트리밍을 지원하지 않습니다.", err=formatter.structured)
+                click.echo("비스트리밍 모드로 실행합니다...", err=formatter.structured)
+
+        # 스트리밍 시작 (미지원 Provider는 일반 모드로 대체 실행)
+        # 청크는 프레임 단위로 모아 출력 (오류가 나도 받은 내용은 출력)
+        chunks = []
+        writer.write(formatter.start(state.provider, state.model))
+        async for chunk in iter_streaming(state, provider_instance):
+            if isinstance(chunk, CascadeBoundary):
+                # 상위 Provider로 넘어가면 이미 출력한 초안은 최종 응답에서 제외
+                chunks.clear()
+                writer.write(formatter.escalate(str(chunk), chunk.info))
+                continue
+            chunks.append(chunk)
+            writer.write(formatter.chunk(chunk))
+
+        # 전체 응답을 상태에 기록 (세션 저장 등에서 사용)
+        state.result = "".join(chunks)
+        state.add_message(MessageRole.ASSISTANT, state.result)
+        writer.write(formatter.finish(stream_summary(state, chunks)))
+        writer.close()
+
+        # 상세 모드에서는 단계별 소요 시간 출력
+        if state.options.get("verbose", False):
+            for record in state.metadata.get("metrics", []):
+                click.echo(format_metrics(record), err=True)
+            if "race" in state.metadata:
+                click.echo(f"Race winner: {state.metadata['race']['winner']}", err=True)
+            if "cascade" in state.metadata:
+                click.echo(format_cascade(state.metadata["cascade"]), err=True)
     except Exception as e:
-        click.echo(f"\nError during streaming: {str(e)}")
+        state.error = str(e)
+        writer.write(formatter.error(str(e)))
+        writer.close()
         if state.options.get("verbose", False):
             import traceback
             click.echo(traceback.format_exc())
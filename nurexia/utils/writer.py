@@ -0,0 +1,112 @@
+"""
+스트리밍 출력 버퍼 모듈
+청크마다 출력하고 flush하는 대신 청크를 프레임 단위로 모아서 씁니다.
+터미널에서는 줄바꿈, 프레임 크기, 마감 시각 중 먼저 도달한 조건에서 출력하고,
+파이프/파일로 출력할 때는 큰 단위로 모아서 한 번에 씁니다.
+"""
+
+from typing import IO, List, Optional
+import asyncio
+import sys
+import time
+
+import click
+
+from ..config import config_manager
+
+
+class StreamWriter:
+    """스트리밍 청크를 프레임으로 모아 출력하는 버퍼
+
+    터미널(대화형) 출력에서는 마지막 출력 후 frame_interval이 지나 도착한 청크를 바로 출력하므로,
+    청크가 드물게 오면 지연 없이 보이고 빠르게 쏟아지면 자동으로 프레임 단위로 묶입니다.
+    묶인 내용은 마감 타이머(이벤트 루프가 있을 때)로 frame_interval 안에 출력됩니다.
+    """
+
+    def __init__(self, stream: Optional[IO[str]] = None, interactive: Optional[bool] = None,
+                 frame_interval: Optional[float] = None, frame_bytes: Optional[int] = None,
+                 bulk_bytes: Optional[int] = None, line_flush: bool = True):
+        """
+        출력 버퍼 초기화
+
+        Args:
+            stream: 출력 스트림 (기본값: 현재 sys.stdout)
+            interactive: 프레임 단위 출력 여부 (기본값: stream이 터미널이면 True)
+            frame_interval: 청크가 버퍼에 머무는 최대 시간(초, 기본값: NUREXIA_STREAM_FRAME_MS)
+            frame_bytes: 대화형 출력의 최대 프레임 크기(문자 수, 기본값: NUREXIA_STREAM_FRAME_BYTES)
+            bulk_bytes: 비대화형 출력에서 한 번에 쓰는 크기(문자 수, 기본값: NUREXIA_STREAM_BULK_BYTES)
+            line_flush: 대화형 출력에서 줄바꿈이 오면 바로 출력할지 여부
+                (줄마다 이벤트를 쓰는 NDJSON 등은 False로 두어 프레임 단위로 묶음)
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        if interactive is None:
+            isatty = getattr(self.stream, "isatty", None)
+            interactive = bool(isatty and isatty())
+        self.interactive = interactive
+        self.frame_interval = (config_manager.stream_frame_ms / 1000 if frame_interval is None
+                               else frame_interval)
+        self.frame_bytes = frame_bytes or config_manager.stream_frame_bytes
+        self.bulk_bytes = bulk_bytes or config_manager.stream_bulk_bytes
+        self.line_flush = line_flush
+        self._buffer: List[str] = []
+        self._size = 0
+        self._last_flush = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.frames = 0
+
+    def write(self, chunk: str):
+        """
+        청크 추가 (출력 조건에 도달하면 모아 둔 내용을 출력)
+
+        Args:
+            chunk: 출력할 텍스트
+        """
+        if not chunk:
+            return
+        self._buffer.append(chunk)
+        self._size += len(chunk)
+
+        if not self.interactive:
+            if self._size >= self.bulk_bytes:
+                self.flush()
+            return
+
+        if ((self.line_flush and "\n" in chunk) or self._size >= self.frame_bytes
+                or time.monotonic() - self._last_flush >= self.frame_interval):
+            self.flush()
+        elif self._timer is None:
+            self._schedule()
+
+    def _schedule(self):
+        """마지막 출력 후 frame_interval 시점에 남은 내용을 출력하도록 예약"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # 이벤트 루프 밖에서는 다음 write/close에서 출력
+            return
+        delay = max(0.0, self._last_flush + self.frame_interval - time.monotonic())
+        self._timer = loop.call_later(delay, self.flush)
+
+    def flush(self):
+        """모아 둔 내용을 한 번에 출력"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self._size = 0
+        click.echo(text, file=self.stream, nl=False)
+        self._last_flush = time.monotonic()
+        self.frames += 1
+
+    def close(self):
+        """남은 내용 출력 (예약된 출력 취소)"""
+        self.flush()
+
+    def __enter__(self) -> "StreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,13 @@
+"""
+작업 디렉터리 모듈.
+.gitignore를 따르는 병렬 파일 수집, 증분 전문 검색 색인과 의미 검색 색인,
+프롬프트용 컨텍스트 검색 기능을 제공합니다. 의미 검색 색인(semantic)은 numpy가 필요하므로
+사용할 때 import합니다.
+"""
+
+from .ignore import IgnoreRules
+from .ingest import scan_workspace, iter_file_chunks, read_text
+from .index import WorkspaceIndex, get_workspace_index
+from .retrieval import search_workspace, fuse_results, format_snippets
+
+__all__ = ['IgnoreRules', 'scan_workspace', 'iter_file_chunks', 'read_text', 'WorkspaceIndex', 'get_workspace_index', 'search_workspace', 'fuse_results', 'format_snippets']
@@ -0,0 +1,238 @@
+"""
+.gitignore 규칙 처리
+작업 디렉터리를 순회할 때 Git과 같은 규칙으로 제외할 파일과 디렉터리를 판정합니다.
+"""
+
+from typing import List, Optional, Tuple
+import os
+import re
+
+# 규칙과 관계없이 항상 제외하는 디렉터리
+ALWAYS_IGNORED = {".git", ".hg", ".svn"}
+
+# 디렉터리마다 읽는 규칙 파일
+IGNORE_FILE = ".gitignore"
+
+
+def _translate(pattern: str) -> str:
+    """
+    gitignore 패턴을 정규식으로 변환
+
+    Args:
+        pattern: 앞의 '/'와 끝의 '/'를 제거한 패턴
+
+    Returns:
+        규칙 파일 위치 기준 상대 경로 전체와 일치하는 정규식 문자열
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif ch == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif ch == "?":
+            parts.append("[^/]")
+            i += 1
+        elif ch == "[":
+            end = pattern.find("]", i + 2 if pattern[i + 1:i + 2] in ("!", "^") else i + 1)
+            if end < 0:
+                parts.append(re.escape(ch))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            parts.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        elif ch == "\\" and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(ch))
+            i += 1
+    return "".join(parts)
+
+
+def parse_rule(line: str) -> Optional[Tuple[str, bool, bool]]:
+    """
+    gitignore 한 줄을 규칙으로 변환
+
+    Args:
+        line: 규칙 파일의 한 줄
+
+    Returns:
+        (정규식 문자열, 부정 여부, 디렉터리 전용 여부) 또는 None (빈 줄/주석)
+    """
+    line = line.rstrip("\n").rstrip("\r")
+    # 끝의 공백은 '\'로 이스케이프된 경우만 유지
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+    if not line or line.startswith("#"):
+        return None
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith(("\\!", "\\#")):
+        line = line[1:]
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # 중간이나 앞에 '/'가 있으면 규칙 파일 위치 기준, 없으면 모든 깊이의 이름과 일치
+    anchored = "/" in line
+    line = line.lstrip("/")
+    regex = _translate(line)
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+    return regex, negate, dir_only
+
+
+class IgnoreFile:
+    """규칙 파일 하나(디렉터리 하나)의 gitignore 규칙"""
+
+    def __init__(self, base: str, lines: List[str]):
+        """
+        규칙 파일 초기화
+
+        Args:
+            base: 규칙 파일이 있는 디렉터리 (작업 디렉터리 기준 상대 경로, 루트는 "")
+            lines: 규칙 파일 내용
+        """
+        self.base = base
+        self.rules: List[Tuple[re.Pattern, bool, bool]] = []
+        for line in lines:
+            rule = parse_rule(line)
+            if rule:
+                regex, negate, dir_only = rule
+                self.rules.append((re.compile(regex), negate, dir_only))
+
+        # 부정 규칙이 없으면 모든 규칙을 하나의 정규식으로 합쳐 한 번에 검사
+        self._combined: Optional[Tuple[Optional[re.Pattern], Optional[re.Pattern]]] = None
+        if not any(negate for _, negate, _ in self.rules):
+            any_type = [f"(?:{rx.pattern})" for rx, _, dir_only in self.rules if not dir_only]
+            dirs_only = [f"(?:{rx.pattern})" for rx, _, _ in self.rules]
+            self._combined = (
+                re.compile("|".join(any_type)) if any_type else None,
+                re.compile("|".join(dirs_only)) if dirs_only else None,
+            )
+
+    @classmethod
+    def load(cls, root: str, base: str, name: str = IGNORE_FILE) -> Optional["IgnoreFile"]:
+        """
+        디렉터리의 규칙 파일 읽기
+
+        Args:
+            root: 작업 디렉터리 절대 경로
+            base: 규칙 파일이 있는 디렉터리 (상대 경로)
+            name: 규칙 파일 이름
+
+        Returns:
+            IgnoreFile (파일이 없거나 규칙이 없으면 None)
+        """
+        path = os.path.join(root, base, name)
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                ignore_file = cls(base, f.readlines())
+        except OSError:
+            return None
+        return ignore_file if ignore_file.rules else None
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """
+        경로에 대한 이 파일의 판정
+
+        Args:
+            path: 작업 디렉터리 기준 상대 경로 ('/' 구분)
+            is_dir: 디렉터리 여부
+
+        Returns:
+            True(제외), False(부정 규칙으로 다시 포함), None(일치하는 규칙 없음)
+        """
+        if self.base:
+            if not path.startswith(self.base + "/"):
+                return None
+            path = path[len(self.base) + 1:]
+
+        if self._combined is not None:
+            pattern = self._combined[1] if is_dir else self._combined[0]
+            return True if pattern is not None and pattern.fullmatch(path) else None
+
+        # 마지막으로 일치한 규칙이 우선
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(path):
+                return not negate
+        return None
+
+
+class IgnoreRules:
+    """작업 디렉터리의 중첩된 .gitignore 규칙 모음
+
+    하위 디렉터리의 규칙 파일이 상위 규칙보다 우선합니다. 제외된 디렉터리는 순회에서
+    통째로 건너뛰므로 그 안의 파일을 부정 규칙으로 다시 포함할 수 없습니다(Git과 동일).
+    """
+
+    def __init__(self, root: str, files: Optional[List[IgnoreFile]] = None):
+        """
+        규칙 모음 초기화
+
+        Args:
+            root: 작업 디렉터리 절대 경로
+            files: 적용할 규칙 파일 목록 (상위 디렉터리부터)
+        """
+        self.root = root
+        self.files = files if files is not None else self._root_files(root)
+
+    @staticmethod
+    def _root_files(root: str) -> List[IgnoreFile]:
+        """루트의 .git/info/exclude와 .gitignore 규칙"""
+        files = [IgnoreFile.load(root, "", os.path.join(".git", "info", "exclude")),
+                 IgnoreFile.load(root, "")]
+        return [f for f in files if f is not None]
+
+    def child(self, rel_dir: str) -> "IgnoreRules":
+        """
+        하위 디렉터리용 규칙 모음 (그 디렉터리의 .gitignore 추가)
+
+        Args:
+            rel_dir: 작업 디렉터리 기준 상대 경로
+
+        Returns:
+            하위 디렉터리에 적용할 IgnoreRules (추가 규칙이 없으면 자기 자신)
+        """
+        ignore_file = IgnoreFile.load(self.root, rel_dir)
+        if ignore_file is None:
+            return self
+        return IgnoreRules(self.root, self.files + [ignore_file])
+
+    def is_ignored(self, path: str, is_dir: bool = False) -> bool:
+        """
+        경로 제외 여부
+
+        Args:
+            path: 작업 디렉터리 기준 상대 경로 ('/' 구분)
+            is_dir: 디렉터리 여부
+
+        Returns:
+            제외 대상이면 True
+        """
+        if is_dir and path.rsplit("/", 1)[-1] in ALWAYS_IGNORED:
+            return True
+        for ignore_file in reversed(self.files):
+            result = ignore_file.match(path, is_dir)
+            if result is not None:
+                return result
+        return False
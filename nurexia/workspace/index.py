@@ -0,0 +1,396 @@
+"""
+작업 디렉터리 전문 검색 색인
+파일을 줄 단위 조각으로 나눠 SQLite FTS5 역색인에 저장하고 BM25로 검색합니다.
+색인은 작업 디렉터리별 파일에 보관되며, 변경 시각(mtime)과 크기가 달라진 파일만
+다시 읽으므로 큰 저장소도 요청마다 전체를 읽지 않습니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from ..config import config_manager
+from .ingest import chunk_lines, iter_file_chunks, read_text, scan_workspace
+
+# 검색어에서 사용할 최대 단어 수
+MAX_QUERY_TERMS = 32
+
+# 전체 조각 중 이 비율보다 많은 조각에 나타나는 단어는 (더 드문 단어가 있으면) 검색에서 제외
+COMMON_TERM_RATIO = 0.1
+
+# 색인 형식 버전 (바뀌면 기존 색인을 다시 만듦)
+INDEX_VERSION = "1"
+
+# 갱신 중 이 파일 수마다 커밋 (중단되어도 다음 갱신은 이어서 진행)
+COMMIT_INTERVAL = 500
+
+# 단어(영숫자 연속)와 camelCase 구성 단어
+_WORD_RE = re.compile(r"[^\W_]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+
+def split_identifiers(text: str) -> List[str]:
+    """
+    camelCase 식별자의 구성 단어 추출
+
+    snake_case는 FTS5 토크나이저가 '_'에서 나누므로 camelCase만 추가로 분리합니다.
+
+    Args:
+        text: 원문
+
+    Returns:
+        구성 단어 목록 (소문자, 식별자가 없으면 빈 목록)
+    """
+    parts = []
+    # 같은 식별자는 한 번만 분리
+    for word in set(_WORD_RE.findall(text)):
+        if not word.islower() and not word.isupper() and not word.isdigit():
+            pieces = _CAMEL_RE.findall(word)
+            if len(pieces) > 1:
+                parts.extend(piece.lower() for piece in pieces)
+    return parts
+
+
+def query_terms(query: str) -> List[str]:
+    """
+    검색어를 색인 단어 목록으로 변환
+
+    Args:
+        query: 검색어 (자연어 또는 코드)
+
+    Returns:
+        중복을 제거한 단어 목록 (최대 MAX_QUERY_TERMS개)
+    """
+    terms = [word.lower() for word in _WORD_RE.findall(query)] + split_identifiers(query)
+    unique = list(dict.fromkeys(term for term in terms if len(term) > 1))
+    return unique[:MAX_QUERY_TERMS]
+
+
+def prepare_chunks(text: str) -> List[Tuple[int, int, str]]:
+    """
+    파일 내용을 색인할 조각으로 변환 (수집 작업자에서 실행)
+
+    Args:
+        text: 파일 내용
+
+    Returns:
+        (시작 줄, 끝 줄, 색인 본문) 목록 (본문 끝에 camelCase 구성 단어 추가)
+    """
+    chunks = []
+    for start_line, end_line, body in chunk_lines(text):
+        parts = split_identifiers(body)
+        if parts:
+            body = body + "\n" + " ".join(parts)
+        chunks.append((start_line, end_line, body))
+    return chunks
+
+
+def index_path_for(root: str) -> str:
+    """
+    작업 디렉터리의 색인 파일 경로
+
+    Args:
+        root: 작업 디렉터리 절대 경로
+
+    Returns:
+        NUREXIA_INDEX_DIR 아래의 SQLite 파일 경로
+    """
+    digest = hashlib.sha1(os.path.realpath(root).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(config_manager.index_dir, f"{digest}.sqlite3")
+
+
+class WorkspaceIndex:
+    """작업 디렉터리의 BM25 전문 검색 색인"""
+
+    def __init__(self, root: str, path: Optional[str] = None, max_file_size: Optional[int] = None):
+        """
+        색인 초기화
+
+        Args:
+            root: 작업 디렉터리
+            path: 색인 SQLite 파일 경로 (기본값: index_path_for(root))
+            max_file_size: 색인할 최대 파일 크기(바이트, 기본값: NUREXIA_INDEX_MAX_FILE_SIZE)
+        """
+        self.root = os.path.realpath(root)
+        self.path = path or index_path_for(self.root)
+        self.max_file_size = max_file_size if max_file_size is not None else config_manager.index_max_file_size
+        self._lock = threading.Lock()
+        # 백그라운드 최초 색인 스레드와 색인 완료 여부 캐시
+        self._builder: Optional[threading.Thread] = None
+        self._builder_lock = threading.Lock()
+        self._built = False
+        self.build_error: Optional[str] = None
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        if self._get_meta("version") != INDEX_VERSION:
+            self._reset()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        """메타데이터 값 조회"""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Any):
+        """메타데이터 값 저장 (커밋은 호출자가 수행)"""
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _reset(self):
+        """색인 테이블을 비우고 다시 생성"""
+        self._conn.execute("DROP TABLE IF EXISTS files")
+        self._conn.execute("DROP TABLE IF EXISTS chunks")
+        self._conn.execute("DROP TABLE IF EXISTS chunk_vocab")
+        self._conn.execute("DROP TABLE IF EXISTS chunk_text")
+        self._conn.execute(
+            "CREATE TABLE files ("
+            " id INTEGER PRIMARY KEY,"
+            " path TEXT UNIQUE NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE chunks ("
+            " id INTEGER PRIMARY KEY,"
+            " file_id INTEGER NOT NULL,"
+            " start_line INTEGER NOT NULL,"
+            " end_line INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX idx_chunks_file ON chunks (file_id)")
+        self._conn.execute("CREATE VIRTUAL TABLE chunk_text USING fts5(body)")
+        # 단어별 출현 조각 수 (흔한 단어를 검색에서 제외하는 데 사용)
+        self._conn.execute("CREATE VIRTUAL TABLE chunk_vocab USING fts5vocab(chunk_text, row)")
+        self._conn.execute("DELETE FROM meta")
+        self._set_meta("version", INDEX_VERSION)
+        self._set_meta("root", self.root)
+        self._conn.commit()
+
+    def _remove_file(self, file_id: int):
+        """파일의 조각 삭제 (커밋은 호출자가 수행)"""
+        self._conn.execute(
+            "DELETE FROM chunk_text WHERE rowid IN (SELECT id FROM chunks WHERE file_id = ?)", (file_id,)
+        )
+        self._conn.execute("DELETE FROM chunks WHERE file_id = ?", (file_id,))
+
+    def _add_chunks(self, file_id: int, chunks: List[Tuple[int, int, str]]):
+        """prepare_chunks() 결과를 색인에 추가 (커밋은 호출자가 수행)"""
+        for start_line, end_line, body in chunks:
+            cursor = self._conn.execute(
+                "INSERT INTO chunks (file_id, start_line, end_line) VALUES (?, ?, ?)",
+                (file_id, start_line, end_line)
+            )
+            self._conn.execute("INSERT INTO chunk_text (rowid, body) VALUES (?, ?)", (cursor.lastrowid, body))
+
+    def update(self) -> Dict[str, int]:
+        """
+        작업 디렉터리를 순회하며 색인 갱신
+
+        새 파일과 변경 시각/크기가 달라진 파일만 다시 읽고, 사라진 파일은 색인에서 제거합니다.
+        순회와 파일 읽기/조각 분할은 수집 작업자 풀에서 병렬로 수행하고, 색인 쓰기만
+        현재 스레드에서 합니다. 바이너리 파일과 최대 크기를 넘는 파일은 내용 없이 목록에만
+        기록하여 다시 읽지 않습니다.
+
+        Returns:
+            {"files": 대상 파일 수, "indexed": 다시 읽은 파일 수, "removed": 제거한 파일 수}
+        """
+        with self._lock:
+            known = {
+                path: (file_id, mtime_ns, size)
+                for file_id, path, mtime_ns, size in self._conn.execute("SELECT id, path, mtime_ns, size FROM files")
+            }
+            seen = set()
+
+            def changed_files():
+                for path, st in scan_workspace(self.root):
+                    seen.add(path)
+                    entry = known.get(path)
+                    if not entry or entry[1] != st.st_mtime_ns or entry[2] != st.st_size:
+                        yield path, st
+
+            indexed = 0
+            for path, st, chunks in iter_file_chunks(self.root, changed_files(), prepare_chunks, self.max_file_size):
+                entry = known.get(path)
+                if entry:
+                    file_id = entry[0]
+                    self._remove_file(file_id)
+                    self._conn.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?", (st.st_mtime_ns, st.st_size, file_id)
+                    )
+                else:
+                    file_id = self._conn.execute(
+                        "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)", (path, st.st_mtime_ns, st.st_size)
+                    ).lastrowid
+                if chunks:
+                    self._add_chunks(file_id, chunks)
+                indexed += 1
+                if indexed % COMMIT_INTERVAL == 0:
+                    self._conn.commit()
+
+            removed = [entry[0] for path, entry in known.items() if path not in seen]
+            for file_id in removed:
+                self._remove_file(file_id)
+                self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+            self._set_meta("updated_at", time.time())
+            self._conn.commit()
+            self._built = True
+        return {"files": len(seen), "indexed": indexed, "removed": len(removed)}
+
+    @property
+    def building(self) -> bool:
+        """백그라운드 최초 색인이 진행 중인지 여부"""
+        builder = self._builder
+        return builder is not None and builder.is_alive()
+
+    @property
+    def is_built(self) -> bool:
+        """한 번 이상 갱신을 마쳐 검색할 수 있는지 여부 (최초 색인 중에는 대기하지 않고 False)"""
+        if not self._built and not self.building:
+            with self._lock:
+                self._built = self._get_meta("updated_at") is not None
+        return self._built
+
+    def build_in_background(self) -> threading.Thread:
+        """
+        최초 색인을 백그라운드 스레드에서 시작 (이미 진행 중이면 그 스레드 반환)
+
+        데몬 스레드이므로 프로세스가 먼저 끝나면 중단되지만, 중간 커밋 덕분에
+        다음 실행에서는 남은 파일만 색인합니다.
+
+        Returns:
+            색인 스레드
+        """
+        with self._builder_lock:
+            if not self.building:
+                self._builder = threading.Thread(target=self._build, name="nurexia-index", daemon=True)
+                self._builder.start()
+            return self._builder
+
+    def _build(self):
+        """백그라운드 색인 실행 (오류는 build_error에 기록)"""
+        try:
+            self.update()
+            self.build_error = None
+        except Exception as e:
+            self.build_error = f"{type(e).__name__}: {e}"
+
+    def refresh(self, max_age: Optional[float] = None) -> Optional[Dict[str, int]]:
+        """
+        마지막 갱신 후 max_age초가 지났으면 색인 갱신
+
+        갱신 시각은 색인 파일에 저장되므로 연속된 CLI 실행은 순회를 건너뜁니다.
+
+        Args:
+            max_age: 갱신 주기(초, 기본값: NUREXIA_INDEX_REFRESH)
+
+        Returns:
+            갱신했으면 update() 결과, 건너뛰었으면 None
+        """
+        max_age = config_manager.index_refresh if max_age is None else max_age
+        with self._lock:
+            updated_at = float(self._get_meta("updated_at") or 0)
+        if time.time() - updated_at < max_age:
+            return None
+        return self.update()
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        검색어와 관련된 코드 조각 검색 (BM25 순)
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            [{"path", "start_line", "end_line", "score", "text"}, ...]
+            (score는 클수록 관련도가 높음, text는 현재 파일 내용에서 읽음)
+        """
+        terms = query_terms(query)
+        if not terms or limit <= 0:
+            return []
+        with self._lock:
+            # 흔한 단어는 점수 기여가 작고 후보만 늘리므로 더 드문 단어가 있으면 제외
+            total = self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            placeholders = ", ".join("?" * len(terms))
+            doc_counts = dict(self._conn.execute(
+                f"SELECT term, doc FROM chunk_vocab WHERE term IN ({placeholders})", terms
+            ))
+            terms = [term for term in terms if doc_counts.get(term)]
+            if not terms:
+                return []
+            rare = [term for term in terms if doc_counts[term] <= total * COMMON_TERM_RATIO]
+            terms = rare or [min(terms, key=doc_counts.get)]
+
+            match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+            rows = self._conn.execute(
+                "SELECT f.path, c.start_line, c.end_line, -bm25(chunk_text) AS score"
+                " FROM chunk_text JOIN chunks c ON c.id = chunk_text.rowid JOIN files f ON f.id = c.file_id"
+                " WHERE chunk_text MATCH ? ORDER BY bm25(chunk_text) LIMIT ?",
+                (match, limit)
+            ).fetchall()
+
+        results = []
+        for path, start_line, end_line, score in rows:
+            text = read_text(os.path.join(self.root, path))
+            if text is None:
+                continue
+            snippet = "\n".join(text.splitlines()[start_line - 1:end_line])
+            results.append({"path": path, "start_line": start_line, "end_line": end_line,
+                            "score": score, "text": snippet})
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        색인 통계
+
+        Returns:
+            {"root", "path", "files", "chunks", "updated_at"}
+        """
+        with self._lock:
+            files = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            chunks = self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            updated_at = float(self._get_meta("updated_at") or 0)
+        return {"root": self.root, "path": self.path, "files": files, "chunks": chunks, "updated_at": updated_at}
+
+    def clear(self):
+        """색인 전체 삭제 (다음 갱신에서 모든 파일을 다시 읽음)"""
+        with self._lock:
+            self._reset()
+            self._built = False
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 작업 디렉터리별 색인 (최초 사용 시 생성)
+_indexes: Dict[str, WorkspaceIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_workspace_index(root: str) -> WorkspaceIndex:
+    """
+    작업 디렉터리의 색인 반환 (프로세스 안에서 재사용)
+
+    Args:
+        root: 작업 디렉터리
+
+    Returns:
+        WorkspaceIndex 인스턴스
+    """
+    root = os.path.realpath(root)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = WorkspaceIndex(root)
+    return index
@@ -0,0 +1,225 @@
+"""
+작업 디렉터리 수집(ingestion) 파이프라인
+os.scandir로 디렉터리를 병렬 순회하고, 파일 읽기와 조각 분할은 작업자 풀에서 수행하여
+결과를 완료 순서대로 스트리밍합니다. 큰 파일은 메모리 매핑으로 읽고, 바이너리 파일은
+앞부분만 검사하여 건너뜁니다.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+import mmap
+import os
+
+from ..config import config_manager
+from .ignore import IgnoreRules
+
+# 색인 조각 하나의 줄 수
+CHUNK_LINES = 40
+
+# 바이너리 판정을 위해 검사하는 파일 앞부분 크기
+SNIFF_BYTES = 8192
+
+# 이 크기 이상인 파일은 메모리 매핑으로 읽음 (바이너리면 앞부분만 읽고 중단)
+MMAP_THRESHOLD = 64 * 1024
+
+# 텍스트에서 흔히 쓰이는 제어 문자 (\t \n \f \r, ESC)
+_TEXT_CONTROL = {8, 9, 10, 12, 13, 27}
+_CONTROL_BYTES = bytes(b for b in range(32) if b not in _TEXT_CONTROL) + b"\x7f"
+
+# 앞부분에서 제어 문자가 이 비율을 넘으면 바이너리로 판정
+BINARY_CONTROL_RATIO = 0.3
+
+
+def default_workers() -> int:
+    """작업자 수 (NUREXIA_INGEST_WORKERS, 0이면 CPU 수 기반 자동)"""
+    return config_manager.ingest_workers or min(32, (os.cpu_count() or 1) + 4)
+
+
+def is_binary(head: bytes) -> bool:
+    """
+    파일 앞부분으로 바이너리 여부 판정
+
+    Args:
+        head: 파일 앞부분 (최대 SNIFF_BYTES)
+
+    Returns:
+        NUL 바이트가 있거나 제어 문자 비율이 높으면 True
+    """
+    if not head:
+        return False
+    if b"\0" in head:
+        return True
+    control = len(head) - len(head.translate(None, _CONTROL_BYTES))
+    return control / len(head) > BINARY_CONTROL_RATIO
+
+
+def read_text(path: str, size: Optional[int] = None) -> Optional[str]:
+    """
+    텍스트 파일 읽기
+
+    MMAP_THRESHOLD 이상인 파일은 메모리 매핑 후 앞부분만 먼저 검사하므로,
+    큰 바이너리 파일은 전체를 읽지 않습니다.
+
+    Args:
+        path: 파일 절대 경로
+        size: 파일 크기 (이미 stat한 경우, 기본값: 파일에서 확인)
+
+    Returns:
+        파일 내용 (바이너리이거나 읽을 수 없으면 None)
+    """
+    try:
+        with open(path, "rb") as f:
+            if size is None:
+                size = os.fstat(f.fileno()).st_size
+            if size < MMAP_THRESHOLD:
+                data = f.read()
+                return None if is_binary(data[:SNIFF_BYTES]) else data.decode("utf-8", errors="replace")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if is_binary(mapped[:SNIFF_BYTES]):
+                    return None
+                # 중간 bytes 사본 없이 매핑된 페이지에서 바로 디코딩
+                with memoryview(mapped) as view:
+                    return str(view, "utf-8", "replace")
+    except (OSError, ValueError):
+        return None
+
+
+def chunk_lines(text: str, size: int = CHUNK_LINES) -> List[Tuple[int, int, str]]:
+    """
+    텍스트를 줄 단위 조각으로 분할
+
+    Args:
+        text: 파일 내용
+        size: 조각 하나의 줄 수
+
+    Returns:
+        (시작 줄, 끝 줄, 내용) 목록 (줄 번호는 1부터)
+    """
+    lines = text.splitlines()
+    return [
+        (start + 1, min(start + size, len(lines)), "\n".join(lines[start:start + size]))
+        for start in range(0, len(lines), size)
+    ]
+
+
+def _scan_directory(root: str, rel_dir: str, rules: IgnoreRules) -> Tuple[List[Tuple[str, os.stat_result]],
+                                                                          List[Tuple[str, IgnoreRules]]]:
+    """
+    디렉터리 하나 순회 (작업자 스레드에서 실행)
+
+    Args:
+        root: 작업 디렉터리 절대 경로
+        rel_dir: 순회할 디렉터리 (상대 경로)
+        rules: 이 디렉터리에 적용할 제외 규칙
+
+    Returns:
+        ([(파일 상대 경로, stat 결과)], [(하위 디렉터리 상대 경로, 적용할 규칙)])
+    """
+    files, subdirs = [], []
+    prefix = rel_dir + "/" if rel_dir else ""
+    try:
+        with os.scandir(os.path.join(root, rel_dir) if rel_dir else root) as entries:
+            for entry in entries:
+                path = prefix + entry.name
+                try:
+                    # 심볼릭 링크는 따라가지 않음 (d_type으로 판정하여 stat 호출 없음)
+                    if entry.is_dir(follow_symlinks=False):
+                        if not rules.is_ignored(path, is_dir=True):
+                            subdirs.append((path, rules.child(path)))
+                    elif entry.is_file(follow_symlinks=False) and not rules.is_ignored(path):
+                        files.append((path, entry.stat(follow_symlinks=False)))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def scan_workspace(root: str, rules: Optional[IgnoreRules] = None,
+                   workers: Optional[int] = None) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    제외 규칙을 적용하며 작업 디렉터리의 파일을 병렬로 순회
+
+    디렉터리마다 하나의 작업으로 스레드 풀에서 scandir/stat을 수행하고,
+    완료된 디렉터리의 파일부터 반환합니다 (순서는 보장하지 않음).
+
+    Args:
+        root: 작업 디렉터리 절대 경로
+        rules: 적용할 제외 규칙 (기본값: 루트의 .gitignore부터 읽음)
+        workers: 작업자 스레드 수 (기본값: default_workers())
+
+    Yields:
+        (작업 디렉터리 기준 상대 경로('/' 구분), stat 결과)
+    """
+    rules = rules or IgnoreRules(root)
+    with ThreadPoolExecutor(max_workers=workers or default_workers(),
+                            thread_name_prefix="nurexia-scan") as executor:
+        pending = {executor.submit(_scan_directory, root, "", rules)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                for rel_dir, dir_rules in subdirs:
+                    pending.add(executor.submit(_scan_directory, root, rel_dir, dir_rules))
+                yield from files
+
+
+def _load_file(root: str, path: str, size: int, max_file_size: int,
+               prepare: Callable[[str], Any]) -> Optional[Any]:
+    """파일을 읽어 prepare로 변환 (작업자에서 실행, 읽을 수 없거나 바이너리면 None)"""
+    if size > max_file_size:
+        return None
+    text = read_text(os.path.join(root, path), size)
+    return prepare(text) if text else None
+
+
+def iter_file_chunks(root: str, files: Iterable[Tuple[str, os.stat_result]],
+                     prepare: Callable[[str], Any] = chunk_lines,
+                     max_file_size: Optional[int] = None, workers: Optional[int] = None,
+                     processes: Optional[bool] = None) -> Iterator[Tuple[str, os.stat_result, Optional[Any]]]:
+    """
+    파일을 작업자 풀에서 읽고 조각으로 변환하여 완료 순서대로 반환
+
+    입력 목록은 필요한 만큼만 소비하며(작업자 수의 4배까지 진행 중), 순회와 읽기가 겹쳐 실행됩니다.
+    processes가 참이면 조각 분할 같은 CPU 작업이 GIL에 묶이지 않도록 프로세스 풀을 사용하며,
+    이때 prepare는 모듈 최상위 함수여야 합니다.
+
+    Args:
+        root: 작업 디렉터리 절대 경로
+        files: (상대 경로, stat 결과) 목록 또는 반복자 (예: scan_workspace())
+        prepare: 파일 내용을 받아 조각 목록 등으로 변환하는 함수 (기본값: chunk_lines)
+        max_file_size: 읽을 최대 파일 크기(바이트, 기본값: NUREXIA_INDEX_MAX_FILE_SIZE)
+        workers: 작업자 수 (기본값: default_workers())
+        processes: 프로세스 풀 사용 여부 (기본값: NUREXIA_INGEST_PROCESSES)
+
+    Yields:
+        (상대 경로, stat 결과, prepare 결과 또는 None(바이너리/크기 초과/읽기 실패))
+    """
+    max_file_size = config_manager.index_max_file_size if max_file_size is None else max_file_size
+    processes = config_manager.ingest_processes if processes is None else processes
+    workers = workers or default_workers()
+    if processes:
+        executor: Executor = ProcessPoolExecutor(max_workers=min(workers, os.cpu_count() or 1))
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nurexia-ingest")
+
+    window = workers * 4
+    source = iter(files)
+    pending = {}
+    try:
+        while True:
+            for path, st in source:
+                future = executor.submit(_load_file, root, path, st.st_size, max_file_size, prepare)
+                pending[future] = (path, st)
+                if len(pending) >= window:
+                    break
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, st = pending.pop(future)
+                yield path, st, future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,110 @@
+"""
+작업 디렉터리 컨텍스트 검색
+agent/edit 모드의 프롬프트에 넣을 관련 코드 조각을 색인에서 찾아 정리합니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from ..config import config_manager
+from ..graph.tokens import count_tokens
+from .index import get_workspace_index
+
+# 작업 디렉터리 컨텍스트 머리말
+CONTEXT_HEADER = "[작업 디렉터리 관련 코드]"
+
+# 상호 순위 융합(RRF) 상수 (클수록 하위 순위의 영향이 커짐)
+RRF_K = 60
+
+
+def fuse_results(result_lists: List[List[Dict[str, Any]]], limit: int) -> List[Dict[str, Any]]:
+    """
+    여러 검색 결과를 상호 순위 융합(RRF)으로 합침
+
+    점수 척도가 다른 BM25와 코사인 유사도를 순위만으로 합치며, 같은 조각은 한 번만 포함합니다.
+
+    Args:
+        result_lists: 검색기별 결과 목록 (각각 관련도 순)
+        limit: 최대 결과 수
+
+    Returns:
+        융합 점수(score) 순 결과 목록
+    """
+    fused: Dict[Any, Dict[str, Any]] = {}
+    for results in result_lists:
+        for rank, snippet in enumerate(results):
+            key = (snippet["path"], snippet["start_line"])
+            entry = fused.setdefault(key, {**snippet, "score": 0.0})
+            entry["score"] += 1.0 / (RRF_K + rank + 1)
+    return sorted(fused.values(), key=lambda snippet: snippet["score"], reverse=True)[:limit]
+
+
+def search_workspace(root: str, query: str, limit: Optional[int] = None,
+                     errors: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    작업 디렉터리에서 검색어와 관련된 코드 조각 검색
+
+    색인이 갱신 주기(NUREXIA_INDEX_REFRESH)보다 오래되었으면 먼저 변경된 파일만 다시 색인합니다.
+    색인이 아직 없으면 전체 색인을 백그라운드에서 시작하고, 요청을 막지 않도록 빈 결과를 반환합니다.
+    NUREXIA_SEMANTIC_INDEX가 켜져 있고 의미 검색 색인이 만들어져 있으면 두 결과를 융합합니다.
+    파일 입출력을 수행하므로 이벤트 루프에서는 실행기(executor)로 호출하세요.
+
+    Args:
+        root: 작업 디렉터리
+        query: 검색어
+        limit: 최대 결과 수 (기본값: NUREXIA_WORKSPACE_SNIPPETS)
+        errors: 의미 검색 실패 메시지를 추가할 목록 (실패해도 전문 검색 결과는 반환)
+
+    Returns:
+        {"path", "start_line", "end_line", "score", "text"} 목록 (관련도 순)
+    """
+    limit = config_manager.workspace_snippets if limit is None else limit
+    if limit <= 0 or not query.strip():
+        return []
+    index = get_workspace_index(root)
+    # 최초 색인은 오래 걸리므로 요청 처리 중에는 만들지 않고 이미 만든 색인만 갱신 (의미 검색과 같은 방식)
+    if not index.is_built:
+        index.build_in_background()
+        return []
+    index.refresh()
+    results = index.search(query, limit)
+
+    if config_manager.semantic_index:
+        try:
+            from .semantic import get_semantic_index
+            semantic = get_semantic_index(root)
+            # 최초 임베딩은 오래 걸리므로 요청 처리 중에는 이미 만든 색인만 갱신
+            if semantic.is_built:
+                semantic.refresh()
+                results = fuse_results([results, semantic.search(query, limit)], limit)
+        except Exception as e:
+            if errors is not None:
+                errors.append(f"semantic: {type(e).__name__}: {e}")
+    return results
+
+
+def format_snippets(snippets: List[Dict[str, Any]], max_tokens: Optional[int] = None) -> str:
+    """
+    코드 조각을 프롬프트용 텍스트로 정리
+
+    관련도 순으로 토큰 예산 안에 들어가는 조각만 포함합니다.
+
+    Args:
+        snippets: search_workspace() 결과
+        max_tokens: 최대 토큰 수 (기본값: NUREXIA_WORKSPACE_CONTEXT_TOKENS)
+
+    Returns:
+        머리말과 "경로:시작-끝" 제목이 붙은 코드 블록 목록 (조각이 없으면 빈 문자열)
+    """
+    max_tokens = config_manager.workspace_context_tokens if max_tokens is None else max_tokens
+    sections = []
+    used = count_tokens(CONTEXT_HEADER)
+    for snippet in snippets:
+        section = f"{snippet['path']}:{snippet['start_line']}-{snippet['end_line']}\n```\n{snippet['text']}\n```"
+        tokens = count_tokens(section)
+        if used + tokens > max_tokens:
+            continue
+        sections.append(section)
+        used += tokens
+    if not sections:
+        return ""
+    return CONTEXT_HEADER + "\n\n" + "\n\n".join(sections)
@@ -0,0 +1,447 @@
+"""
+작업 디렉터리 의미 검색 색인
+코드 조각을 로컬 임베딩 모델(Ollama 또는 CPU sentence-transformers)로 벡터화하여
+메모리 매핑된 NumPy 행렬에 보관하고, 조각 위치는 SQLite 목록(manifest)에 기록합니다.
+검색은 정규화된 벡터의 행렬 곱(코사인 유사도)과 부분 정렬로 상위 k개를 찾으며,
+원격 API를 호출하지 않습니다. numpy는 선택 의존성입니다 (pip install nurexia[semantic]).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import sqlite3
+import threading
+import time
+
+from ..config import config_manager
+from .index import index_path_for
+from .ingest import chunk_lines, iter_file_chunks, read_text, scan_workspace
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+# 색인 형식 버전 (바뀌면 기존 색인을 다시 만듦)
+SEMANTIC_VERSION = "1"
+
+# 벡터 행렬의 최소 행 수 (부족하면 두 배씩 늘림)
+MIN_CAPACITY = 1024
+
+# 임베딩 모델에 넘기는 조각 최대 길이 (문자)
+MAX_EMBED_CHARS = 4000
+
+
+def require_numpy():
+    """
+    numpy 모듈 반환
+
+    Raises:
+        ImportError: numpy가 설치되지 않은 경우
+    """
+    if np is None:
+        raise ImportError("의미 검색 색인에는 numpy가 필요합니다: pip install nurexia[semantic]")
+    return np
+
+
+def create_embedder(spec: Optional[str] = None) -> Any:
+    """
+    로컬 임베딩 모델 생성
+
+    Args:
+        spec: "ollama:<모델>" 또는 "sentence-transformers:<모델>" (기본값: NUREXIA_EMBEDDINGS)
+
+    Returns:
+        embed_documents()/embed_query()를 제공하는 LangChain Embeddings 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 임베딩 백엔드
+    """
+    spec = spec or config_manager.embeddings
+    backend, _, model = spec.partition(":")
+    if backend == "ollama":
+        from langchain_ollama import OllamaEmbeddings
+        return OllamaEmbeddings(model=model, base_url=config_manager.get_provider_config("ollama")["host"])
+    if backend == "sentence-transformers":
+        from langchain_huggingface import HuggingFaceEmbeddings
+        return HuggingFaceEmbeddings(model_name=model, model_kwargs={"device": "cpu"})
+    raise ValueError(f"알 수 없는 임베딩 백엔드: {backend} (ollama, sentence-transformers 중 선택)")
+
+
+def nonblank_chunks(text: str) -> List[Tuple[int, int, str]]:
+    """
+    파일 내용을 임베딩할 조각으로 변환 (수집 작업자에서 실행, 공백뿐인 조각 제외)
+
+    Args:
+        text: 파일 내용
+
+    Returns:
+        (시작 줄, 끝 줄, 내용) 목록
+    """
+    return [chunk for chunk in chunk_lines(text) if chunk[2].strip()]
+
+
+def semantic_path_for(root: str) -> str:
+    """
+    작업 디렉터리의 의미 검색 색인 디렉터리 경로
+
+    Args:
+        root: 작업 디렉터리 절대 경로
+
+    Returns:
+        전문 검색 색인 파일 옆의 "<해시>.semantic" 디렉터리 경로
+    """
+    return os.path.splitext(index_path_for(root))[0] + ".semantic"
+
+
+class SemanticIndex:
+    """작업 디렉터리의 임베딩 기반 의미 검색 색인
+
+    벡터는 vectors.f32 파일(행 = 조각, 단위 길이로 정규화)에, 조각 위치와 파일 변경 시각은
+    manifest.sqlite3에 보관합니다. 변경된 파일의 조각 행은 비워 두었다가 새 조각에 재사용합니다.
+    """
+
+    def __init__(self, root: str, embedder: Any = None, model: Optional[str] = None,
+                 path: Optional[str] = None, max_file_size: Optional[int] = None,
+                 batch_size: Optional[int] = None):
+        """
+        의미 검색 색인 초기화
+
+        Args:
+            root: 작업 디렉터리
+            embedder: 사용할 임베딩 모델 (기본값: model로 최초 사용 시 생성)
+            model: 임베딩 모델 지정 문자열 (기본값: NUREXIA_EMBEDDINGS, 바뀌면 색인을 다시 만듦)
+            path: 색인 디렉터리 (기본값: semantic_path_for(root))
+            max_file_size: 색인할 최대 파일 크기(바이트, 기본값: NUREXIA_INDEX_MAX_FILE_SIZE)
+            batch_size: 임베딩 호출 한 번에 넘기는 조각 수 (기본값: NUREXIA_EMBED_BATCH_SIZE)
+
+        Raises:
+            ImportError: numpy가 설치되지 않은 경우
+        """
+        require_numpy()
+        self.root = os.path.realpath(root)
+        self.model = model or config_manager.embeddings
+        self.path = path or semantic_path_for(self.root)
+        self.max_file_size = max_file_size if max_file_size is not None else config_manager.index_max_file_size
+        self.batch_size = batch_size or config_manager.embed_batch_size
+        self._embedder = embedder
+        self._lock = threading.Lock()
+        self._vectors_path = os.path.join(self.path, "vectors.f32")
+        os.makedirs(self.path, exist_ok=True)
+
+        self._conn = sqlite3.connect(os.path.join(self.path, "manifest.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        if self._get_meta("version") != SEMANTIC_VERSION or self._get_meta("model") != self.model:
+            self._reset()
+
+        dim = self._get_meta("dim")
+        self._dim: Optional[int] = int(dim) if dim else None
+        self._vectors = None
+        # 행별 사용 여부 (False인 행은 검색에서 제외하고 새 조각에 재사용)
+        self._load_rows()
+
+    @property
+    def embedder(self) -> Any:
+        """임베딩 모델 (최초 사용 시 생성)"""
+        if self._embedder is None:
+            self._embedder = create_embedder(self.model)
+        return self._embedder
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        """메타데이터 값 조회"""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Any):
+        """메타데이터 값 저장 (커밋은 호출자가 수행)"""
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _reset(self):
+        """목록과 벡터 파일을 비우고 다시 생성"""
+        self._conn.execute("DROP TABLE IF EXISTS files")
+        self._conn.execute("DROP TABLE IF EXISTS chunks")
+        self._conn.execute(
+            "CREATE TABLE files ("
+            " path TEXT PRIMARY KEY,"
+            " mtime_ns INTEGER NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE chunks ("
+            " row INTEGER PRIMARY KEY,"
+            " path TEXT NOT NULL,"
+            " start_line INTEGER NOT NULL,"
+            " end_line INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX idx_chunks_path ON chunks (path)")
+        self._conn.execute("DELETE FROM meta")
+        self._set_meta("version", SEMANTIC_VERSION)
+        self._set_meta("model", self.model)
+        self._conn.commit()
+        if os.path.exists(self._vectors_path):
+            os.remove(self._vectors_path)
+        self._dim = None
+        self._vectors = None
+        self._valid = np.zeros(0, dtype=bool)
+
+    def _load_rows(self):
+        """사용 중인 행 목록을 읽어 사용 여부 배열 구성"""
+        rows = np.fromiter((row for (row,) in self._conn.execute("SELECT row FROM chunks")), dtype=np.int64)
+        capacity = self._capacity()
+        self._valid = np.zeros(max(capacity, int(rows.max()) + 1 if rows.size else 0), dtype=bool)
+        self._valid[rows] = True
+
+    def _capacity(self) -> int:
+        """벡터 파일의 행 수"""
+        if not self._dim or not os.path.exists(self._vectors_path):
+            return 0
+        return os.path.getsize(self._vectors_path) // (self._dim * 4)
+
+    def _open_vectors(self, min_rows: int = 0):
+        """
+        벡터 파일을 메모리 매핑으로 열기 (행이 부족하면 두 배씩 늘림)
+
+        Args:
+            min_rows: 필요한 최소 행 수
+        """
+        capacity = self._capacity()
+        if capacity < min_rows:
+            capacity = max(MIN_CAPACITY, capacity)
+            while capacity < min_rows:
+                capacity *= 2
+            self._vectors = None
+            with open(self._vectors_path, "ab") as f:
+                f.truncate(capacity * self._dim * 4)
+        if self._vectors is None and capacity:
+            self._vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self._dim))
+        if self._valid.size < capacity:
+            self._valid = np.concatenate([self._valid, np.zeros(capacity - self._valid.size, dtype=bool)])
+
+    def _embed(self, texts: List[str]) -> Any:
+        """
+        텍스트 목록을 단위 길이 벡터 행렬로 변환
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+
+        Returns:
+            (len(texts), 차원) float32 행렬
+        """
+        vectors = np.asarray(self.embedder.embed_documents([text[:MAX_EMBED_CHARS] for text in texts]),
+                             dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _release(self, path: str):
+        """파일의 조각 행을 비움 (커밋은 호출자가 수행)"""
+        rows = [row for (row,) in self._conn.execute("SELECT row FROM chunks WHERE path = ?", (path,))]
+        if rows:
+            self._valid[rows] = False
+            self._conn.execute("DELETE FROM chunks WHERE path = ?", (path,))
+
+    def _store(self, pending: List[Tuple[str, os.stat_result, List[Tuple[int, int, str]]]]):
+        """
+        대기 중인 파일들의 조각을 임베딩하여 저장하고 파일 목록 갱신 (커밋 포함)
+
+        조각과 파일 기록을 함께 커밋하므로 도중에 중단되어도 다음 갱신에서 다시 처리됩니다.
+
+        Args:
+            pending: (경로, stat 결과, 조각 목록) 목록
+        """
+        chunks = [(path, start, end, text) for path, _, file_chunks in pending for start, end, text in file_chunks]
+        if chunks:
+            vectors = self._embed([text for _, _, _, text in chunks])
+            if self._dim is None:
+                self._dim = vectors.shape[1]
+                self._set_meta("dim", self._dim)
+
+            free = np.flatnonzero(~self._valid)
+            if free.size < len(chunks):
+                self._open_vectors(self._valid.size + len(chunks) - free.size)
+                free = np.flatnonzero(~self._valid)
+            else:
+                self._open_vectors()
+            rows = free[:len(chunks)]
+            self._vectors[rows] = vectors
+            self._vectors.flush()
+            self._valid[rows] = True
+            self._conn.executemany(
+                "INSERT INTO chunks (row, path, start_line, end_line) VALUES (?, ?, ?, ?)",
+                [(int(row), path, start, end) for row, (path, start, end, _) in zip(rows, chunks)]
+            )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+            [(path, st.st_mtime_ns, st.st_size) for path, st, _ in pending]
+        )
+        self._conn.commit()
+
+    def update(self) -> Dict[str, int]:
+        """
+        작업 디렉터리를 순회하며 변경된 파일만 다시 임베딩
+
+        파일 읽기와 조각 분할은 수집 작업자 풀에서 병렬로 수행하고, 조각은 batch_size개씩
+        모아 임베딩합니다.
+
+        Returns:
+            {"files": 대상 파일 수, "indexed": 다시 읽은 파일 수, "removed": 제거한 파일 수,
+             "chunks": 새로 임베딩한 조각 수}
+        """
+        with self._lock:
+            known = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in self._conn.execute("SELECT path, mtime_ns, size FROM files")
+            }
+            seen = set()
+
+            def changed_files():
+                for path, st in scan_workspace(self.root):
+                    seen.add(path)
+                    if known.get(path) != (st.st_mtime_ns, st.st_size):
+                        yield path, st
+
+            indexed = embedded = 0
+            pending, pending_chunks = [], 0
+            for path, st, file_chunks in iter_file_chunks(self.root, changed_files(), nonblank_chunks,
+                                                          self.max_file_size):
+                self._release(path)
+                file_chunks = file_chunks or []
+                pending.append((path, st, file_chunks))
+                pending_chunks += len(file_chunks)
+                indexed += 1
+                if pending_chunks >= self.batch_size:
+                    self._store(pending)
+                    embedded += pending_chunks
+                    pending, pending_chunks = [], 0
+
+            self._store(pending)
+            embedded += pending_chunks
+
+            removed = [path for path in known if path not in seen]
+            for path in removed:
+                self._release(path)
+                self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+            self._set_meta("updated_at", time.time())
+            self._conn.commit()
+        return {"files": len(seen), "indexed": indexed, "removed": len(removed), "chunks": embedded}
+
+    def refresh(self, max_age: Optional[float] = None) -> Optional[Dict[str, int]]:
+        """
+        마지막 갱신 후 max_age초가 지났으면 색인 갱신
+
+        Args:
+            max_age: 갱신 주기(초, 기본값: NUREXIA_INDEX_REFRESH)
+
+        Returns:
+            갱신했으면 update() 결과, 건너뛰었으면 None
+        """
+        max_age = config_manager.index_refresh if max_age is None else max_age
+        with self._lock:
+            updated_at = float(self._get_meta("updated_at") or 0)
+        if time.time() - updated_at < max_age:
+            return None
+        return self.update()
+
+    @property
+    def is_built(self) -> bool:
+        """한 번 이상 갱신되어 검색할 수 있는지 여부"""
+        with self._lock:
+            return self._get_meta("updated_at") is not None
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        검색어와 의미가 가까운 코드 조각 검색 (코사인 유사도 순)
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            [{"path", "start_line", "end_line", "score", "text"}, ...] (score는 코사인 유사도)
+        """
+        if limit <= 0 or not query.strip():
+            return []
+        with self._lock:
+            if not self._dim or not self._valid.any():
+                return []
+            self._open_vectors()
+            vector = np.asarray(self.embedder.embed_query(query[:MAX_EMBED_CHARS]), dtype=np.float32)
+            vector /= max(float(np.linalg.norm(vector)), 1e-12)
+
+            used = int(np.flatnonzero(self._valid)[-1]) + 1
+            scores = self._vectors[:used] @ vector
+            scores[~self._valid[:used]] = -np.inf
+            count = min(limit, int(self._valid[:used].sum()))
+            top = np.argpartition(-scores, count - 1)[:count]
+            top = top[np.argsort(-scores[top])]
+
+            placeholders = ", ".join("?" * len(top))
+            locations = {
+                row: (path, start_line, end_line)
+                for row, path, start_line, end_line in self._conn.execute(
+                    f"SELECT row, path, start_line, end_line FROM chunks WHERE row IN ({placeholders})",
+                    [int(row) for row in top]
+                )
+            }
+
+        results = []
+        for row in top:
+            path, start_line, end_line = locations[int(row)]
+            text = read_text(os.path.join(self.root, path))
+            if text is None:
+                continue
+            snippet = "\n".join(text.splitlines()[start_line - 1:end_line])
+            results.append({"path": path, "start_line": start_line, "end_line": end_line,
+                            "score": float(scores[row]), "text": snippet})
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        색인 통계
+
+        Returns:
+            {"root", "path", "model", "files", "chunks", "dim", "updated_at"}
+        """
+        with self._lock:
+            files = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            chunks = self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+            updated_at = float(self._get_meta("updated_at") or 0)
+        return {"root": self.root, "path": self.path, "model": self.model, "files": files,
+                "chunks": chunks, "dim": self._dim, "updated_at": updated_at}
+
+    def clear(self):
+        """색인 전체 삭제 (다음 갱신에서 모든 파일을 다시 임베딩)"""
+        with self._lock:
+            self._reset()
+
+    def close(self):
+        """목록 연결과 벡터 파일 매핑 종료"""
+        with self._lock:
+            self._vectors = None
+            self._conn.close()
+
+
+# 작업 디렉터리별 의미 검색 색인 (최초 사용 시 생성)
+_indexes: Dict[str, SemanticIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_semantic_index(root: str) -> SemanticIndex:
+    """
+    작업 디렉터리의 의미 검색 색인 반환 (프로세스 안에서 재사용)
+
+    Args:
+        root: 작업 디렉터리
+
+    Returns:
+        SemanticIndex 인스턴스
+
+    Raises:
+        ImportError: numpy가 설치되지 않은 경우
+    """
+    root = os.path.realpath(root)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = SemanticIndex(root)
+    return index
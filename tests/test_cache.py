@@ -0,0 +1,76 @@
+"""응답 캐시 테스트 (TTL 만료, LRU 제거, 캐시 키 정규화)"""
+import pytest
+
+from nurexia.graph.messages import Message, MessageRole
+from nurexia.providers import cache as cache_module
+from nurexia.providers.cache import ResponseCache, make_cache_key
+
+
+class _Clock:
+    """time.time() 대신 사용하는 조작 가능한 시계"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(cache_module.time, "time", fake)
+    return fake
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+    cache.set("key", "answer", {"model": "m"})
+    clock.now += 59
+    assert cache.get("key") == {"content": "answer", "metadata": {"model": "m"}}
+    # 조회해도 생성 시각 기준으로 만료
+    clock.now += 2
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    cache.set("a", "1")
+    clock.now += 1
+    cache.set("b", "2")
+    clock.now += 1
+    assert cache.get("a") is not None
+    clock.now += 1
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a")["content"] == "1"
+    assert cache.get("c")["content"] == "3"
+
+
+def test_cache_key_normalizes_messages():
+    as_dicts = [{"role": "system", "content": "be brief"}, {"role": "user", "content": "hi"}]
+    as_models = [Message(role=MessageRole.SYSTEM, content="be brief"), Message(role=MessageRole.USER, content="hi")]
+    assert make_cache_key("p", "m", as_dicts, {}) == make_cache_key("p", "m", as_models, {})
+    # 역할이나 내용이 없는 메시지는 무시
+    assert make_cache_key("p", "m", as_dicts + [{"role": "user"}], {}) == make_cache_key("p", "m", as_dicts, {})
+    assert make_cache_key("p", "m", as_dicts, {}) != make_cache_key("p", "m", as_dicts[1:], {})
+
+
+@pytest.mark.parametrize("option", [
+    {"verbose": True}, {"cache": True}, {"stream": True}, {"timeout": 5},
+    {"record": "/tmp/cassette.jsonl"}, {"cassette": "/tmp/cassette.jsonl"}, {"hedge_delay": 0.5},
+])
+def test_cache_key_ignores_non_generation_options(option):
+    messages = [{"role": "user", "content": "hi"}]
+    assert make_cache_key("p", "m", messages, {"temperature": 0.2, **option}) == \
+        make_cache_key("p", "m", messages, {"temperature": 0.2})
+
+
+def test_cache_key_depends_on_generation_options():
+    messages = [{"role": "user", "content": "hi"}]
+    key = make_cache_key("p", "m", messages, {"temperature": 0.2, "max_tokens": 10})
+    assert key == make_cache_key("p", "m", messages, {"max_tokens": 10, "temperature": 0.2})
+    assert key != make_cache_key("p", "m", messages, {"temperature": 0.7, "max_tokens": 10})
+    assert key != make_cache_key("p", "other", messages, {"temperature": 0.2, "max_tokens": 10})
+    assert key != make_cache_key("p", "m", messages, {"temperature": 0.2, "max_tokens": 10, "race": ["q"]})
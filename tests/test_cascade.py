@@ -0,0 +1,150 @@
+"""단계적 Provider 테스트 (넘김 판단 규칙, 단계 전환, 캐시와의 조합)"""
+import asyncio
+
+import pytest
+
+from nurexia.providers.cache import CachedProvider, ResponseCache
+from nurexia.providers.cascade import CascadeBoundary, CascadePolicy, CascadeProvider
+
+GOOD_ANSWER = "The capital of France is Paris."
+
+
+def _policy(**overrides):
+    """설정값에 영향받지 않는 판단 규칙"""
+    values = {"min_chars": 10, "max_prompt_tokens": 0, "uncertainty": None, "require": "", "reject": ""}
+    values.update(overrides)
+    return CascadePolicy(**values)
+
+
+class _FakeProvider:
+    """정해진 응답을 청크로 나눠 반환하고 호출 횟수를 기록하는 테스트용 Provider"""
+
+    supports_streaming = True
+    supports_async = True
+
+    def __init__(self, name, content, fail=False):
+        self.name = name
+        self.model = "test"
+        self.options = {}
+        self.content = content
+        self.fail = fail
+        self.calls = 0
+
+    def _process_options(self, options):
+        return options
+
+    async def chat(self, messages, options=None):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("down")
+        return {"content": self.content, "metadata": {}}
+
+    async def stream_chat(self, messages, options=None):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("down")
+        for word in self.content.split(" "):
+            yield word + " "
+
+
+def _messages(prompt="What is the capital of France?"):
+    return [{"role": "system", "content": "be brief"}, {"role": "user", "content": prompt}]
+
+
+def _collect(provider, messages=None):
+    async def consume():
+        return [chunk async for chunk in provider.stream_chat(messages or _messages())]
+    return asyncio.run(consume())
+
+
+@pytest.mark.parametrize("policy, content, reasons", [
+    (_policy(), GOOD_ANSWER, []),
+    (_policy(), "Paris", ["too_short"]),
+    (_policy(), "I'm not sure, but maybe Paris.", ["uncertain"]),
+    (_policy(), "잘 모르겠지만 아마 파리입니다.", ["uncertain"]),
+    (_policy(uncertainty=""), "I'm not sure, but maybe Paris.", []),
+    (_policy(require=r"```"), GOOD_ANSWER, ["missing_required"]),
+    (_policy(require=r"Paris"), GOOD_ANSWER, []),
+    (_policy(reject=r"(?i)as an ai"), "As an AI model I think it is Paris.", ["rejected"]),
+    (_policy(min_chars=100, require=r"```"), "I don't know", ["too_short", "uncertain", "missing_required"]),
+])
+def test_policy_evaluate(policy, content, reasons):
+    assert policy.evaluate(content) == reasons
+
+
+def test_policy_pre_route_uses_last_user_message():
+    policy = _policy(max_prompt_tokens=10)
+    assert policy.pre_route(_messages("short question")) == []
+    assert policy.pre_route(_messages("x" * 80)) == ["prompt_tokens>10"]
+    # 이전 턴의 긴 질문은 무시
+    history = _messages("x" * 80) + [{"role": "assistant", "content": "ok"}, {"role": "user", "content": "thanks"}]
+    assert policy.pre_route(history) == []
+    assert _policy(max_prompt_tokens=0).pre_route(_messages("x" * 80)) == []
+
+
+def test_chat_uses_draft_when_it_passes():
+    draft, strong = _FakeProvider("draft", GOOD_ANSWER), _FakeProvider("strong", "strong answer")
+    cascade = CascadeProvider([draft, strong], _policy())
+    response = asyncio.run(cascade.chat(_messages()))
+    assert response["content"] == GOOD_ANSWER
+    assert strong.calls == 0
+    record = response["metadata"]["cascade"]
+    assert record["final"] == "draft/test" and record["escalated"] is False
+
+
+def test_chat_escalates_uncertain_or_failed_drafts():
+    draft, strong = _FakeProvider("draft", "I don't know."), _FakeProvider("strong", GOOD_ANSWER)
+    cascade = CascadeProvider([draft, strong], _policy())
+    response = asyncio.run(cascade.chat(_messages()))
+    assert response["content"] == GOOD_ANSWER
+    assert [a["reasons"] for a in cascade.last_cascade["attempts"]] == [["uncertain"], []]
+
+    failing = _FakeProvider("draft", GOOD_ANSWER, fail=True)
+    response = asyncio.run(CascadeProvider([failing, strong], _policy()).chat(_messages()))
+    assert response["metadata"]["cascade"]["attempts"][0]["reasons"] == ["error:ConnectionError"]
+    # 마지막 단계는 판단 없이 사용하고, 실패하면 오류를 그대로 전달
+    assert asyncio.run(CascadeProvider([draft], _policy()).chat(_messages()))["content"] == "I don't know."
+    with pytest.raises(ConnectionError):
+        asyncio.run(CascadeProvider([draft, failing], _policy()).chat(_messages()))
+
+
+def test_long_prompt_skips_draft():
+    draft, strong = _FakeProvider("draft", GOOD_ANSWER), _FakeProvider("strong", "strong answer")
+    cascade = CascadeProvider([draft, strong], _policy(max_prompt_tokens=5))
+    chunks = _collect(cascade, _messages("x" * 80))
+    assert "".join(chunks) == "strong answer "
+    assert not any(isinstance(chunk, CascadeBoundary) for chunk in chunks)
+    assert draft.calls == 0
+    assert cascade.last_cascade["attempts"][0]["skipped"] is True
+
+
+def test_stream_emits_boundary_before_next_tier():
+    draft, strong = _FakeProvider("draft", "Paris"), _FakeProvider("strong", GOOD_ANSWER)
+    cascade = CascadeProvider([draft, strong], _policy())
+    chunks = _collect(cascade)
+    boundaries = [i for i, chunk in enumerate(chunks) if isinstance(chunk, CascadeBoundary)]
+    assert boundaries == [1]
+    assert chunks[0] == "Paris "
+    assert chunks[1].info == {"from": "draft/test", "to": "strong/test", "reasons": ["too_short"]}
+    assert "".join(chunks[2:]) == GOOD_ANSWER + " "
+    assert cascade.last_cascade["final"] == "strong/test"
+
+
+def test_stream_without_draft_output_has_no_boundary():
+    draft, strong = _FakeProvider("draft", "", fail=True), _FakeProvider("strong", GOOD_ANSWER)
+    chunks = _collect(CascadeProvider([draft, strong], _policy()))
+    assert "".join(chunks) == GOOD_ANSWER + " "
+    assert not any(isinstance(chunk, CascadeBoundary) for chunk in chunks)
+
+
+def test_cached_stream_stores_only_final_tier(tmp_path):
+    draft, strong = _FakeProvider("draft", "Paris"), _FakeProvider("strong", GOOD_ANSWER)
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"))
+    provider = CachedProvider(CascadeProvider([draft, strong], _policy()), cache=cache)
+
+    first = _collect(provider)
+    assert any(isinstance(chunk, CascadeBoundary) for chunk in first)
+    # 두 번째 요청은 버린 초안과 전환 안내 없이 최종 응답만 캐시에서 반환
+    assert _collect(provider) == [GOOD_ANSWER + " "]
+    assert (draft.calls, strong.calls) == (1, 1)
+    cache.close()
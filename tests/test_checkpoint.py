@@ -0,0 +1,99 @@
+"""세션 체크포인트 테스트 (증분 저장, 이력 되돌리기, 복원)"""
+import pytest
+
+from nurexia.cli import discard_turn, load_state
+from nurexia.graph.checkpoint import CheckpointStore
+from nurexia.graph.state import GraphState, MessageRole
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CheckpointStore(str(tmp_path / "sessions.sqlite3"))
+    yield store
+    store.close()
+
+
+def _contents(state):
+    return [(message.role, message.content) for message in state.messages]
+
+
+def _new_state():
+    return GraphState(provider="mock", model="echo", mode="chat", options={"temperature": 0.7})
+
+
+def test_save_appends_only_new_messages(store, tmp_path):
+    state = _new_state()
+    state.add_message(MessageRole.USER, "one")
+    state.add_message(MessageRole.ASSISTANT, "one!")
+    assert store.save("s", state) == 2
+    assert store.save("s", state) == 0
+
+    state.add_message(MessageRole.USER, "two", source="test")
+    assert store.save("s", state) == 1
+
+    # 새 저장소(다른 프로세스)에서도 같은 이력 복원
+    reopened = CheckpointStore(str(tmp_path / "sessions.sqlite3"))
+    loaded = reopened.load("s")
+    assert _contents(loaded) == _contents(state)
+    assert loaded.messages.metadata_at(2) == {"source": "test"}
+    assert loaded.provider == "mock" and loaded.options == {"temperature": 0.7}
+    reopened.close()
+
+
+def test_truncated_history_is_rewritten(store):
+    state = _new_state()
+    for text in ("a", "b", "c", "d"):
+        state.add_message(MessageRole.USER, text)
+    store.save("s", state)
+
+    state.messages.truncate(2)
+    store.save("s", state)
+    assert _contents(store.load("s")) == [(MessageRole.USER, "a"), (MessageRole.USER, "b")]
+
+    # 되돌린 뒤 추가한 메시지는 같은 위치에 다시 기록
+    state.add_message(MessageRole.ASSISTANT, "new")
+    assert store.save("s", state) == 1
+    assert _contents(store.load("s"))[-1] == (MessageRole.ASSISTANT, "new")
+    assert store.list_sessions()[0]["messages"] == 3
+
+
+def test_discard_turn_rolls_back_failed_turn(store):
+    state = _new_state()
+    state.add_message(MessageRole.USER, "hello")
+    state.add_message(MessageRole.ASSISTANT, "hi")
+    store.save("s", state)
+
+    turn_start = len(state.messages)
+    state.add_message(MessageRole.USER, "this one fails")
+    # 노드별 체크포인트가 실패한 턴을 이미 저장한 경우
+    store.save("s", state)
+    state.error = "boom"
+    discard_turn(store, "s", state, turn_start)
+
+    loaded = store.load("s")
+    assert _contents(loaded) == [(MessageRole.USER, "hello"), (MessageRole.ASSISTANT, "hi")]
+
+
+def test_load_state_resets_previous_result(store):
+    state = _new_state()
+    state.add_message(MessageRole.USER, "hello")
+    state.error, state.result = "old error", "old result"
+    store.save("s", state)
+
+    resumed = load_state(store, "s", "other", "model-b", "/tmp", "edit", {"cache": False}, verbose=False)
+    assert resumed.error is None and resumed.result is None
+    assert (resumed.provider, resumed.model, resumed.mode) == ("other", "model-b", "edit")
+    assert resumed.options == {"cache": False}
+    assert _contents(resumed) == [(MessageRole.USER, "hello")]
+
+    fresh = load_state(store, "missing", "mock", "echo", "/tmp", "chat", {}, verbose=False)
+    assert len(fresh.messages) == 0
+
+
+def test_delete_forgets_session(store):
+    state = _new_state()
+    state.add_message(MessageRole.USER, "hello")
+    store.save("s", state)
+    store.delete("s")
+    assert store.load("s") is None
+    assert store.save("s", state) == 1
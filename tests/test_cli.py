@@ -0,0 +1,49 @@
+"""CLI 종료 코드 테스트 (네트워크 없이 mock Provider 사용)"""
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from nurexia.cli import cli
+from nurexia.config import config_manager
+
+BATCH_ARGS = ["-pv", "mock", "-md", "echo", "--no-cache", "--batch", "-"]
+
+
+def test_batch_exits_zero_when_all_requests_succeed():
+    result = CliRunner().invoke(cli, BATCH_ARGS, input='{"prompt": "hello"}\n')
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output.splitlines()[0])["result"] == "hello"
+
+
+def test_batch_exits_non_zero_when_a_request_fails():
+    result = CliRunner().invoke(cli, BATCH_ARGS, input='{"prompt": "hello"}\nnot json\n')
+    assert result.exit_code == 1, result.output
+    assert len(result.output.splitlines()) == 2
+
+
+@pytest.mark.parametrize("args", [
+    ["-pv", "unknown", "-p", "hello"],
+    ["-pv", "mock", "-t", "3", "-p", "hello"],
+    ["-pv", "unknown", "--batch", "-"],
+    ["-pv", "unknown", "serve"],
+])
+def test_invalid_options_exit_non_zero(args):
+    result = CliRunner().invoke(cli, args, input="")
+    assert result.exit_code == 1, result.output
+    assert "Error" in result.output
+
+
+@pytest.mark.parametrize("stream_args", [[], ["--stream-mode"]])
+def test_prompt_exit_code_reflects_provider_failure(monkeypatch, stream_args):
+    args = ["-pv", "mock", "-md", "echo", "--no-cache", "-p", "hello"] + stream_args
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert "hello" in result.output
+
+    # 환경 변수는 처음 읽은 뒤 캐시되므로 설정값을 직접 변경
+    mock_config = config_manager.get_provider_config("mock")
+    monkeypatch.setitem(mock_config, "error_rate", 1.0)
+    monkeypatch.setitem(mock_config, "error", "bad_request")
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 1, result.output
@@ -0,0 +1,115 @@
+"""컨텍스트 윈도우 관리 테스트 (고정 메시지 유지, 예산 안의 이력 정리, 요약)"""
+import pytest
+
+from nurexia.graph.context import ContextWindowManager
+from nurexia.graph.messages import Message, MessageStore
+from nurexia.graph.state import MessageRole
+from nurexia.graph.tokens import count_message_tokens
+
+# ASCII 40자 = 10토큰 + 메시지 오버헤드 4토큰
+TURN = "x" * 40
+TURN_TOKENS = 14
+
+
+def _history(turns, pinned=False):
+    store = MessageStore()
+    store.add(MessageRole.SYSTEM, "system prompt")
+    if pinned:
+        store.add(MessageRole.USER, "pinned context", {"pinned": True})
+    for i in range(turns):
+        store.add(MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT, f"{i:02d}{TURN[2:]}")
+    store.add(MessageRole.USER, "latest question")
+    return store
+
+
+def _tokens(messages):
+    return sum(count_message_tokens(message) for message in messages)
+
+
+def _summary_message(text):
+    return Message(role=MessageRole.SYSTEM, content=text)
+
+
+@pytest.mark.parametrize("as_list", [False, True])
+@pytest.mark.parametrize("budget", [30, 60, 100, 200])
+def test_fit_keeps_system_and_latest_turn_within_budget(budget, as_list):
+    history = _history(20)
+    messages = list(history) if as_list else history
+    manager = ContextWindowManager(budget, reserve_output_tokens=0)
+
+    fitted = list(manager.fit(messages))
+    assert fitted[0].content == "system prompt"
+    assert fitted[-1].content == "latest question"
+    assert _tokens(fitted) <= budget
+    assert manager.last_stats["tokens"] == _tokens(fitted)
+    assert manager.last_stats["dropped"] == len(history) - len(fitted)
+    # 유지되는 이력은 최신 턴부터 연속된 구간
+    kept = [m.content for m in fitted[1:-1]]
+    assert kept == [m.content for m in history[len(history) - 1 - len(kept):-1]]
+
+
+def test_fit_fills_remaining_budget_with_newest_turns():
+    history = _history(10)
+    fixed = _tokens([history[0], history[-1]])
+    manager = ContextWindowManager(fixed + 3 * TURN_TOKENS + 1, reserve_output_tokens=0)
+    fitted = manager.fit(history)
+    assert [m.content[:2] for m in fitted[1:-1]] == ["07", "08", "09"]
+
+
+def test_fit_keeps_latest_turn_even_when_over_budget():
+    manager = ContextWindowManager(1, reserve_output_tokens=0)
+    fitted = manager.fit(_history(5))
+    assert [m.content for m in fitted] == ["system prompt", "latest question"]
+
+
+def test_fit_returns_original_when_history_fits():
+    history = _history(3)
+    manager = ContextWindowManager(10_000)
+    assert manager.fit(history) is history
+    assert manager.last_stats["dropped"] == 0
+
+
+def test_fit_keeps_pinned_messages_and_returns_view_without_head():
+    manager = ContextWindowManager(60, reserve_output_tokens=0)
+    fitted = manager.fit(_history(10, pinned=True))
+    assert [m.content for m in fitted[:2]] == ["system prompt", "pinned context"]
+    assert _tokens(fitted) <= 60
+
+    # 선두 고정 메시지가 없으면 복사 없이 저장소 뷰 반환
+    store = MessageStore()
+    for i in range(10):
+        store.add(MessageRole.USER, TURN)
+    fitted = manager.fit(store)
+    assert not isinstance(fitted, list)
+    assert len(fitted) == 60 // TURN_TOKENS
+
+
+def test_reserve_output_tokens_reduces_budget():
+    manager = ContextWindowManager(100, reserve_output_tokens=40)
+    assert manager.budget == 60
+    assert _tokens(manager.fit(_history(20))) <= 60
+    assert ContextWindowManager(10, reserve_output_tokens=40).budget == 0
+
+
+def test_summary_of_dropped_turns_fits_in_budget():
+    manager = ContextWindowManager(150, reserve_output_tokens=0, summarizer=lambda dropped: f"{len(dropped)} dropped")
+    fitted = manager.fit(_history(20), make_summary_message=_summary_message)
+    assert fitted[0].content == "system prompt"
+    assert fitted[1].content == f"{manager.last_stats['dropped']} dropped"
+    assert fitted[-1].content == "latest question"
+    assert _tokens(fitted) <= 150
+
+
+def test_summary_is_omitted_when_it_cannot_fit():
+    manager = ContextWindowManager(30, reserve_output_tokens=0, summarizer=lambda dropped: "y" * 400)
+    fitted = manager.fit(_history(20), make_summary_message=_summary_message)
+    assert [m.content for m in fitted] == ["system prompt", "latest question"]
+
+
+def test_for_model_uses_options():
+    manager = ContextWindowManager.for_model("mock", None, {
+        "max_context_tokens": 500, "max_output_tokens": 100, "context_strategy": "summarize"
+    })
+    assert manager.budget == 400
+    assert manager.summarizer is not None
+    assert ContextWindowManager.for_model("mock", None).summarizer is None
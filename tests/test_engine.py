@@ -0,0 +1,135 @@
+"""그래프 실행 엔진 테스트 (병렬 분기, join 순서, 상태 병합)"""
+import asyncio
+import time
+
+import pytest
+
+from nurexia.graph.engine import END, StateGraph, merge_states
+from nurexia.graph.state import GraphState, MessageRole
+
+
+def _state():
+    state = GraphState(provider="mock", model="echo", mode="chat")
+    state.add_message(MessageRole.USER, "question")
+    return state
+
+
+def _branch(name, delay=0.0, **metadata):
+    """지연 후 메시지와 metadata를 추가하는 노드"""
+    async def node(state):
+        await asyncio.sleep(delay)
+        state.add_message(MessageRole.ASSISTANT, name)
+        state.metadata.setdefault("visited", []).append(name)
+        state.metadata.update(metadata)
+        return state
+    return node
+
+
+async def _noop(state):
+    return state
+
+
+def test_fan_out_branches_run_concurrently():
+    graph = StateGraph()
+    graph.add_node("start", _noop)
+    graph.add_node("a", _branch("a", delay=0.2))
+    graph.add_node("b", _branch("b", delay=0.2))
+    graph.add_node("join", _noop)
+    graph.add_edge("start", "a").add_edge("start", "b")
+    graph.add_edge("a", "join").add_edge("b", "join").add_edge("join", END)
+
+    started = time.monotonic()
+    result = asyncio.run(graph.compile().ainvoke(_state()))
+    assert time.monotonic() - started < 0.35
+    assert [m.content for m in result.messages] == ["question", "a", "b"]
+
+
+def test_join_waits_for_all_branches_and_merges_in_source_order():
+    graph = StateGraph()
+    seen = []
+
+    async def join(state):
+        seen.append(list(state.metadata["visited"]))
+        return state
+
+    graph.add_node("start", _noop)
+    # 늦게 끝나는 분기가 먼저 끝나는 분기보다 앞서 병합됨 (이름 순)
+    graph.add_node("alpha", _branch("alpha", delay=0.1))
+    graph.add_node("beta", _branch("beta"))
+    graph.add_node("join", join)
+    graph.add_edge("start", "beta").add_edge("start", "alpha")
+    graph.add_edge("alpha", "join").add_edge("beta", "join").add_edge("join", END)
+
+    steps = []
+
+    async def on_step(name, state):
+        steps.append(name)
+
+    result = asyncio.run(graph.compile().ainvoke(_state(), on_step=on_step))
+    assert seen == [["alpha", "beta"]]
+    assert steps.count("join") == 1
+    assert [m.content for m in result.messages] == ["question", "alpha", "beta"]
+
+
+def test_conditional_route_runs_join_with_partial_branches():
+    graph = StateGraph()
+    graph.add_node("start", _noop)
+    graph.add_node("a", _branch("a"))
+    graph.add_node("b", _branch("b"))
+    graph.add_node("join", _branch("join"))
+    graph.add_conditional_edges("start", lambda state: ["a"])
+    graph.add_edge("start", "b")
+    graph.add_edge("a", "join").add_edge("b", "join").add_edge("join", END)
+
+    result = asyncio.run(graph.compile().ainvoke(_state()))
+    assert result.metadata["visited"] == ["a", "join"]
+
+
+def test_custom_merge_function_is_used():
+    graph = StateGraph()
+    graph.add_node("start", _noop)
+    graph.add_node("a", _branch("a"))
+    graph.add_node("b", _branch("b"))
+    graph.add_node("join", _noop, merge=lambda states: states[-1])
+    graph.add_edge("start", "a").add_edge("start", "b")
+    graph.add_edge("a", "join").add_edge("b", "join").add_edge("join", END)
+
+    result = asyncio.run(graph.compile().ainvoke(_state()))
+    assert [m.content for m in result.messages] == ["question", "b"]
+
+
+def test_merge_states_conflicts():
+    first, second = _state(), _state()
+    first.add_message(MessageRole.ASSISTANT, "from first")
+    second.add_message(MessageRole.ASSISTANT, "from second")
+    first.metadata.update({"tags": ["x"], "info": {"a": 1, "b": 1}, "winner": "first"})
+    second.metadata.update({"tags": ["x", "y"], "info": {"b": 2}, "winner": "second", "extra": True})
+    first.result, second.result = None, "second result"
+    first.error, second.error = "first error", "second error"
+
+    merged = merge_states([first, second])
+    # 공통 이력은 한 번만, 각 분기에서 추가된 메시지는 순서대로
+    assert [m.content for m in merged.messages] == ["question", "from first", "from second"]
+    assert merged.metadata["tags"] == ["x", "y"]
+    assert merged.metadata["info"] == {"a": 1, "b": 2}
+    # 그 밖의 값은 뒤의 분기가 덮어씀
+    assert merged.metadata["winner"] == "second" and merged.metadata["extra"] is True
+    # 오류와 결과는 먼저 설정된 값을 유지
+    assert merged.error == "first error"
+    assert merged.result == "second result"
+
+
+def test_max_steps_stops_loops():
+    graph = StateGraph()
+    graph.add_node("loop", _noop)
+    graph.add_edge("loop", "loop")
+    with pytest.raises(RuntimeError):
+        asyncio.run(graph.compile(max_steps=5).ainvoke(_state()))
+
+
+def test_compile_rejects_unknown_nodes():
+    graph = StateGraph()
+    graph.add_node("start", _noop)
+    graph.add_edge("start", "missing")
+    with pytest.raises(ValueError):
+        graph.compile()
@@ -0,0 +1,119 @@
+"""스트리밍 포맷터 테스트 (NDJSON/SSE 이벤트 순번, 이벤트 이름, 종료 이벤트)"""
+import asyncio
+import json
+
+import pytest
+
+from nurexia.graph.state import GraphState, MessageRole
+from nurexia.providers.cascade import CascadeBoundary
+from nurexia.utils.formatter import (
+    NDJSONStreamFormatter, SSEStreamFormatter, StreamFormatter, create_stream_formatter
+)
+from nurexia.utils.streaming import execute_streaming
+
+
+def _ndjson_events(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def _sse_events(text):
+    """SSE 출력을 (event, id, data) 목록으로 분리"""
+    assert text.endswith("\n\n")
+    events = []
+    for block in text[:-2].split("\n\n"):
+        event, event_id, data = block.split("\n")
+        assert event.startswith("event: ") and event_id.startswith("id: ") and data.startswith("data: ")
+        events.append((event[len("event: "):], int(event_id[len("id: "):]), json.loads(data[len("data: "):])))
+    return events
+
+
+def _run(formatter):
+    """start → chunk → escalate → chunk → finish 순서로 포맷팅한 전체 출력"""
+    return "".join([
+        formatter.start("mock", "echo"),
+        formatter.chunk("draft"),
+        formatter.escalate("[escalating]", {"from": "mock/echo", "to": "mock/big", "reasons": ["too_short"]}),
+        formatter.chunk("최종 "),
+        formatter.chunk("answer"),
+        formatter.finish({"chunks": 2}),
+    ])
+
+
+def test_ndjson_events_are_numbered_in_order():
+    events = _ndjson_events(_run(NDJSONStreamFormatter()))
+    assert [e["event"] for e in events] == ["start", "chunk", "escalate", "chunk", "chunk", "done"]
+    assert [e["seq"] for e in events] == list(range(6))
+    assert all(a["t_ms"] <= b["t_ms"] for a, b in zip(events, events[1:]))
+    assert events[0]["provider"] == "mock" and events[0]["model"] == "echo"
+    assert events[2]["reasons"] == ["too_short"] and events[2]["to"] == "mock/big"
+    assert events[3]["text"] == "최종 "
+    assert events[-1]["chunks"] == 2
+
+
+def test_sse_frames_match_ndjson_events():
+    frames = _sse_events(_run(SSEStreamFormatter()))
+    ndjson = _ndjson_events(_run(NDJSONStreamFormatter()))
+    assert [name for name, _, _ in frames] == [e["event"] for e in ndjson]
+    for name, event_id, data in frames:
+        assert data["event"] == name and data["seq"] == event_id
+    assert frames[-1][0] == "done"
+
+
+def test_error_event_terminates_stream():
+    formatter = NDJSONStreamFormatter()
+    output = formatter.start("mock", None) + formatter.chunk("partial") + formatter.error("boom")
+    events = _ndjson_events(output)
+    assert events[-1] == {"event": "error", "seq": 2, "t_ms": events[-1]["t_ms"], "message": "boom"}
+
+
+@pytest.mark.parametrize("name, cls", [
+    ("text", StreamFormatter), ("json", NDJSONStreamFormatter), ("sse", SSEStreamFormatter), ("unknown", StreamFormatter),
+])
+def test_create_stream_formatter(name, cls):
+    assert type(create_stream_formatter(name)) is cls
+
+
+class _StreamingProvider:
+    """미리 정한 청크를 내보내는 테스트용 스트리밍 Provider"""
+
+    supports_streaming = True
+
+    def __init__(self, chunks, fail=False):
+        self.chunks = chunks
+        self.fail = fail
+
+    async def stream_chat(self, messages, options=None):
+        for chunk in self.chunks:
+            yield chunk
+        if self.fail:
+            raise ConnectionError("connection lost")
+
+
+def _stream(capsys, provider, output_format):
+    state = GraphState(provider="mock", model="echo", mode="chat")
+    state.add_message(MessageRole.USER, "question")
+    asyncio.run(execute_streaming(state, provider, output_format))
+    return state, capsys.readouterr().out
+
+
+@pytest.mark.parametrize("output_format", ["json", "sse"])
+def test_streamed_response_ends_with_done_event(capsys, output_format):
+    boundary = CascadeBoundary("\n[escalating]\n", {"from": "mock/echo", "to": "mock/big", "reasons": ["too_short"]})
+    state, output = _stream(capsys, _StreamingProvider(["draft", boundary, "final ", "answer"]), output_format)
+    if output_format == "json":
+        events = [(e["event"], e["seq"], e) for e in _ndjson_events(output)]
+    else:
+        events = _sse_events(output)
+    assert [name for name, _, _ in events] == ["start", "chunk", "escalate", "chunk", "chunk", "done"]
+    assert [seq for _, seq, _ in events] == list(range(6))
+    # 종료 이벤트 요약과 상태에는 넘김 이후의 청크만 반영
+    assert events[-1][2]["chunks"] == 2
+    assert state.result == "final answer"
+
+
+def test_stream_failure_ends_with_error_event(capsys):
+    state, output = _stream(capsys, _StreamingProvider(["partial"], fail=True), "json")
+    events = _ndjson_events(output)
+    assert [e["event"] for e in events] == ["start", "chunk", "error"]
+    assert events[-1]["message"] == "connection lost"
+    assert state.error == "connection lost"
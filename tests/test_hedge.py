@@ -0,0 +1,97 @@
+"""경주(hedged request) Provider 테스트 (승자 선택과 패자 정리)"""
+import asyncio
+
+from nurexia.providers.hedge import HedgedProvider
+
+
+class _DelayedProvider:
+    """지정한 지연 후 응답하고 취소/스트림 종료를 기록하는 테스트용 Provider"""
+
+    supports_streaming = True
+    supports_async = True
+
+    def __init__(self, name, latency, events):
+        self.name = name
+        self.model = "test"
+        self.options = {}
+        self.latency = latency
+        self.events = events
+
+    async def chat(self, messages, options=None):
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.events.append((self.name, "cancelled"))
+            raise
+        return {"content": self.name, "metadata": {}}
+
+    async def stream_chat(self, messages, options=None):
+        try:
+            await asyncio.sleep(self.latency)
+            yield self.name
+            yield " done"
+        except asyncio.CancelledError:
+            self.events.append((self.name, "cancelled"))
+            raise
+        finally:
+            self.events.append((self.name, "closed"))
+
+
+def _providers(events, *latencies):
+    return [_DelayedProvider(f"p{i}", latency, events) for i, latency in enumerate(latencies)]
+
+
+def _stream(provider):
+    async def consume():
+        return "".join([chunk async for chunk in provider.stream_chat([])])
+    return asyncio.run(consume())
+
+
+def test_chat_uses_fastest_and_cancels_slower():
+    events = []
+    hedged = HedgedProvider(_providers(events, 0.3, 0.01))
+    response = asyncio.run(hedged.chat([]))
+    assert response["content"] == "p1"
+    assert response["metadata"]["race"]["winner"] == "p1/test"
+    assert events == [("p0", "cancelled")]
+
+
+def test_stream_uses_first_token_and_closes_loser():
+    events = []
+    hedged = HedgedProvider(_providers(events, 0.3, 0.01))
+    assert _stream(hedged) == "p1 done"
+    assert hedged.last_race["winner"] == "p1/test"
+    assert ("p0", "cancelled") in events and ("p0", "closed") in events
+    assert ("p1", "closed") in events
+
+
+def test_simultaneous_finish_prefers_primary_and_closes_other_stream():
+    events = []
+    hedged = HedgedProvider(_providers(events, 0, 0))
+    assert _stream(hedged) == "p0 done"
+    # 함께 끝난 후보의 스트림도 닫힘
+    assert sorted(events) == [("p0", "closed"), ("p1", "closed")]
+
+    events.clear()
+    assert asyncio.run(hedged.chat([]))["content"] == "p0"
+
+
+def test_hedge_delay_skips_backup_when_primary_is_fast():
+    events = []
+    hedged = HedgedProvider(_providers(events, 0.01, 0.01), hedge_delay=0.5)
+    assert asyncio.run(hedged.chat([]))["content"] == "p0"
+    assert hedged.last_race["candidates"] == ["p0/test"]
+
+
+def test_failed_primary_falls_back_to_next_candidate():
+    events = []
+    primary, backup = _providers(events, 0, 0.01)
+
+    async def failing(messages, options=None):
+        raise ConnectionError("down")
+
+    primary.chat = failing
+    hedged = HedgedProvider([primary, backup], hedge_delay=5)
+    response = asyncio.run(hedged.chat([]))
+    assert response["content"] == "p1"
+    assert "p0/test" in response["metadata"]["race"]["errors"]
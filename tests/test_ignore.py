@@ -0,0 +1,99 @@
+"""gitignore 규칙 테스트 (부정, 경로 고정, 디렉터리 전용, ** 패턴, 중첩 규칙 파일)"""
+import pytest
+
+from nurexia.workspace.ignore import IgnoreFile, IgnoreRules, parse_rule
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("", None),
+    ("   ", None),
+    ("# comment", None),
+    ("/", None),
+    ("*.log", ("(?:.*/)?[^/]*\\.log", False, False)),
+    ("!keep.log", ("(?:.*/)?keep\\.log", True, False)),
+    ("build/", ("(?:.*/)?build", False, True)),
+    ("/dist", ("dist", False, False)),
+    ("docs/*.md", ("docs/[^/]*\\.md", False, False)),
+    ("\\#notes", ("(?:.*/)?\\#notes", False, False)),
+    ("\\!bang", ("(?:.*/)?!bang", False, False)),
+    ("trailing   ", ("(?:.*/)?trailing", False, False)),
+])
+def test_parse_rule(line, expected):
+    assert parse_rule(line) == expected
+
+
+# (규칙 파일 내용, 경로, 디렉터리 여부, 제외 여부)
+CASES = [
+    # 이름만 있는 패턴은 모든 깊이에서 일치
+    (["*.log"], "app.log", False, True),
+    (["*.log"], "src/deep/app.log", False, True),
+    (["*.log"], "app.log.txt", False, False),
+    (["?.txt"], "a.txt", False, True),
+    (["?.txt"], "ab.txt", False, False),
+    (["[ab].txt"], "b.txt", False, True),
+    (["[!ab].txt"], "b.txt", False, False),
+    (["[!ab].txt"], "c.txt", False, True),
+    # 앞이나 중간의 '/'는 규칙 파일 위치 기준으로 고정
+    (["/dist"], "dist", True, True),
+    (["/dist"], "src/dist", True, False),
+    (["docs/*.md"], "docs/readme.md", False, True),
+    (["docs/*.md"], "docs/api/readme.md", False, False),
+    (["docs/*.md"], "src/docs/readme.md", False, False),
+    # 끝의 '/'는 디렉터리에만 일치
+    (["build/"], "build", True, True),
+    (["build/"], "build", False, False),
+    (["build/"], "src/build", True, True),
+    # ** 패턴
+    (["**/cache"], "cache", True, True),
+    (["**/cache"], "a/b/cache", True, True),
+    (["logs/**"], "logs/a/b.txt", False, True),
+    (["logs/**"], "logs", True, False),
+    (["a/**/b"], "a/b", False, True),
+    (["a/**/b"], "a/x/y/b", False, True),
+    (["a/**/b"], "x/a/b", False, False),
+    # 부정 규칙은 마지막으로 일치한 규칙이 우선
+    (["*.log", "!keep.log"], "keep.log", False, False),
+    (["*.log", "!keep.log"], "other.log", False, True),
+    (["!keep.log", "*.log"], "keep.log", False, True),
+    (["build/", "!build/"], "build", True, False),
+    # 이스케이프
+    (["\\#notes"], "#notes", False, True),
+    (["\\!bang"], "!bang", False, True),
+    (["trailing\\ "], "trailing ", False, True),
+]
+
+
+@pytest.mark.parametrize("lines, path, is_dir, ignored", CASES)
+def test_ignore_file_match(lines, path, is_dir, ignored):
+    assert bool(IgnoreFile("", lines).match(path, is_dir)) is ignored
+
+
+@pytest.mark.parametrize("lines, path, is_dir, ignored", [case for case in CASES if not any(
+    line.startswith("!") for line in case[0])])
+def test_combined_pattern_matches_rule_by_rule(lines, path, is_dir, ignored):
+    # 부정 규칙이 없으면 합친 정규식을 사용하므로, 일치하지 않는 부정 규칙을 더해 규칙별 판정과 비교
+    assert IgnoreFile("", lines)._combined is not None
+    assert bool(IgnoreFile("", lines + ["!never-matches"]).match(path, is_dir)) is ignored
+
+
+def test_nested_files_take_precedence(tmp_path):
+    (tmp_path / ".gitignore").write_text("*.log\nsecret/\n")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / ".gitignore").write_text("!keep.log\n/local.txt\n")
+    (tmp_path / ".git" / "info").mkdir(parents=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("*.tmp\n")
+
+    root = IgnoreRules(str(tmp_path))
+    sub = root.child("sub")
+    assert root.child("other") is root
+
+    assert root.is_ignored("keep.log")
+    assert not sub.is_ignored("sub/keep.log")
+    assert sub.is_ignored("sub/other.log")
+    # 하위 규칙 파일의 고정 경로는 그 디렉터리 기준
+    assert sub.is_ignored("sub/local.txt")
+    assert not sub.is_ignored("sub/nested/local.txt")
+    assert not root.is_ignored("local.txt")
+    assert sub.is_ignored("sub/secret", is_dir=True)
+    assert root.is_ignored("scratch.tmp")
+    assert root.is_ignored(".git", is_dir=True) and root.is_ignored("sub/.hg", is_dir=True)
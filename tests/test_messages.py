@@ -0,0 +1,135 @@
+"""압축 메시지 저장소 테스트 (슬라이스 뷰, 되돌리기, 복사, 변환 캐시)"""
+import copy
+
+import pytest
+
+from nurexia.graph.messages import MessageStore, MessageView
+from nurexia.graph.state import GraphState, MessageRole
+
+
+def _store(*contents):
+    store = MessageStore()
+    for i, content in enumerate(contents):
+        store.add(MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT, content)
+    return store
+
+
+def _contents(messages):
+    return [message.content for message in messages]
+
+
+class _Counter:
+    """변환 호출을 기록하는 변환 함수"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, role, content):
+        self.calls.append(content)
+        return (role.value, content.upper())
+
+
+def test_slices_are_views_that_ignore_later_appends():
+    store = _store("a", "b", "c", "d")
+    view = store[1:3]
+    assert isinstance(view, MessageView)
+    assert _contents(view) == ["b", "c"]
+    assert view.role_at(0) == MessageRole.ASSISTANT
+    assert view.content_at(-1) == "c"
+    assert _contents(view[1:]) == ["c"]
+
+    store.add(MessageRole.USER, "e")
+    assert len(view) == 2
+    assert _contents(store[-2:]) == ["d", "e"]
+    # 간격이 있는 슬라이스는 목록
+    assert _contents(store[::2]) == ["a", "c", "e"]
+    with pytest.raises(IndexError):
+        view.content_at(2)
+
+
+def test_non_ascii_content_and_metadata_round_trip():
+    store = MessageStore()
+    store.add(MessageRole.USER, "안녕하세요 👋", {"lang": "ko"})
+    store.add(MessageRole.ASSISTANT, "")
+    assert store.content_at(0) == "안녕하세요 👋"
+    assert store.content_at(1) == ""
+    assert store.metadata_at(0) == {"lang": "ko"} and store.metadata_at(1) == {}
+    # 반환된 스냅샷을 수정해도 저장소는 그대로
+    store[0].metadata["lang"] = "en"
+    assert store.metadata_at(0) == {"lang": "ko"}
+
+
+def test_truncate_removes_tail_including_metadata_and_tokens():
+    store = _store("a", "b", "c")
+    store.add(MessageRole.USER, "d", {"keep": False})
+    tokens = store.token_counts()
+
+    store.truncate(2)
+    assert _contents(store) == ["a", "b"]
+    assert store.token_counts() == tokens[:2]
+    store.add(MessageRole.USER, "x")
+    assert store.metadata_at(2) == {}
+    assert _contents(store) == ["a", "b", "x"]
+
+    store.truncate(10)
+    assert len(store) == 3
+    store.clear()
+    assert len(store) == 0 and store.nbytes == 8
+
+
+def test_copy_is_independent():
+    store = _store("a", "b")
+    store.add(MessageRole.USER, "c", {"n": 1})
+    clone = copy.deepcopy(store)
+    assert clone == store
+
+    clone.add(MessageRole.ASSISTANT, "only in clone")
+    clone.truncate(1)
+    store.metadata_at(2)["n"] = 2
+    assert _contents(store) == ["a", "b", "c"]
+    assert clone != store and _contents(clone) == ["a"]
+
+
+def test_conversion_cache_converts_each_message_once():
+    store = _store("a", "b")
+    convert = _Counter()
+    assert store.converted("fmt", convert) == [("user", "A"), ("assistant", "B")]
+    store.add(MessageRole.USER, "c")
+    assert store.converted("fmt", convert)[-1] == ("user", "C")
+    assert convert.calls == ["a", "b", "c"]
+
+    # 뷰는 저장소 캐시를 공유
+    assert store[1:].converted("fmt", convert) == [("assistant", "B"), ("user", "C")]
+    assert convert.calls == ["a", "b", "c"]
+
+    # 형식마다 별도 캐시
+    other = _Counter()
+    store.converted("other", other)
+    assert other.calls == ["a", "b", "c"]
+
+
+def test_conversion_cache_is_invalidated_by_truncate():
+    store = _store("a", "b", "c")
+    convert = _Counter()
+    store.converted("fmt", convert)
+
+    store.truncate(1)
+    store.add(MessageRole.ASSISTANT, "replaced")
+    assert store.converted("fmt", convert) == [("user", "A"), ("assistant", "REPLACED")]
+    assert convert.calls == ["a", "b", "c", "replaced"]
+
+    # 복사본은 캐시를 이어받되 이후 변경은 공유하지 않음
+    clone = store.copy()
+    clone.truncate(1)
+    clone.add(MessageRole.ASSISTANT, "clone")
+    assert clone.converted("fmt", convert)[-1] == ("assistant", "CLONE")
+    assert store.converted("fmt", convert)[-1] == ("assistant", "REPLACED")
+
+
+def test_graph_state_accepts_lists_and_serializes_messages():
+    state = GraphState(messages=[{"role": "user", "content": "hi"}])
+    assert isinstance(state.messages, MessageStore)
+    dumped = state.model_dump()["messages"]
+    assert dumped == [{"role": "user", "content": "hi", "metadata": {}}]
+    with pytest.raises(ValueError):
+        GraphState(messages="not a list")
@@ -0,0 +1,179 @@
+"""요청 스케줄러 테스트 (속도 제한, 재시도 판단, 호출 마감, 스트림 대기 시간)"""
+import asyncio
+import gc
+import time
+
+import pytest
+
+from nurexia.providers.scheduler import RequestScheduler, TokenBucket, is_retryable
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"status_code": status_code, "headers": headers or {}})()
+
+
+class RateLimitError(Exception):
+    """상태 코드 없이 이름으로 판단되는 SDK 예외"""
+
+
+def test_token_bucket_refills_over_time():
+    bucket = TokenBucket(per_minute=60, capacity=2)
+    assert bucket._reserve(2) == 0.0
+    # 비어 있으면 1초에 1개씩 보충되므로 다음 토큰까지 약 1초 대기
+    assert bucket._reserve(1) == pytest.approx(1.0, abs=0.05)
+
+    # 충분한 시간이 지나면 용량까지만 보충
+    bucket = TokenBucket(per_minute=60, capacity=2)
+    bucket._tokens = 0
+    bucket._updated = time.monotonic() - 100
+    assert bucket._reserve(2) == 0.0
+    assert bucket._reserve(1) > 0
+
+
+def test_token_bucket_without_limit_never_waits():
+    bucket = TokenBucket(per_minute=0)
+    assert bucket.unlimited
+    started = time.monotonic()
+    asyncio.run(bucket.acquire(10 ** 6))
+    assert time.monotonic() - started < 0.1
+
+
+@pytest.mark.parametrize("error, expected", [
+    (asyncio.TimeoutError(), True),
+    (ConnectionError(), True),
+    (_StatusError(429), True),
+    (_StatusError(503), True),
+    (_StatusError(400), False),
+    (_StatusError(401), False),
+    (RateLimitError(), True),
+    (ValueError("bad input"), False),
+])
+def test_is_retryable(error, expected):
+    assert is_retryable(error) is expected
+
+
+def test_backoff_prefers_retry_after_capped_at_max():
+    scheduler = RequestScheduler(backoff_base=0.5, backoff_max=3)
+    assert scheduler.backoff_delay(0, _StatusError(429, {"retry-after": "2"})) == 2
+    assert scheduler.backoff_delay(0, _StatusError(429, {"retry-after": "60"})) == 3
+    for attempt in range(5):
+        assert 0 <= scheduler.backoff_delay(attempt) <= min(3, 0.5 * 2 ** attempt)
+
+
+def test_run_retries_retryable_errors_only():
+    scheduler = RequestScheduler(max_retries=3, backoff_base=0.001)
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError()
+        return "ok"
+
+    assert asyncio.run(scheduler.run(flaky)) == "ok"
+    assert len(calls) == 3
+
+    calls.clear()
+
+    async def invalid():
+        calls.append(1)
+        raise _StatusError(400)
+
+    with pytest.raises(_StatusError):
+        asyncio.run(scheduler.run(invalid))
+    assert len(calls) == 1
+
+
+def test_run_applies_one_deadline_across_retries():
+    scheduler = RequestScheduler(timeout=0.2, max_retries=3, backoff_base=0.001)
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(1)
+
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scheduler.run(slow))
+    assert time.monotonic() - started < 0.5
+    assert len(calls) == 1
+
+
+def test_no_retry_when_backoff_passes_deadline():
+    scheduler = RequestScheduler(max_retries=3, backoff_base=10, backoff_max=10)
+    error = _StatusError(429, {"retry-after": "5"})
+    assert scheduler._retry_delay(0, error, time.monotonic() + 1) is None
+    assert scheduler._retry_delay(0, error, time.monotonic() + 60) == 5
+    assert scheduler._retry_delay(3, error, None) is None
+
+
+def _collect(scheduler, call):
+    async def consume():
+        return [chunk async for chunk in scheduler.stream(call)]
+    return asyncio.run(consume())
+
+
+def test_stream_deadline_covers_first_chunk_only():
+    scheduler = RequestScheduler(timeout=0.15, idle_timeout=0.2)
+
+    async def long_stream():
+        for i in range(5):
+            await asyncio.sleep(0.1)
+            yield i
+
+    # 전체 시간(0.5초)은 제한 시간보다 길지만 청크 간격이 짧으므로 끝까지 받음
+    assert _collect(scheduler, long_stream) == [0, 1, 2, 3, 4]
+
+
+def test_stream_idle_timeout_between_chunks():
+    scheduler = RequestScheduler(timeout=1, idle_timeout=0.1, max_retries=3)
+    received = []
+
+    async def stalled():
+        yield 1
+        await asyncio.sleep(1)
+        yield 2
+
+    async def consume():
+        async for chunk in scheduler.stream(stalled):
+            received.append(chunk)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(consume())
+    # 첫 청크 이후의 오류는 재시도하지 않음
+    assert received == [1]
+
+
+def test_stream_retries_before_first_chunk():
+    scheduler = RequestScheduler(max_retries=2, backoff_base=0.001)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError()
+        yield "ok"
+
+    assert _collect(scheduler, flaky) == ["ok"]
+    assert len(attempts) == 2
+
+
+def test_semaphores_are_per_loop_and_released():
+    scheduler = RequestScheduler(max_in_flight=1)
+
+    async def call():
+        await asyncio.sleep(0.01)
+        return 1
+
+    async def burst():
+        # 동시 실행 상한 때문에 세마포어에서 대기가 발생 (루프에 묶임)
+        return await asyncio.gather(*(scheduler.run(call) for _ in range(3)))
+
+    for _ in range(3):
+        assert asyncio.run(burst()) == [1, 1, 1]
+    gc.collect()
+    # 닫힌 루프의 세마포어는 다음 루프에서 정리되어 하나만 남음
+    assert len(scheduler._semaphores) == 1
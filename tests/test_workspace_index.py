@@ -0,0 +1,41 @@
+"""작업 디렉터리 색인 테스트 (최초 색인은 백그라운드, 이후 증분 갱신)"""
+from nurexia.workspace import retrieval
+from nurexia.workspace.index import WorkspaceIndex
+
+
+def _make_workspace(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    (root / "app.py").write_text("def parse_config(path):\n    return load_settings(path)\n")
+    (root / "util.py").write_text("def unrelated():\n    return 42\n")
+    return root
+
+
+def test_first_search_builds_in_background(tmp_path, monkeypatch):
+    root = _make_workspace(tmp_path)
+    index = WorkspaceIndex(str(root), path=str(tmp_path / "index.sqlite3"))
+    monkeypatch.setattr(retrieval, "get_workspace_index", lambda _: index)
+    assert not index.is_built
+
+    # 색인이 없으면 요청을 막지 않고 빈 결과를 반환하며 색인은 백그라운드에서 시작
+    assert retrieval.search_workspace(str(root), "parse_config", limit=5) == []
+    index.build_in_background().join(10)
+    assert index.is_built and index.build_error is None
+
+    results = retrieval.search_workspace(str(root), "parse_config", limit=5)
+    assert [snippet["path"] for snippet in results] == ["app.py"]
+
+
+def test_update_is_incremental(tmp_path):
+    root = _make_workspace(tmp_path)
+    index = WorkspaceIndex(str(root), path=str(tmp_path / "index.sqlite3"))
+    assert index.update() == {"files": 2, "indexed": 2, "removed": 0}
+    assert index.update() == {"files": 2, "indexed": 0, "removed": 0}
+
+    (root / "util.py").unlink()
+    (root / "new.py").write_text("def fresh_symbol():\n    pass\n")
+    assert index.update() == {"files": 2, "indexed": 1, "removed": 1}
+    assert [snippet["path"] for snippet in index.search("fresh_symbol")] == ["new.py"]
+
+    index.clear()
+    assert not index.is_built